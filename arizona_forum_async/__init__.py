@@ -1,3 +1,10 @@
+from .antibot import *
 from .api import *
+from .cache import *
+from .connection import *
 from .consts import *
-from .exceptions import *
\ No newline at end of file
+from .exceptions import *
+from .limiter import *
+from .pool import *
+from .proxy import *
+from .retry import *
\ No newline at end of file
@@ -0,0 +1,187 @@
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+__all__ = ['AntibotStore']
+
+
+class AntibotStore:
+    def __init__(self, path: str = None, ttl: float = 86400) -> None:
+        """
+        Общее хранилище cookie анти-бота по паре (User Agent, прокси).
+
+        Cookie, решенный одной сессией, получают все остальные сессии с тем же User Agent и прокси,
+        поэтому проверка решается заново, только когда форум отклонил сохраненный cookie.
+        Один объект передается в несколько ArizonaAPI. С path cookie хранятся еще и в файле SQLite,
+        который могут делить несколько процессов, и переживают перезапуск. Вся работа с файлом идет в отдельном потоке,
+        event loop не блокируется, даже пока файл занят другим процессом. Решение проверки процессы согласуют
+        через блокировку записи в файле: пока один процесс решает, остальные ждут и получают его cookie.
+
+        Args:
+            path (str): Путь до файла базы SQLite. По умолчанию cookie хранятся только в памяти (необяз.)
+            ttl (float): Время жизни cookie в секундах (необяз.)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        """**Сколько раз выдан сохраненный cookie**"""
+        self.solves = 0
+        """**Сколько раз проверка решалась заново**"""
+        self._data: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._file_lock: 'asyncio.Lock | None' = None
+
+        self._db = None
+        self._executor = None
+        if path is not None:
+            # Один поток на файл: запросы к базе выполняются строго по очереди
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arizona-antibot')
+            self._db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS antibot (user_agent TEXT NOT NULL, proxy TEXT NOT NULL, solved_at REAL NOT NULL, cookie TEXT NOT NULL, PRIMARY KEY (user_agent, proxy))')
+
+    async def _run(self, function: Callable, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _select(self, key: Tuple[str, str], lock: bool = False) -> Optional[Tuple[float, str]]:
+        if lock:
+            # Блокировка записи держится до _write или _release: другие процессы ждут ее в своем потоке
+            self._db.execute('BEGIN IMMEDIATE')
+        return self._db.execute('SELECT solved_at, cookie FROM antibot WHERE user_agent = ? AND proxy = ?', key).fetchone()
+
+    def _write(self, query: str, args: tuple, locked: bool = False) -> None:
+        self._db.execute(query, args)
+        if locked:
+            self._db.execute('COMMIT')
+
+    def _release(self) -> None:
+        if self._db.in_transaction:
+            self._db.execute('ROLLBACK')
+
+    @property
+    def _file(self) -> asyncio.Lock:
+        """Очередь к файлу на время транзакции refresh: на одном соединении может быть только одна транзакция,
+        а запись, сделанная посреди нее, откатилась бы вместе с ней"""
+        if self._file_lock is None:
+            self._file_lock = asyncio.Lock()
+        return self._file_lock
+
+    def _fresh(self, item: Optional[Tuple[float, str]]) -> Optional[Tuple[float, str]]:
+        if item is None or item[0] + self.ttl < time.time():
+            return None
+        return item
+
+    async def get(self, user_agent: str, proxy: str = '') -> Optional[str]:
+        """Получить сохраненный cookie
+
+        Attributes:
+            user_agent (str): User Agent сессии
+            proxy (str): Адрес прокси. Пустая строка - без прокси (необяз.)
+
+        Returns:
+            Строка вида 'имя=значение' или None, если cookie нет или он устарел
+        """
+        key = (user_agent, proxy)
+        item = self._data.get(key)
+        if item is None and self._db is not None:
+            item = await self._run(self._select, key)
+            if item is not None:
+                self._data[key] = item
+        item = self._fresh(item)
+        if item is None:
+            return None
+        self.hits += 1
+        return item[1]
+
+    async def set(self, user_agent: str, proxy: str, cookie: str) -> None:
+        """Сохранить cookie
+
+        Attributes:
+            user_agent (str): User Agent сессии
+            proxy (str): Адрес прокси. Пустая строка - без прокси
+            cookie (str): Строка вида 'имя=значение'
+        """
+        item = self._data[(user_agent, proxy)] = (time.time(), cookie)
+        if self._db is not None:
+            async with self._file:
+                await self._run(self._write, 'INSERT OR REPLACE INTO antibot (user_agent, proxy, solved_at, cookie) VALUES (?, ?, ?, ?)', (user_agent, proxy, *item))
+
+    async def invalidate(self, user_agent: str = None, proxy: str = '') -> None:
+        """Удалить cookie
+
+        Attributes:
+            user_agent (str): User Agent сессии. Если не указан, хранилище очищается полностью (необяз.)
+            proxy (str): Адрес прокси (необяз.)
+        """
+        if user_agent is None:
+            self._data.clear()
+            query, args = 'DELETE FROM antibot', ()
+        else:
+            self._data.pop((user_agent, proxy), None)
+            query, args = 'DELETE FROM antibot WHERE user_agent = ? AND proxy = ?', (user_agent, proxy)
+        if self._db is not None:
+            async with self._file:
+                await self._run(self._write, query, args)
+
+    async def refresh(self, user_agent: str, proxy: str, rejected: Optional[str], solve: Callable[[], Awaitable[str]]) -> str:
+        """Получить новый cookie взамен отклоненного форумом
+
+        Одновременные вызовы для одной пары решают проверку один раз. Если другая сессия или процесс
+        уже сохранили cookie, отличный от отклоненного, решение не нужно - возвращается он. С файлом базы
+        проверка перечитывается под блокировкой записи (BEGIN IMMEDIATE), которая держится до сохранения
+        нового cookie, поэтому процессы, получившие одну и ту же проверку, тоже решают ее один раз.
+
+        Attributes:
+            user_agent (str): User Agent сессии
+            proxy (str): Адрес прокси. Пустая строка - без прокси
+            rejected (str): Cookie, с которым пришла проверка, или None
+            solve (Callable): Корутина-функция, решающая проверку и возвращающая 'имя=значение'
+
+        Returns:
+            Строка вида 'имя=значение'
+        """
+        key = (user_agent, proxy)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            if self._db is None:
+                return await self._refresh(key, rejected, solve)
+            async with self._file:
+                try:
+                    return await self._refresh(key, rejected, solve)
+                finally:
+                    await self._run(self._release)
+
+    async def _refresh(self, key: Tuple[str, str], rejected: Optional[str], solve: Callable[[], Awaitable[str]]) -> str:
+        if self._db is None:
+            item = self._fresh(self._data.get(key))
+        else:
+            item = self._fresh(await self._run(self._select, key, True))
+        if item is not None and item[1] != rejected:
+            self._data[key] = item
+            self.hits += 1
+            return item[1]
+
+        cookie = await solve()
+        self.solves += 1
+        item = self._data[key] = (time.time(), cookie)
+        if self._db is not None:
+            await self._run(self._write, 'INSERT OR REPLACE INTO antibot (user_agent, proxy, solved_at, cookie) VALUES (?, ?, ?, ?)', (*key, *item), True)
+        return cookie
+
+    async def close(self) -> None:
+        """Закрыть файл базы"""
+        if self._db is not None:
+            await self._run(self._db.close)
+            self._db = None
+            self._executor.shutdown(wait=False)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Счетчики хранилища: размер, выданные cookie, решения проверки"""
+        return {'size': len(self._data), 'hits': self.hits, 'solves': self.solves}
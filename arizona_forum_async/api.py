@@ -1,16 +1,28 @@
+import asyncio
+import os
+import time
+import warnings
 import aiohttp
-from bs4 import BeautifulSoup
-from re import compile, findall
+from contextlib import asynccontextmanager
+from concurrent.futures import Executor
 import re
 from html import unescape
-from typing import List, Dict, Optional, Union, Tuple, Iterable
-from collections import defaultdict
+from typing import List, Dict, Optional, Union, Tuple, Iterable, AsyncIterator, Awaitable, Callable, Any
+from collections import defaultdict, deque
 import datetime
-
-from arizona_forum_async.consts import MAIN_URL, ROLE_COLOR, MAX_POSTS_PER_PAGE
-from arizona_forum_async.bypass_antibot import bypass_async
-
-from arizona_forum_async.exceptions import IncorrectLoginData, ThisIsYouError
+from urllib.parse import urlsplit
+
+from arizona_forum_async.consts import MAIN_URL, MAX_POSTS_PER_PAGE
+from arizona_forum_async.antibot import AntibotStore
+from arizona_forum_async.bypass_antibot import ANTIBOT_COOKIE, SOLVER_ENGINES, is_challenge, solve_challenge_async
+from arizona_forum_async.connection import ConnectionConfig
+from arizona_forum_async.proxy import NETWORK_ERRORS, ProxyPool
+from arizona_forum_async.limiter import RateLimiter
+from arizona_forum_async.retry import RetryPolicy
+from arizona_forum_async.cache import BaseCache
+from arizona_forum_async.parsers import PARSER_BACKENDS, get_parser
+
+from arizona_forum_async.exceptions import ArizonaException, IncorrectLoginData, ThisIsYouError
 from arizona_forum_async.models.other import Statistic
 from arizona_forum_async.models.post_object import Post, ProfilePost
 from arizona_forum_async.models.member_object import Member, CurrentMember
@@ -18,83 +30,409 @@ from arizona_forum_async.models.thread_object import Thread
 from arizona_forum_async.models.category_object import Category
 
 
+# Модели доступны из пакета через api с первых версий, поэтому перечислены здесь же
+__all__ = ['ArizonaAPI', 'Category', 'CurrentMember', 'Member', 'Post', 'ProfilePost', 'Statistic', 'Thread']
+
+_CSRF_JSON = re.compile(rb'"csrf"\s*:\s*"([^"]+)"')
+_CSRF_HTML = re.compile(rb'<html\b[^>]*?\bdata-csrf="([^"]+)"')
+# Полная страница форума для гостя: cookie аккаунта больше не действуют
+_LOGGED_OUT = b'data-logged-in="false"'
+# Форма входа и шаблон login, которые форум отдает гостю вместо ответа (в JSON кавычки и слеши экранированы)
+_LOGIN_REQUIRED = re.compile(rb'\\?/login\\?/login|data-template=\\?"login\\?"|"template"\s*:\s*"login"')
+
+
+def _find_token(body: bytes) -> 'str | None':
+    """CSRF токен из ответа форума: ключ csrf в JSON или атрибут data-csrf тега html"""
+    match = _CSRF_JSON.search(body) or _CSRF_HTML.search(body)
+    return match.group(1).decode('ascii', 'ignore') if match else None
+
+
+def _is_security_error(response: aiohttp.ClientResponse, body: bytes) -> bool:
+    """Форум отклонил запрос из-за устаревшего CSRF токена"""
+    if response.status not in (400, 403) and b'"status":"error"' not in body:
+        return False
+    text = body.decode('utf-8', 'ignore').lower()
+    return 'security error' in text or 'ошибка безопасности' in text
+
+
+def _is_logged_out(response: aiohttp.ClientResponse, body: bytes) -> bool:
+    """Форум ответил как гостю: страница с data-logged-in="false" или ошибка 401/403 (в том числе JSON) с требованием войти.
+    Ошибки доступа без требования войти (например, закрытый профиль) сессию не сбрасывают"""
+    if _LOGGED_OUT in body:
+        return True
+    if response.status not in (401, 403) and b'"status":"error"' not in body:
+        return False
+    text = body.decode('utf-8', 'ignore').lower()
+    return bool(_LOGIN_REQUIRED.search(body)) or 'must be logged-in' in text or 'вы должны авторизоваться' in text
+
+
+def _with_token(kwargs: dict, token: str) -> 'dict | None':
+    """Аргументы запроса с другим _xfToken. None, если токен в запросе не передавался"""
+    for field in ('data', 'params'):
+        value = kwargs.get(field)
+        if isinstance(value, dict) and '_xfToken' in value:
+            return {**kwargs, field: {**value, '_xfToken': token}}
+    return None
+
+
+def _multipart(kwargs: dict) -> dict:
+    """Аргументы запроса с формой multipart/form-data из data и files = {поле: (имя файла, байты)}.
+    Форма собирается заново для каждой попытки: FormData нельзя отправить дважды"""
+    kwargs = dict(kwargs)
+    form = aiohttp.FormData()
+    for name, (filename, content) in kwargs.pop('files').items():
+        form.add_field(name, content, filename=filename)
+    for name, value in kwargs.pop('data', {}).items():
+        form.add_field(name, str(value))
+    return {**kwargs, 'data': form}
+
+
+class _RequestContext:
+    """Запрос, который можно и дождаться через await, и открыть через async with"""
+
+    def __init__(self, coro) -> None:
+        self._coro = coro
+        self._response: aiohttp.ClientResponse = None
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        self._response = await self._coro
+        return self._response
+
+    async def __aexit__(self, *args) -> None:
+        self._response.release()
+
+
 class ArizonaAPI:
-    def __init__(self, user_agent: str, cookie: dict) -> None:
+    def __init__(self, user_agent: str, cookie: dict, connection: ConnectionConfig = None, connector: aiohttp.BaseConnector = None, limiter: RateLimiter = None, retry: RetryPolicy = None, cache: BaseCache = None, parse_executor: Executor = None, parser: str = 'lxml', antibot_engine: str = 'native', antibot_store: AntibotStore = None, proxy_pool: ProxyPool = None, antibot_executor: Executor = None) -> None:
+        """
+        Args:
+            user_agent (str): User Agent браузера
+            cookie (dict): Cookie авторизованной сессии форума
+            connection (ConnectionConfig): Настройки пула соединений и таймаутов (необяз.)
+            connector (aiohttp.BaseConnector): Общий пул соединений для нескольких объектов ArizonaAPI. Не закрывается в close() (необяз.)
+            limiter (RateLimiter): Ограничитель частоты и параллельности запросов. Можно разделить между несколькими объектами. По умолчанию запросы не ограничиваются (необяз.)
+            retry (RetryPolicy): Политика повторов при временных сбоях сети и ответах 429/5xx (необяз.)
+            cache (BaseCache): Кэш объектов Member, Thread, Category и Post - MemoryCache или SQLiteCache. По умолчанию кэширование выключено (необяз.)
+            parse_executor (Executor): Пул (ProcessPoolExecutor или ThreadPoolExecutor) для разбора HTML страниц вне event loop. Не закрывается в close(). По умолчанию разбор идет в event loop (необяз.)
+            parser (str): Бэкенд разбора страниц: 'lxml', 'selectolax' (если установлен) или 'bs4'. Чего нет в выбранном бэкенде, разбирается через BeautifulSoup (необяз.)
+            antibot_engine (str): Решение проверки анти-бота: 'native' (встроенный AES) или 'js' (slowAES в dukpy, в отдельном процессе). По умолчанию 'native' (необяз.)
+            antibot_store (AntibotStore): Общее хранилище cookie анти-бота для сессий с тем же User Agent. Можно разделить между несколькими объектами (необяз.)
+            proxy_pool (ProxyPool): Пул прокси. Запросы распределяются между прокси, у каждого своя сессия и cookie анти-бота. Можно разделить между несколькими объектами (необяз.)
+            antibot_executor (Executor): Пул для решения проверки анти-бота, которым управляет вызывающий код. По умолчанию 'js' решается в общем процессе get_solver_executor(), 'native' - сразу в event loop (необяз.)
+        """
         self.user_agent = user_agent
         self.cookie_str = "; ".join([f"{k}={v}" for k, v in cookie.items()])
+        self.connection = connection or ConnectionConfig()
+        self._connector = connector
+        self._connector_owner = connector is None
+        self.limiter = limiter or RateLimiter()
+        self.retry = retry or RetryPolicy()
+        self.cache = cache
+        self.proxy_pool = proxy_pool
         self._session: aiohttp.ClientSession = None
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
         self._token: str = None
+        self.current_member_id: Optional[int] = None
+        """**ID текущего пользователя. Известен после connect()**"""
+        self.logged_in = False
+        """**Действуют ли cookie аккаунта. Становится False, если форум вернул страницу для гостя**"""
+        self._antibot_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._antibot_generation: Dict[str, int] = defaultdict(int)
+        self._token_lock = asyncio.Lock()
+        self._token_generation = 0
+        self.parse_executor = parse_executor
+        if parser not in PARSER_BACKENDS:
+            raise ValueError(f"Неизвестный бэкенд разбора '{parser}'. Доступны: {', '.join(PARSER_BACKENDS)}")
+        self.parser = parser
+        if antibot_engine not in SOLVER_ENGINES:
+            raise ValueError(f"Неизвестный способ решения анти-бота '{antibot_engine}'. Доступны: {', '.join(SOLVER_ENGINES)}")
+        self.antibot_engine = antibot_engine
+        self.antibot_store = antibot_store
+        self.antibot_executor = antibot_executor
+        self._inflight: Dict[tuple, asyncio.Future] = {}
     
-    async def connect(self, do_bypass: bool = True):
-        """Асинхронный метод для создания сессии, получения токена и обхода анти-бота."""
-        if self._session is None or self._session.closed:
-            cookies = {}
-            for item in self.cookie_str.split('; '):
-                name, value = item.strip().split('=', 1)
-                cookies[name] = value
-
-            if do_bypass:
-                bypass_cookie_str, _ = await bypass_async(self.user_agent)
-                name, value = bypass_cookie_str.split('=', 1)
-                cookies[name] = value
-
-            self._session = aiohttp.ClientSession(
-                headers={"user-agent": self.user_agent},
-                cookies=cookies
-            )
+    async def connect(self, do_bypass: bool = None, session_snapshot: Dict = None, snapshot_max_age: float = 3600) -> None:
+        """Асинхронный метод для создания сессии, получения токена и обхода анти-бота.
+
+        Вход проверяется одним запросом /account/: из того же ответа берутся CSRF токен и ID текущего пользователя.
+        Проверка анти-бота решается прямо на этом запросе, в той же сессии и том же пуле соединений.
 
+        Attributes:
+            do_bypass (bool): Устарел и ни на что не влияет: проверка анти-бота решается автоматически на первом запросе, где она появилась. Передача вызывает DeprecationWarning (необяз.)
+            session_snapshot (dict): Снимок сессии из export_session(). Если он свежий и сделан с тем же User Agent, сессия восстанавливается без запросов к форуму (необяз.)
+            snapshot_max_age (float): Максимальный возраст снимка в секундах. По умолчанию 3600 (необяз.)
+
+        Raises:
+            IncorrectLoginData: Cookie неверные или сессия истекла
+        """
+        if do_bypass is not None:
+            warnings.warn("Параметр do_bypass устарел и ни на что не влияет: проверка анти-бота решается автоматически.", DeprecationWarning, stacklevel=2)
+
+        if self._session is not None and not self._session.closed:
+            return
+
+        if self.proxy_pool is None and self._connector_owner and (self._connector is None or self._connector.closed):
+            self._connector = self.connection.create_connector()
+
+        if (session_snapshot and session_snapshot.get('user_agent') == self.user_agent
+                and time.time() - session_snapshot.get('saved_at', 0) < snapshot_max_age):
+            await self._open_sessions(session_snapshot['cookies'])
+            self._token = session_snapshot.get('token')
+            self.current_member_id = session_snapshot.get('user_id')
+            self.logged_in = True
+            return
+
+        cookies = {}
+        for item in self.cookie_str.split('; '):
+            name, value = item.strip().split('=', 1)
+            cookies[name] = value
+        await self._open_sessions(cookies)
+
+        try:
+            async with self._request('GET', f"{MAIN_URL}/account/") as response:
+                response.raise_for_status()
+                account = await self._parse('parse_account_page', await response.text())
+            if not account['logged_in']:
+                raise IncorrectLoginData("Неверные cookie или сессия истекла.")
+            self.current_member_id = account['user_id']
+            self.logged_in = True
+
+            # Токен уже взят из ответа /account/ в _fetch
+            if not self._token:
+                raise Exception("Не удалось получить CSRF токен.")
+
+        except IncorrectLoginData:
+            await self._close_sessions()
+            self._session = None
+            raise
+        except Exception as e:
+            await self._close_sessions()
+            self._session = None
+            raise Exception(f"Ошибка подключения или авторизации: {e}") from e
+
+    async def _open_sessions(self, cookies: Dict[str, str]) -> None:
+        """Создать сессию для каждого прокси пула (или одну без прокси). Cookie анти-бота берется из antibot_store для своего прокси"""
+        self._sessions = {}
+        for proxy in (self.proxy_pool.proxies if self.proxy_pool is not None else ['']):
+            session_cookies = dict(cookies)
+            stored = await self.antibot_store.get(self.user_agent, proxy) if self.antibot_store is not None else None
+            if stored:
+                name, value = stored.split('=', 1)
+                session_cookies[name] = value
+            self._sessions[proxy] = self._create_session(session_cookies, proxy)
+        self._session = next(iter(self._sessions.values()))
+
+    def _create_session(self, cookies: Dict[str, str], proxy: str = '') -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            headers={"user-agent": self.user_agent},
+            cookies=cookies,
+            connector=self.proxy_pool.connector(proxy) if proxy else self._connector,
+            connector_owner=self._connector_owner and not proxy,
+            timeout=self.connection.create_timeout()
+        )
+
+    async def _close_sessions(self) -> None:
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+
+    @asynccontextmanager
+    async def _route(self) -> AsyncIterator[str]:
+        """Прокси для запроса из пула ('' - без прокси)"""
+        if self.proxy_pool is None:
+            yield ''
+            return
+        async with self.proxy_pool.slot() as state:
+            yield state.url
+
+    def export_session(self) -> Dict:
+        """Снимок активной сессии для быстрого connect(session_snapshot=...) в другом процессе
+
+        Returns:
+            Словарь (dict), пригодный для JSON: cookie (включая cookie анти-бота), CSRF токен, ID текущего пользователя, User Agent и время снимка
+        """
+        if not self._session or self._session.closed:
+            raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        return {
+            'user_agent': self.user_agent,
+            'cookies': {cookie.key: cookie.value for cookie in self._session.cookie_jar},
+            'token': self._token,
+            'user_id': self.current_member_id,
+            'saved_at': time.time()
+        }
+
+    def _request(self, method: str, url: str, write: bool = None, **kwargs) -> _RequestContext:
+        """Выполнить запрос через общий планировщик. Тело ответа читается сразу, соединение возвращается в пул."""
+        return _RequestContext(self._send(method, url, write, **kwargs))
+
+    async def _send(self, method: str, url: str, write: bool = None, **kwargs) -> aiohttp.ClientResponse:
+        if method.upper() != 'GET' or set(kwargs) - {'params'}:
+            return await self._fetch(method, url, write, **kwargs)
+
+        # Одинаковые GET-запросы, которые уже выполняются, не отправляются повторно: все ждут один ответ
+        params = kwargs.get('params')
+        key = (url, tuple(sorted(params.items())) if isinstance(params, dict) else tuple(params or ()))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(method, url, write, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+        return await asyncio.shield(task)
+
+    async def _fetch(self, method: str, url: str, write: bool = None, **kwargs) -> aiohttp.ClientResponse:
+        if write is None:
+            write = method.upper() != 'GET'
+        host = urlsplit(url).hostname
+        attempt = 0
+        challenges = 0
+        token_refreshes = 0
+        while True:
+            token_generation = self._token_generation
             try:
-                async with self._session.get(f"{MAIN_URL}/account/") as response:
-                    response.raise_for_status()
-                    html_content_main = await response.text()
-                    soup_main = BeautifulSoup(html_content_main, 'lxml')
-                    html_tag = soup_main.find('html')
-                    if not html_tag or html_tag.get('data-logged-in') == "false":
-                        raise IncorrectLoginData("Неверные cookie или сессия истекла.")
+                async with self._route() as proxy, self.limiter.slot(host, write, proxy):
+                    generation = self._antibot_generation[proxy]
+                    started = time.monotonic()
+                    async with self._sessions[proxy].request(method, url, **(_multipart(kwargs) if 'files' in kwargs else kwargs)) as response:
+                        body = await response.read()
+                    if self.proxy_pool is not None:
+                        self.proxy_pool.record(self.proxy_pool.states[proxy], time.monotonic() - started, response.status != 429 and response.status < 500)
+            except NETWORK_ERRORS:
+                if not self.retry.can_retry(method, attempt):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
 
-                async with self._session.get(f"{MAIN_URL}/help/terms/") as response:
-                    response.raise_for_status()
-                    html_content = await response.text()
-                    soup = BeautifulSoup(html_content, 'lxml')
-                    self._token = soup.find('html')['data-csrf']
-                    if not self._token:
-                        raise Exception("Не удалось получить CSRF токен.")
-
-            except (aiohttp.ClientError, IncorrectLoginData, Exception) as e:
-                if self._session:
-                    await self._session.close()
-                self._session = None
-                raise Exception(f"Ошибка подключения или авторизации: {e}") from e
+            if self.retry.should_retry_response(method, attempt, response):
+                await asyncio.sleep(self.retry.delay(attempt, response))
+                attempt += 1
+                continue
+
+            # Запрос с истекшей cookie анти-бота до форума не дошел, поэтому его можно безопасно повторить
+            if challenges < 2 and is_challenge(body):
+                await self._refresh_antibot(proxy, generation, await response.text())
+                challenges += 1
+                continue
+
+            if _is_logged_out(response, body):
+                self.logged_in = False
+
+            token = _find_token(body)
+            if token and token != self._token:
+                self._token = token
+                self._token_generation += 1
+
+            # Устаревший токен: действие не выполнено, поэтому запрос можно повторить со свежим
+            if token_refreshes < 1 and _with_token(kwargs, '') is not None and _is_security_error(response, body):
+                await self._refresh_token(token_generation)
+                kwargs = _with_token(kwargs, self._token)
+                token_refreshes += 1
+                continue
+            return response
+
+    async def _refresh_antibot(self, proxy: str, generation: int, body: str) -> None:
+        """Обновить cookie анти-бота сессии прокси. Одновременные вызовы решают проверку только один раз."""
+        session = self._sessions[proxy]
+        async with self._antibot_locks[proxy]:
+            if generation != self._antibot_generation[proxy]:
+                return
+            solve = lambda: solve_challenge_async(body, self.antibot_engine, self.antibot_executor)
+            if self.antibot_store is None:
+                cookie = await solve()
+            else:
+                rejected = next((f"{item.key}={item.value}" for item in session.cookie_jar if item.key == ANTIBOT_COOKIE), None)
+                cookie = await self.antibot_store.refresh(self.user_agent, proxy, rejected, solve)
+            name, value = cookie.split('=', 1)
+            session.cookie_jar.update_cookies({name: value})
+            self._antibot_generation[proxy] += 1
+
+    async def _parse(self, name: str, *args) -> Any:
+        """Выполнить функцию разбора name из выбранного бэкенда в parse_executor, если он задан, иначе прямо в event loop"""
+        parser = get_parser(name, self.parser)
+        if self.parse_executor is None:
+            return parser(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.parse_executor, parser, *args)
+
+    async def _refresh_token(self, generation: int) -> None:
+        """Обновить CSRF токен. Одновременные вызовы загружают страницу только один раз."""
+        async with self._token_lock:
+            if generation != self._token_generation:
+                return
+            async with self._request('GET', f"{MAIN_URL}/help/terms/") as response:
+                response.raise_for_status()
+
+    async def _cache_get(self, kind: str, key: int):
+        if self.cache is None:
+            return None
+        return await self.cache.get(kind, key, self)
+
+    async def _cache_set(self, kind: str, key: int, value) -> None:
+        if self.cache is not None:
+            await self.cache.set(kind, key, value)
+
+    async def _cache_invalidate(self, kind: str, key: int) -> None:
+        if self.cache is not None:
+            await self.cache.invalidate(kind, key)
+
+    def _thread_reference(self, info: Dict) -> Thread:
+        """Облегченный объект Thread из данных, уже найденных на странице (ID, заголовок, префикс, статус)"""
+        thread_id = info['thread_id']
+        return Thread(self, thread_id, f"{MAIN_URL}/threads/{thread_id}/", None, None, None, info['title'], info['prefix'], None, None, None, None, None, None, None, None, None, info['is_closed'])
+
+    async def _iter_ordered(self, pages: Iterable[int], fetch: Callable[[int], Awaitable[Any]], concurrency: int) -> AsyncIterator[Tuple[int, Any]]:
+        """Загружать страницы через fetch(page), не более concurrency одновременно, и отдавать (page, результат) по порядку.
+        При выходе из цикла или aclose() незавершенные загрузки отменяются."""
+        pages = iter(pages)
+        window = deque()
+        try:
+            for page in pages:
+                window.append((page, asyncio.ensure_future(fetch(page))))
+                if len(window) >= max(1, concurrency):
+                    break
+            while window:
+                page, task = window[0]
+                result = await task
+                window.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    window.append((next_page, asyncio.ensure_future(fetch(next_page))))
+                yield page, result
+        finally:
+            for _, task in window:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in window), return_exceptions=True)
 
     async def close(self):
         """Асинхронный метод для закрытия сессии."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self.cache is not None:
+            await self.cache.flush()
+        await self._close_sessions()
     
     @property
     async def token(self) -> str:
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
         if not self._token:
-            async with self._session.get(f"{MAIN_URL}/help/terms/") as response:
-                response.raise_for_status()
-                html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'lxml')
-                self._token = soup.find('html')['data-csrf']
+            await self._refresh_token(self._token_generation)
+            if not self._token:
+                raise Exception("Не удалось получить CSRF токен.")
         return self._token
 
     async def get_current_member(self) -> CurrentMember:
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
         try:
-            async with self._session.get(f"{MAIN_URL}/account/") as response:
-                response.raise_for_status()
-                html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'lxml')
-                avatar_span = soup.find('span', {'class': 'avatar--xxs'})
-                if not avatar_span or not avatar_span.has_attr('data-user-id'):
+            user_id = self.current_member_id
+            if user_id is None:
+                async with self._request('GET', f"{MAIN_URL}/account/") as response:
+                    response.raise_for_status()
+                    account = await self._parse('parse_account_page', await response.text())
+                if account['user_id'] is None:
                     raise Exception("Не удалось найти ID текущего пользователя на странице аккаунта.")
-                user_id = int(avatar_span['data-user-id'])
+                user_id = self.current_member_id = account['user_id']
 
             member_info = await self.get_member(user_id)
             if not member_info:
@@ -113,26 +451,26 @@ class ArizonaAPI:
     async def get_category(self, category_id: int) -> 'Category | None':
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        cached = await self._cache_get('category', category_id)
+        if cached is not None:
+            return cached
         token = await self.token
         url = f"{MAIN_URL}/forums/{category_id}"
         params = {'_xfResponseType': 'json', '_xfToken': token}
         try:
-            async with self._session.get(url, params=params) as response:
+            async with self._request('GET', url, params=params) as response:
                 response.raise_for_status()
                 data = await response.json()
 
                 if data.get('status') == 'error':
                     return None
 
-                html_content = unescape(data['html']['content'])
-                soup = BeautifulSoup(html_content, 'lxml')
                 title = unescape(data['html']['title'])
-                try:
-                    pages_count = int(soup.find_all('li', {'class': 'pageNav-page'})[-1].text)
-                except (IndexError, AttributeError, ValueError):
-                    pages_count = 1
+                pages_count = await self._parse('parse_category_pages_count', unescape(data['html']['content']))
 
-                return Category(self, category_id, title, pages_count)
+                category = Category(self, category_id, title, pages_count)
+                await self._cache_set('category', category_id, category)
+                return category
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении категории {category_id}: {e}")
             return None
@@ -143,97 +481,102 @@ class ArizonaAPI:
     async def get_member(self, user_id: int) -> 'Member | None':
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        cached = await self._cache_get('member', user_id)
+        if cached is not None:
+            return cached
+        try:
+            return await self._load_member(user_id)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
+                return Member(self, user_id, None, None, None, None, [], 0, 0, 0, '#fff')
+            print(f"Ошибка сети при получении пользователя {user_id}: {e}")
+            return None
+        except aiohttp.ClientError as e:
+            print(f"Ошибка сети при получении пользователя {user_id}: {e}")
+            return None
+        except Exception as e:
+            print(f"Неожиданная ошибка при получении пользователя {user_id}: {e}")
+            return None
+
+    async def _load_member(self, user_id: int) -> 'Member | None':
+        """Загрузить пользователя с форума и сохранить в кэш. В отличие от get_member, кэш не проверяется, а ошибки не перехватываются"""
         token = await self.token
         url = f"{MAIN_URL}/members/{user_id}"
         params = {'_xfResponseType': 'json', '_xfToken': token}
-        try:
-            async with self._session.get(url, params=params) as response:
-                if response.status == 403:
-                    return Member(self, user_id, None, None, None, None, [], 0, 0, 0, '#fff')
-                response.raise_for_status()
-                data = await response.json()
-
-                if data.get('status') == 'error':
-                    return None
+        async with self._request('GET', url, params=params) as response:
+            if response.status == 403:
+                return Member(self, user_id, None, None, None, None, [], 0, 0, 0, '#fff')
+            response.raise_for_status()
+            data = await response.json()
 
-                html_content = unescape(data['html']['content'])
-                soup = BeautifulSoup(html_content, 'lxml')
-                username = unescape(data['html']['title'])
+        if data.get('status') == 'error':
+            return None
 
-                activity_tag = soup.find('dd', {'dir': 'auto'})
-                activity = activity_tag.get_text(strip=False).strip('\n') if activity_tag else None
+        info = await self._parse('parse_member', unescape(data['html']['content']), user_id)
+        member = Member(self, user_id, unescape(data['html']['title']), info['user_title'], info['avatar'], info['roles'], info['activity'], info['messages_count'], info['reactions_count'], info['trophies_count'], info['username_color'])
+        await self._cache_set('member', user_id, member)
+        return member
 
-                username_class = soup.find('span', class_='username')
-                username_color = '#fff'
-                if username_class:
-                    for style in ROLE_COLOR:
-                        if style in str(username_class):
-                            username_color = ROLE_COLOR[style]
-                            break
+    async def get_members(self, user_ids: Iterable[int], concurrency: int = 10) -> Dict[int, Union[Member, Exception]]:
+        """Получить несколько пользователей
 
-                roles = []
-                roles_container = soup.find('div', {'class': 'memberHeader-banners'})
-                if roles_container:
-                    banners = roles_container.find_all('em', class_='userBanner')
-                    for banner in banners:
-                        roles.append(banner.get_text(strip=True))
+        Повторяющиеся ID загружаются один раз, пользователи из кэша отдаются без запросов,
+        остальные загружаются параллельно, не более concurrency одновременно.
 
-                try:
-                    user_title_tag = soup.find('span', {'class': 'userTitle'})
-                    user_title = user_title_tag.text if user_title_tag else None
-                except AttributeError:
-                    user_title = None
+        Attributes:
+            user_ids (Iterable[int]): ID пользователей
+            concurrency (int): Максимум одновременных загрузок. По умолчанию 10 (необяз.)
 
-                try:
-                    avatar_tag = soup.find('a', {'class': 'avatar avatar--l'})
-                    avatar = MAIN_URL + avatar_tag['href'] if avatar_tag and avatar_tag.has_attr('href') else None
-                except TypeError:
-                    avatar = None
+        Returns:
+            Словарь (dict) {ID: Member}. Если пользователя получить не удалось, вместо Member будет исключение с причиной
+        """
+        if not self._session or self._session.closed:
+            raise Exception("Сессия не активна. Вызовите connect() сначала.")
 
-                messages_count = 0
-                reactions_count = 0
-                trophies_count = 0
+        user_ids = list(dict.fromkeys(int(user_id) for user_id in user_ids))
+        result: Dict[int, Union[Member, Exception]] = {}
+        to_fetch = []
+        for user_id in user_ids:
+            cached = await self._cache_get('member', user_id)
+            if cached is not None:
+                result[user_id] = cached
+            else:
+                to_fetch.append(user_id)
 
-                try:
-                    msg_tag = soup.find('a', {'href': f'/search/member?user_id={user_id}'})
-                    if msg_tag: messages_count = int(msg_tag.text.strip().replace(',', ''))
-                except (AttributeError, ValueError): pass
+        pending = iter(to_fetch)
 
+        async def worker():
+            for user_id in pending:
                 try:
-                    react_tag = soup.find('dl', {'class': 'pairs pairs--rows pairs--rows--centered'})
-                    if react_tag:
-                        dd_tag = react_tag.find('dd')
-                        if dd_tag: reactions_count = int(dd_tag.text.strip().replace(',', ''))
-                except (AttributeError, ValueError): pass
-
-                try:
-                    trophy_tag = soup.find('a', {'href': f'/members/{user_id}/trophies'})
-                    if trophy_tag: trophies_count = int(trophy_tag.text.strip().replace(',', ''))
-                except (AttributeError, ValueError): pass
+                    member = await self._load_member(user_id)
+                    result[user_id] = member if member is not None else ArizonaException(f"Форум вернул ошибку для пользователя {user_id}")
+                except Exception as e:
+                    result[user_id] = e
 
-                return Member(self, user_id, username, user_title, avatar, roles, activity, messages_count, reactions_count, trophies_count, username_color)
+        await asyncio.gather(*(worker() for _ in range(min(max(1, concurrency), len(to_fetch)))))
+        return {user_id: result[user_id] for user_id in user_ids}
 
-        except aiohttp.ClientResponseError as e:
-            if e.status == 403:
-                return Member(self, user_id, None, None, None, None, [], 0, 0, 0, '#fff')
-            print(f"Ошибка сети при получении пользователя {user_id}: {e}")
-            return None
-        except aiohttp.ClientError as e:
-            print(f"Ошибка сети при получении пользователя {user_id}: {e}")
-            return None
-        except Exception as e:
-            print(f"Неожиданная ошибка при получении пользователя {user_id}: {e}")
-            return None
+    async def get_thread(self, thread_id: int, shallow: bool = False) -> 'Thread | None':
+        """Получить тему
 
+        Attributes:
+            thread_id (int): ID темы
+            shallow (bool): Облегченный режим: только первая страница темы, без профиля создателя и последней страницы.
+                У создателя будут заполнены только ID и имя, а у многостраничной темы post_count, last_post_id и last_post_author будут None. По умолчанию False (необяз.)
 
-    async def get_thread(self, thread_id: int) -> 'Thread | None':
+        Returns:
+            Объект Thread или None в случае ошибки
+        """
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        cached = await self._cache_get('thread', thread_id)
+        if cached is not None:
+            return cached
         token = await self.token
         url = f"{MAIN_URL}/threads/{thread_id}/page-1"
         params = {'_xfResponseType': 'json', '_xfToken': token}
         try:
-            async with self._session.get(url, params=params) as response:
+            async with self._request('GET', url, params=params) as response:
                 response.raise_for_status()
                 data = await response.json()
 
@@ -244,130 +587,62 @@ class ArizonaAPI:
                     try:
                         redirect_path = data['redirect'].strip(MAIN_URL)
                         new_thread_id = int(redirect_path.split('/')[1].split('-')[-1])
-                        return await self.get_thread(new_thread_id)
+                        return await self.get_thread(new_thread_id, shallow)
                     except (IndexError, ValueError):
                         print(f"Не удалось извлечь thread_id из редиректа: {data['redirect']}")
                         return None
 
-                html_content = unescape(data['html']['content'])
-                content_h1_html = unescape(data['html']['h1'])
-                content_soup = BeautifulSoup(html_content, 'lxml')
-                content_h1_soup = BeautifulSoup(content_h1_html, 'lxml')
+                page = await self._parse('parse_thread_page', unescape(data['html']['content']), unescape(data['html']['h1']))
+
+                creator_id = page['creator_id']
+                if creator_id is None:
+                    print(f"Не удалось найти информацию о создателе для темы {thread_id}")
+                    return None
 
                 creator = None
-                creator_tag = content_soup.find('a', {'class': 'username'})
-                if creator_tag and creator_tag.has_attr('data-user-id'):
-                    creator_id = int(creator_tag['data-user-id'])
+                if not shallow:
                     try:
                         creator = await self.get_member(creator_id)
                     except Exception as e:
                         print(f"Ошибка получения создателя ({creator_id}) для темы {thread_id}: {e}")
-                    if not creator:
-                        creator = Member(self, creator_id, creator_tag.text, None, None, None, None, None, None, None, None)
-                else:
-                    print(f"Не удалось найти информацию о создателе для темы {thread_id}")
-                    return None
-
-
-                create_date_tag = content_soup.find('time')
-                create_date = 0
-                if create_date_tag and create_date_tag.has_attr('title'):
-                    title_value = create_date_tag['title']
-                    if title_value:
-                        create_date = str(title_value)
-                    else:
-                        create_date = 0
-                
-                create_date_timestamp = 0
-                if create_date_tag and create_date_tag.has_attr('data-timestamp'):
-                    data_timestamp_value = create_date_tag['data-timestamp']
-                    if data_timestamp_value:
-                        create_date_timestamp = float(data_timestamp_value)
-                    else:
-                        create_date_timestamp = 0
-
-                prefix_tag = content_h1_soup.find('span', {'class': 'label'})
-                if prefix_tag:
-                    prefix = prefix_tag.text
-                    title = content_h1_soup.text.strip().replace(prefix, "").strip()
-                else:
-                    prefix = ""
-                    title = content_h1_soup.text.strip()
-                                
-                thread_html_content_tag = content_soup.find('div', {'class': 'bbWrapper'})
-                thread_html_content = str(thread_html_content_tag) if thread_html_content_tag else ""
-                thread_content = thread_html_content_tag.text if thread_html_content_tag else ""
+                if not creator:
+                    creator = Member(self, creator_id, page['creator_name'], None, None, None, None, None, None, None, None)
 
-                try:
-                    pages_count = int(content_soup.find_all('li', {'class': 'pageNav-page'})[-1].text)
-                except (IndexError, AttributeError, ValueError):
-                    pages_count = 1
+                pages_count = page['pages_count']
+                messages = page['messages']
 
-                messages_tag = content_soup.find_all('article', {'class': 'message'})
-                
-                first_admpost_author = None
-                first_admpost_id = 0
+                post_count = 0
                 last_post_author = None
                 last_post_id = 0
-                
-                if messages_tag:
-                    if pages_count > 1:
-                        for post in messages_tag:
-                            roles = []
-                            roles_container = post.find('div', {'class': 'message-userDetails'})
-                            if roles_container:
-                                banners = roles_container.find_all('div', class_='userBanner')
-                                for banner in banners:
-                                    roles.append(banner.get_text(strip=True))
-                            
-                            if 'Тех. Администратор' in roles:
-                                first_admpost_id = int(post['data-content'].split('-')[-1])
-                                first_admpost_author = post['data-author']
-                                break                        
-                        
+
+                if messages:
+                    if pages_count > 1 and shallow:
+                        post_count = None
+                        last_post_id = None
+                    elif pages_count > 1:
                         last_page_url = f"{MAIN_URL}/threads/{thread_id}/page-{pages_count}"
 
-                        async with self._session.get(last_page_url, params=params) as response:
+                        async with self._request('GET', last_page_url, params=params) as response:
                             response.raise_for_status()
                             last_data = await response.json()
 
-                        last_html = unescape(last_data['html']['content'])
-                        last_soup = BeautifulSoup(last_html, 'lxml')
-                        
-                        messages_tag = last_soup.find_all('article', {'class': 'message'})
+                        messages = await self._parse('parse_thread_messages', unescape(last_data['html']['content']))
 
-                        if messages_tag:
+                        if messages:
                             # Вычитаю единицу, поскольку не беру в учет первое сообщение в теме. 
-                            post_count = (pages_count - 1) * MAX_POSTS_PER_PAGE + len(messages_tag) - 1
-                            last_post_id = int(messages_tag[-1]['data-content'].split('-')[-1])                        
-                            last_post_author = messages_tag[-1]['data-author']
+                            post_count = (pages_count - 1) * MAX_POSTS_PER_PAGE + len(messages) - 1
+                            last_post_id = messages[-1]['id']
+                            last_post_author = messages[-1]['author']
                     else:
                         # Вычитаю единицу, поскольку не беру в учет первое сообщение в теме.    
-                        post_count = len(messages_tag) - 1
-                        
-                        last_post_id = int(messages_tag[-1]['data-content'].split('-')[-1])
-                        last_post_author = messages_tag[-1]['data-author']
-                        
-                        for post in messages_tag:
-                            roles = []
-                            roles_container = post.find('div', {'class': 'message-userDetails'})
-                            
-                            if roles_container:
-                                banners = roles_container.find_all('div', class_='userBanner')
-                                for banner in banners:
-                                    roles.append(banner.get_text(strip=True))
-                            
-                            if 'Тех. Администратор' in roles:
-                                first_admpost_id = int(post['data-content'].split('-')[-1])
-                                first_admpost_author = post['data-author']
-                                break
-                
-                is_closed = bool(content_soup.find('dl', {'class': 'blockStatus'}))
-
-                post_article_tag = content_soup.find('article', {'id': compile(r'js-post-\d+')})
-                thread_post_id = int(post_article_tag['id'].strip('js-post-')) if post_article_tag and post_article_tag.has_attr('id') else 0
+                        post_count = len(messages) - 1
+                        last_post_id = messages[-1]['id']
+                        last_post_author = messages[-1]['author']
 
-                return Thread(self, thread_id, url, creator, create_date, create_date_timestamp, title, prefix, post_count, last_post_id, first_admpost_id, last_post_author, first_admpost_author, thread_content, thread_html_content, pages_count, thread_post_id, is_closed)
+                thread = Thread(self, thread_id, url, creator, page['create_date'], page['create_date_timestamp'], page['title'], page['prefix'], post_count, last_post_id, page['first_admpost_id'], last_post_author, page['first_admpost_author'], page['text_content'], page['html_content'], pages_count, page['thread_post_id'], page['is_closed'])
+                if not shallow:
+                    await self._cache_set('thread', thread_id, thread)
+                return thread
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении темы {thread_id}: {e}")
@@ -377,92 +652,60 @@ class ArizonaAPI:
             return None
         
 
-    async def get_post(self, post_id: int) -> 'Post | None':
+    async def get_post(self, post_id: int, load_thread: bool = False) -> 'Post | None':
+        """Получить сообщение
+
+        По умолчанию автор и тема собираются из уже загруженной страницы сообщения (1 запрос):
+        у автора заполнены ID, имя, звание, аватар и роли, у темы - ID, заголовок, префикс и статус закрытия.
+
+        Attributes:
+            post_id (int): ID сообщения
+            load_thread (bool): Дополнительно загрузить полный профиль автора и полную тему. По умолчанию False (необяз.)
+
+        Returns:
+            Объект Post или None в случае ошибки
+        """
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        cached = await self._cache_get('post', post_id)
+        if cached is not None and (not load_thread or cached.thread.creator is not None):
+            return cached
         url = f"{MAIN_URL}/posts/{post_id}"
         try:
-            async with self._session.get(url) as response:
+            async with self._request('GET', url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
 
-            content_soup = BeautifulSoup(html_content, 'lxml')
-            post_article = content_soup.find('article', {'id': f'js-post-{post_id}'})
-            if post_article is None:
+            page = await self._parse('parse_post_page', html_content, post_id)
+            if page is None:
+                return None
+
+            thread_info = page['thread']
+            if thread_info['thread_id'] is None:
+                print(f"Не удалось получить информацию о теме для поста {post_id}")
                 return None
 
+            creator_id = page['creator_id']
             creator = None
-            creator_info_tag = post_article.find('a', {'data-xf-init': 'member-tooltip'})
-            if creator_info_tag and creator_info_tag.has_attr('data-user-id'):
-                creator_id = int(creator_info_tag['data-user-id'])
+            thread = None
+            if load_thread:
                 try:
                     creator = await self.get_member(creator_id)
                 except Exception as e:
-                    creator = Member(self, creator_id, None, None, None, None, None, None, None, None, None)
-                if not creator:
-                    creator = Member(self, creator_id, creator_info_tag.text, None, None, None, None, None, None, None, None)
-            else:
-                return None
-
-            thread = None
-            html_tag = content_soup.find('html')
-            if html_tag and html_tag.has_attr('data-content-key') and html_tag['data-content-key'].startswith('thread-'):
+                    print(f"Ошибка получения автора ({creator_id}) для поста {post_id}: {e}")
                 try:
-                    thread_id = int(html_tag['data-content-key'].strip('thread-'))
-                    thread = await self.get_thread(thread_id)
-                except (ValueError, Exception) as e:
+                    thread = await self.get_thread(thread_info['thread_id'])
+                except Exception as e:
                     print(f"Ошибка получения темы для поста {post_id}: {e}")
-            if not thread:
-                print(f"Не удалось получить информацию о теме для поста {post_id}")
-                return None
-
-            create_date_tag = post_article.find('time', {'class': 'u-dt'})
-            create_date = 0
-            if create_date_tag and create_date_tag.has_attr('title'):
-                title_value = create_date_tag['title']
-                if title_value:
-                    create_date = str(title_value)
-                else:
-                    create_date = 0
-            
-            create_date_timestamp = 0
-            if create_date_tag and create_date_tag.has_attr('data-timestamp'):
-                data_timestamp_value = create_date_tag['data-timestamp']
-                if data_timestamp_value:
-                    create_date_timestamp = float(data_timestamp_value)
-                else:
-                    create_date_timestamp = 0
-
-
-            html_content_tag = post_article.find('div', {'class': 'bbWrapper'})
-            html_content = str(html_content_tag) if html_content_tag else ""
-            if html_content_tag:
-                for iframe in html_content_tag.find_all("iframe"):
-                    src = iframe.get("src")
-                    if src:
-                        iframe.replace_with(f"\n{src}\n")
-
-                for img in html_content_tag.find_all("img"):
-                    img_url = img.get("data-url") or img.get("src")
-                    if img_url:
-                        img.replace_with(img_url)
-
-                for a in html_content_tag.find_all("a", href=True):
-                    url = a["href"]
-                    text = a.get_text(strip=True)
-
-                    if text and text != url:
-                        a.replace_with(f"{text} ({url})")
-                    else:
-                        a.replace_with(url)
-
-                text_content = html_content_tag.get_text(separator=" ", strip=True)
-                text_content = re.sub(r'\s+', ' ', text_content)
-            else:
-                text_content = ""
 
+            if not creator:
+                creator = Member(self, creator_id, page['creator_name'], page['creator_title'], page['creator_avatar'], page['creator_roles'], None, None, None, None, page['creator_color'])
+            if not thread:
+                thread = self._thread_reference(thread_info)
 
-            return Post(self, post_id, creator, thread, create_date, create_date_timestamp, html_content, text_content)
+            post = Post(self, post_id, creator, thread, page['create_date'], page['create_date_timestamp'], page['html_content'], page['text_content'])
+            await self._cache_set('post', post_id, post)
+            return post
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении поста {post_id}: {e}")
@@ -477,58 +720,33 @@ class ArizonaAPI:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
         url = f"{MAIN_URL}/profile-posts/{post_id}"
         try:
-            async with self._session.get(url) as response:
+            async with self._request('GET', url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
 
-            content_soup = BeautifulSoup(html_content, 'lxml')
-            post_article = content_soup.find('article', {'id': f'js-profilePost-{post_id}'})
-            if post_article is None:
+            post = await self._parse('parse_profile_post', html_content, post_id)
+            if post is None or post['creator_id'] is None:
                 return None
 
-            creator = None
-            creator_tag = post_article.find('a', {'class': 'username'})
-            if creator_tag and creator_tag.has_attr('data-user-id'):
-                creator_id = int(creator_tag['data-user-id'])
-                try:
-                    creator = await self.get_member(creator_id)
-                except Exception as e:
-                    creator = Member(self, creator_id, None, None, None, None, [], 0, 0, 0, '#fff')
-                if not creator:
-                    return None
-            else:
+            try:
+                creator = await self.get_member(post['creator_id'])
+            except Exception:
+                creator = Member(self, post['creator_id'], None, None, None, None, [], 0, 0, 0, '#fff')
+            if not creator:
                 return None
 
             profile_owner = None
-            profile_owner_tag = post_article.find('h4', {'class': 'attribution'})
-            if profile_owner_tag:
-                profile_link = profile_owner_tag.find('a', {'class': 'username'})
-                if profile_link and profile_link.has_attr('data-user-id'):
-                    try:
-                        profile_id = int(profile_link['data-user-id'])
-                        profile_owner = await self.get_member(profile_id)
-                    except (ValueError, Exception) as e:
-                        print(f"Ошибка получения владельца профиля ({profile_id}) для поста {post_id}: {e}")
+            if post['profile_id'] is not None:
+                try:
+                    profile_owner = await self.get_member(post['profile_id'])
+                except Exception as e:
+                    print(f"Ошибка получения владельца профиля ({post['profile_id']}) для поста {post_id}: {e}")
 
             if not profile_owner:
                 print(f"Не удалось определить владельца профиля для поста {post_id}")
                 return None
 
-            create_date_tag = post_article.find('time')
-            create_date = 0
-            if create_date_tag and create_date_tag.has_attr('data-time'):
-                data_time_value = create_date_tag['data-time']
-                if data_time_value.isdigit():
-                    create_date = int(data_time_value)
-                else:
-                    create_date = 0
-
-
-            html_content_tag = post_article.find('div', {'class': 'bbWrapper'})
-            html_content = str(html_content_tag) if html_content_tag else ""
-            text_content = html_content_tag.text if html_content_tag else ""
-
-            return ProfilePost(self, post_id, creator, profile_owner, create_date, html_content, text_content)
+            return ProfilePost(self, post_id, creator, profile_owner, post['create_date'], post['html_content'], post['text_content'])
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении поста профиля {post_id}: {e}")
@@ -542,53 +760,20 @@ class ArizonaAPI:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
         url = MAIN_URL
         try:
-            async with self._session.get(url) as response:
+            async with self._request('GET', url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
 
-            content_soup = BeautifulSoup(html_content, 'lxml')
+            statistic = await self._parse('parse_forum_statistic', html_content)
 
-            threads_count = 0
-            posts_count = 0
-            users_count = 0
             last_register_member = None
+            if statistic['last_member_id'] is not None:
+                try:
+                    last_register_member = await self.get_member(statistic['last_member_id'])
+                except Exception:
+                    last_register_member = Member(self, statistic['last_member_id'], None, None, None, None, [], 0, 0, 0, '#fff')
 
-            try:
-                threads_tag = content_soup.find('dl', {'class': 'pairs pairs--justified count--threads'})
-                if threads_tag:
-                    dd_tag = threads_tag.find('dd')
-                    if dd_tag: threads_count = int(dd_tag.text.replace(',', ''))
-            except (AttributeError, ValueError): pass
-
-            try:
-                posts_tag = content_soup.find('dl', {'class': 'pairs pairs--justified count--messages'})
-                if posts_tag:
-                    dd_tag = posts_tag.find('dd')
-                    if dd_tag: posts_count = int(dd_tag.text.replace(',', ''))
-            except (AttributeError, ValueError): pass
-
-            try:
-                users_tag = content_soup.find('dl', {'class': 'pairs pairs--justified count--users'})
-                if users_tag:
-                    dd_tag = users_tag.find('dd')
-                    if dd_tag: users_count = int(dd_tag.text.replace(',', ''))
-            except (AttributeError, ValueError): pass
-
-            try:
-                latest_member_dl = content_soup.find('dl', {'class': 'pairs pairs--justified'})
-                if latest_member_dl:
-                    latest_member_link = latest_member_dl.find('a', {'data-user-id': True})
-                    if latest_member_link and latest_member_link.has_attr('data-user-id'):
-                        last_user_id = int(latest_member_link['data-user-id'])
-                        try:
-                            last_register_member = await self.get_member(last_user_id)
-                        except Exception as e:
-                            last_register_member = Member(self, last_user_id, None, None, None, None, [], 0, 0, 0, '#fff')
-            except (AttributeError, ValueError, Exception) as e:
-                pass
-
-
-            return Statistic(self, threads_count, posts_count, users_count, last_register_member)
+            return Statistic(self, statistic['threads_count'], statistic['posts_count'], statistic['users_count'], last_register_member)
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении статистики форума: {e}")
@@ -615,7 +800,7 @@ class ArizonaAPI:
             'watch_thread': int(watch_thread)
         }
         try:
-            response = await self._session.post(url, params=params, data=payload)
+            response = await self._request('POST', url, params=params, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при создании темы в категории {category_id}: {e}")
@@ -629,7 +814,7 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/forums/{category_id}/mark-read"
         payload = {'_xfToken': token}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при отметке категории {category_id} как прочитанной: {e}")
@@ -651,7 +836,7 @@ class ArizonaAPI:
                 'notify': notify
             }
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при настройке отслеживания категории {category_id}: {e}")
@@ -664,27 +849,14 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/categories/{category_id}"
         params = {'_xfResponseType': 'json', '_xfToken': token}
         try:
-            async with self._session.get(url, params=params) as response:
+            async with self._request('GET', url, params=params) as response:
                 response.raise_for_status()
                 data = await response.json()
 
                 if data.get('status') == 'error':
                     return None
 
-                html_content = unescape(data['html']['content'])
-                soup = BeautifulSoup(html_content, "lxml")
-                
-                result = []
-                for forum in soup.find_all('div', class_=re.compile('node node--id.*')):
-                    link_tags = forum.find_all('h3', {"class": "node-title"})[0].find_all("a")
-                    if not link_tags: continue
-                    link = link_tags[-1]
-                    thread_ids = findall(r'\d+', link.get('href', ''))
-                    if not thread_ids: continue
-
-                    thread_id = int(thread_ids[0])
-                    result.append(thread_id)
-                return result                    
+            return await self._parse('parse_forum_ids', unescape(data['html']['content']))
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении тем из категории {category_id}: {e}")
             return None
@@ -700,29 +872,14 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/forums/{category_id}/page-{page}"
         params = {'_xfResponseType': 'json', '_xfToken': token}
         try:
-            async with self._session.get(url, params=params) as response:
+            async with self._request('GET', url, params=params) as response:
                 response.raise_for_status()
                 data = await response.json()
 
                 if data.get('status') == 'error':
                     return None
 
-                html_content = unescape(data['html']['content'])
-                soup = BeautifulSoup(html_content, "lxml")
-                result = {'pins': [], 'unpins': []}
-                for thread in soup.find_all('div', class_=re.compile('structItem structItem--thread.*')):
-                    link_tags = thread.find_all('div', {"class": "structItem-title"})[0].find_all("a")
-                    if not link_tags: continue
-                    link = link_tags[-1]
-                    thread_ids = findall(r'\d+', link.get('href', ''))
-                    if not thread_ids: continue
-
-                    thread_id = int(thread_ids[0])
-                    if thread.find_all('i', {'title': 'Закреплено'}):
-                        result['pins'].append(thread_id)
-                    else:
-                        result['unpins'].append(thread_id)
-                return result
+            return await self._parse('parse_category_thread_ids', unescape(data['html']['content']))
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении тем из категории {category_id} (страница {page}): {e}")
             return None
@@ -730,95 +887,27 @@ class ArizonaAPI:
             print(f"Неожиданная ошибка при получении тем из категории {category_id} (страница {page}): {e}")
             return None
 
-    async def get_thread_category_detail(self, category_id: int, page: int = 1) -> Optional[List[Dict]]:
-        if not self._session or self._session.closed:
-            raise Exception("Сессия не активна. Вызовите connect() сначала.")
+    async def _category_page_html(self, category_id: int, page: int) -> Optional[Dict]:
+        """Блок html JSON-ответа страницы раздела. None, если форум вернул ошибку"""
         token = await self.token
         url = f"{MAIN_URL}/forums/{category_id}/page-{page}"
         params = {'_xfResponseType': 'json', '_xfToken': token}
-        try:
-            async with self._session.get(url, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
+        async with self._request('GET', url, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
 
-                if data.get('status') == 'error':
-                    return None
-
-                html_content = unescape(data['html']['content'])
-                soup = BeautifulSoup(html_content, "lxml")
-                result = []
-                seen_thread_ids = set()
-
-                for thread in soup.find_all('div', class_=compile('structItem structItem--thread.*')):
-                    title_div = thread.find('div', "structItem-title")
-                    if not title_div: continue
-                    link_tags = title_div.find_all("a")
-                    if not link_tags: continue
-                    link = link_tags[-1]
-
-                    thread_ids = findall(r'\d+', link.get('href', ''))
-                    if not thread_ids: continue
-                    thread_id = int(thread_ids[0])
+        if data.get('status') == 'error':
+            return None
+        return data['html']
 
-                    if thread_id in seen_thread_ids:
-                        continue
-                    seen_thread_ids.add(thread_id)
-
-                    thread_data = {}
-
-                    minor_div = thread.find('div', 'structItem-cell--main').find('div', 'structItem-minor')
-                    username_author_tag = minor_div.find('ul', 'structItem-parts').find('a', class_='username') if minor_div else None
-                    thread_data['username_author'] = username_author_tag.text.strip() if username_author_tag else None
-                    thread_data['thread_title'] = link.text.strip()
-
-                    meta_div = thread.find('div', 'structItem-cell--meta')
-                    post_count = meta_div.find('dl', 'pairs pairs--justified').find('dd') if meta_div else None
-                    thread_data["post_count"] = post_count.text.strip() if post_count else None
-
-                    prefix_label = title_div.find('span', class_='label')
-                    thread_data['prefix'] = prefix_label.text.strip() if prefix_label else None
-
-                    thread_data['username_author_color'] = '#fff'
-                    if username_author_tag:
-                        for style, color in ROLE_COLOR.items():
-                            if style in str(username_author_tag):
-                                thread_data['username_author_color'] = color
-                                break
-
-                    start_date_li = minor_div.find('li', 'structItem-startDate') if minor_div else None
-                    time_tag = start_date_li.find('time', class_='u-dt') if start_date_li else None
-                    created_date = time_tag.get('title') if time_tag else None
-                    created_date_timestamp = time_tag.get('data-timestamp') if time_tag else None
-                    thread_data['created_date'] = created_date if created_date else None
-                    thread_data['created_date_timestamp'] = int(created_date_timestamp) if created_date_timestamp and created_date_timestamp.isdigit() else None
-                    
-                    latest_cell = thread.find('div', 'structItem-cell--latest')
-                    try:
-                        last_message_username_tag = latest_cell.find('div', 'structItem-minor').find(class_=compile('username'))
-                    except:
-                        last_message_username_tag = None
-                    thread_data['username_last_message'] = last_message_username_tag.text.strip() if last_message_username_tag else None
-
-                    thread_data['username_last_message_color'] = '#fff'
-                    if last_message_username_tag:
-                         for style, color in ROLE_COLOR.items():
-                            if style in str(last_message_username_tag):
-                                thread_data['username_last_message_color'] = color
-                                break
-                    
-                    latest_date_tag = latest_cell.find('time', class_='structItem-latestDate') if latest_cell else None
-                    last_message_date = latest_date_tag.get('title') if latest_date_tag else None
-                    last_message_date_timestamp = latest_date_tag.get('data-timestamp') if latest_date_tag else None
-                    thread_data['last_message_date'] = last_message_date if last_message_date else None
-                    thread_data['last_message_date_timestamp'] = int(last_message_date_timestamp) if last_message_date_timestamp and last_message_date_timestamp.isdigit() else None
-
-                    thread_data['thread_id'] = thread_id
-                    thread_data['is_pinned'] = len(thread.find_all('i', {'title': 'Закреплено'})) > 0
-                    thread_data['is_closed'] = len(thread.find_all('i', {'title': 'Закрыта'})) > 0
-
-                    result.append(thread_data)
-
-                return result
+    async def get_thread_category_detail(self, category_id: int, page: int = 1) -> Optional[List[Dict]]:
+        if not self._session or self._session.closed:
+            raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        try:
+            html = await self._category_page_html(category_id, page)
+            if html is None:
+                return None
+            return (await self._parse('parse_category_threads', unescape(html['content'])))['threads']
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении расширенных тем из категории {category_id} (страница {page}): {e}")
             return None
@@ -827,35 +916,70 @@ class ArizonaAPI:
             print(f"Неожиданная ошибка при получении расширенных тем из категории {category_id} (страница {page}): {e}\n{traceback.format_exc()}")
             return None
 
+    async def iter_category_threads(self, category_id: int, prefetch: int = 4, start_page: int = 1, end_page: Optional[int] = None) -> AsyncIterator[Dict]:
+        """Получить темы раздела со всех страниц (данные как в get_thread_category_detail)
+
+        Пока обрабатываются темы текущей страницы, следующие prefetch страниц уже загружаются.
+        Цикл можно прервать через break или aclose() - незагруженные страницы будут отменены.
+
+        Attributes:
+            category_id (int): ID раздела
+            prefetch (int): Сколько страниц загружать заранее. По умолчанию 4 (необяз.)
+            start_page (int): Первая страница. По умолчанию 1 (необяз.)
+            end_page (int): Последняя страница включительно. По умолчанию последняя страница раздела (необяз.)
+
+        Returns:
+            Асинхронный генератор словарей (dict) с данными тем
+        """
+        if not self._session or self._session.closed:
+            raise Exception("Сессия не активна. Вызовите connect() сначала.")
+
+        async def load(page: int) -> Optional[Dict]:
+            try:
+                html = await self._category_page_html(category_id, page)
+                if html is None:
+                    print(f"Предупреждение: Не удалось получить темы со страницы {page} категории {category_id}. Пропуск страницы.")
+                    return None
+                return await self._parse('parse_category_threads', unescape(html['content']))
+            except aiohttp.ClientError as e:
+                print(f"Ошибка сети при получении тем из категории {category_id} (страница {page}): {e}. Пропуск страницы.")
+            except Exception as e:
+                print(f"Неожиданная ошибка при получении тем из категории {category_id} (страница {page}): {e}. Пропуск страницы.")
+            return None
+
+        first = await load(start_page)
+        if first is None:
+            return
+        for thread_data in first['threads']:
+            yield thread_data
+
+        last_page = first['pages_count'] if end_page is None else min(end_page, first['pages_count'])
+        pages = self._iter_ordered(range(start_page + 1, last_page + 1), load, prefetch)
+        try:
+            async for _, result in pages:
+                if result is None:
+                    continue
+                for thread_data in result['threads']:
+                    yield thread_data
+        finally:
+            await pages.aclose()
+
     async def get_parent_category_of_category(self, category_id: int) -> Optional[Category]:
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
         url = f"{MAIN_URL}/forums/{category_id}"
         try:
-            async with self._session.get(url) as response:
+            async with self._request('GET', url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'lxml')
-
-                breadcrumbs = soup.find('ul', {'class': 'p-breadcrumbs'})
-                if not breadcrumbs: return None
-                parent_li = breadcrumbs.find_all('li')
-                if len(parent_li) < 2: return None
-                parent_link = parent_li[-1].find('a')
-                if not parent_link or not parent_link.get('href'): return None
-
-                href_parts = parent_link['href'].split('/')
-                if len(href_parts) < 3: return None
-                parent_category_id_str = href_parts[2]
-
-                if not parent_category_id_str.isdigit():
-                    return None
 
-                parent_category_id = int(parent_category_id_str)
-                try:
-                    return await self.get_category(parent_category_id)
-                except Exception as e:
-                    return None
+            parent_category_id = await self._parse('parse_parent_category_id', html_content)
+            if parent_category_id is None:
+                return None
+            try:
+                return await self.get_category(parent_category_id)
+            except Exception:
+                return None
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении родительской категории для {category_id}: {e}")
             return None
@@ -870,23 +994,14 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/forums/{category_id}/page-1" # page-1 может быть багом в оригинале?
         params = {'_xfResponseType': 'json', '_xfToken': token}
         try:
-            async with self._session.get(url, params=params) as response:
+            async with self._request('GET', url, params=params) as response:
                 response.raise_for_status()
                 data = await response.json()
 
                 if data.get('status') == 'error':
                     return None
 
-                html_content = unescape(data['html']['content'])
-                soup = BeautifulSoup(html_content, "lxml")
-                categories = []
-                for category_div in soup.find_all('div', compile('.*node--depth2 node--forum.*')):
-                    link = category_div.find("a")
-                    if link and link.get('href'):
-                         ids = findall(r'\d+', link['href'])
-                         if ids:
-                             categories.append(int(ids[0]))
-                return categories
+            return await self._parse('parse_subforum_ids', unescape(data['html']['content']))
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении дочерних категорий из {category_id}: {e}")
             return None
@@ -896,7 +1011,7 @@ class ArizonaAPI:
 
     # MEMBER
     async def follow_member(self, member_id: int) -> aiohttp.ClientResponse:
-        if member_id == self.current_member.id:
+        if member_id == self.current_member_id:
             raise ThisIsYouError(member_id)
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
@@ -904,14 +1019,14 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/members/{member_id}/follow"
         payload = {'_xfToken': token}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при подписке/отписке от пользователя {member_id}: {e}")
             raise e
 
     async def ignore_member(self, member_id: int) -> aiohttp.ClientResponse:
-        if member_id == self.current_member.id:
+        if member_id == self.current_member_id:
             raise ThisIsYouError(member_id)
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
@@ -919,12 +1034,40 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/members/{member_id}/ignore"
         payload = {'_xfToken': token}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при игнорировании/отмене игнорирования пользователя {member_id}: {e}")
             raise e
 
+    async def edit_avatar(self, upload_photo: str) -> aiohttp.ClientResponse:
+        """Изменить аватарку текущего пользователя
+
+        Attributes:
+            upload_photo (str): Относительный или полный путь до изображения
+
+        Returns:
+            Объект ClientResponse модуля aiohttp
+        """
+        if not self._session or self._session.closed:
+            raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        with open(upload_photo, 'rb') as image:
+            content = image.read()
+
+        data = {"avatar_crop_x": 0, "avatar_crop_y": 0, "_xfToken": await self.token, "use_custom": 1}
+        return await self._request('POST', f"{MAIN_URL}/account/avatar", data=data, files={'upload': (os.path.basename(upload_photo), content)})
+
+    async def delete_avatar(self) -> aiohttp.ClientResponse:
+        """Удалить аватарку текущего пользователя
+
+        Returns:
+            Объект ClientResponse модуля aiohttp
+        """
+        if not self._session or self._session.closed:
+            raise Exception("Сессия не активна. Вызовите connect() сначала.")
+        data = {"avatar_crop_x": 0, "avatar_crop_y": 0, "_xfToken": await self.token, "use_custom": 1, "delete_avatar": 1}
+        return await self._request('POST', f"{MAIN_URL}/account/avatar", data=data, files={'upload': ('', b'')})
+
     async def add_profile_message(self, member_id: int, message_html: str) -> aiohttp.ClientResponse:
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
@@ -932,7 +1075,7 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/members/{member_id}/post"
         payload = {'_xfToken': token, 'message_html': message_html}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при добавлении сообщения на стену пользователя {member_id}: {e}")
@@ -946,21 +1089,14 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/members/{member_id}/page-{page}"
         params = {'_xfResponseType': 'json', '_xfToken': token}
         try:
-            async with self._session.get(url, params=params) as response:
+            async with self._request('GET', url, params=params) as response:
                 response.raise_for_status()
                 data = await response.json()
 
                 if data.get('status') == 'error':
                     return None
 
-                html_content = unescape(data['html']['content'])
-                soup = BeautifulSoup(html_content, "lxml")
-                messages = []
-                for post in soup.find_all('article', {'id': compile('js-profilePost-*')}):
-                    post_id_str = post.get('id', '').strip('js-profilePost-')
-                    if post_id_str.isdigit():
-                         messages.append(int(post_id_str))
-                return messages
+            return await self._parse('parse_profile_post_ids', unescape(data['html']['content']))
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении сообщений профиля {member_id} (страница {page}): {e}")
             return None
@@ -978,7 +1114,7 @@ class ArizonaAPI:
         params = {'reaction_id': str(reaction_id)}
         payload = {'_xfToken': token}
         try:
-            response = await self._session.post(url, params=params, data=payload)
+            response = await self._request('POST', url, params=params, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при установке реакции на пост {post_id}: {e}")
@@ -1004,7 +1140,9 @@ class ArizonaAPI:
             "message": message_html
         }
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
+            await self._cache_invalidate('post', post_id)
+            await self._cache_invalidate('thread', post_info.thread.id)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при редактировании поста {post_id}: {e}")
@@ -1022,7 +1160,8 @@ class ArizonaAPI:
             "hard_delete": int(hard_delete)
         }
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
+            await self._cache_invalidate('post', post_id)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при удалении поста {post_id}: {e}")
@@ -1035,7 +1174,7 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/posts/{post_id}/bookmark"
         payload = {"_xfToken": token}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при добавлении поста {post_id} в закладки: {e}")
@@ -1050,7 +1189,7 @@ class ArizonaAPI:
         params = {'reaction_id': str(reaction_id)}
         payload = {'_xfToken': token}
         try:
-            response = await self._session.post(url, params=params, data=payload)
+            response = await self._request('POST', url, params=params, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при установке реакции на пост профиля {post_id}: {e}")
@@ -1064,7 +1203,7 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/profile-posts/{post_id}/add-comment"
         payload = {"_xfToken": token, "message_html": message_html}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при комментировании поста профиля {post_id}: {e}")
@@ -1082,7 +1221,7 @@ class ArizonaAPI:
             "hard_delete": int(hard_delete)
         }
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при удалении поста профиля {post_id}: {e}")
@@ -1100,7 +1239,7 @@ class ArizonaAPI:
             "message": message_html
         }
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при редактировании поста профиля {post_id}: {e}")
@@ -1116,7 +1255,8 @@ class ArizonaAPI:
             'message_html': message_html
         }
         try:
-            async with self._session.post(url, data=payload) as response:
+            async with self._request('POST', url, data=payload) as response:
+                await self._cache_invalidate('thread', thread_id)
                 return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при ответе в теме {thread_id}: {e}")
@@ -1129,7 +1269,8 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/threads/{thread_id}/quick-close"
         payload = {'_xfToken': token}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
+            await self._cache_invalidate('thread', thread_id)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при закрытии/открытии темы {thread_id}: {e}")
@@ -1142,7 +1283,8 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/threads/{thread_id}/quick-stick"
         payload = {'_xfToken': token}
         try:
-            response = await self._session.post(url, data=payload)
+            response = await self._request('POST', url, data=payload)
+            await self._cache_invalidate('thread', thread_id)
             return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при закреплении/откреплении темы {thread_id}: {e}")
@@ -1159,7 +1301,7 @@ class ArizonaAPI:
             'email_subscribe': int(email_subscribe)
         }
         try:
-            async with self._session.post(url, data=payload) as response:
+            async with self._request('POST', url, data=payload) as response:
                 return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при изменении статуса отслеживания темы {thread_id}: {e}")
@@ -1176,7 +1318,8 @@ class ArizonaAPI:
             "_xfToken": token
         }
         try:
-            async with self._session.post(url, data=payload) as response:
+            async with self._request('POST', url, data=payload) as response:
+                await self._cache_invalidate('thread', thread_id)
                 return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при удалении темы {thread_id}: {e}")
@@ -1190,16 +1333,14 @@ class ArizonaAPI:
         thread_post_id = None
 
         try:
-            async with self._session.get(get_url) as response:
+            async with self._request('GET', get_url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'lxml')
-                post_article = soup.find('article', {'id': compile('js-post-*')})
-                if post_article and 'id' in post_article.attrs:
-                    thread_post_id = post_article['id'].strip('js-post-')
-                else:
-                    print(f"Не удалось найти ID первого поста для темы {thread_id}")
-                    return None
+
+            thread_post_id = await self._parse('parse_first_post_id', html_content)
+            if thread_post_id is None:
+                print(f"Не удалось найти ID первого поста для темы {thread_id}")
+                return None
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении информации для редактирования темы {thread_id}: {e}")
@@ -1218,7 +1359,9 @@ class ArizonaAPI:
             "_xfToken": token
         }
         try:
-            async with self._session.post(edit_url, data=payload) as response:
+            async with self._request('POST', edit_url, data=payload) as response:
+                await self._cache_invalidate('thread', thread_id)
+                await self._cache_invalidate('post', thread_post_id)
                 return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при редактировании темы {thread_id} (пост {thread_post_id}): {e}")
@@ -1244,7 +1387,8 @@ class ArizonaAPI:
             payload["sticky"] = 1
 
         try:
-            async with self._session.post(url, data=payload) as response:
+            async with self._request('POST', url, data=payload) as response:
+                await self._cache_invalidate('thread', thread_id)
                 return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при изменении информации темы {thread_id}: {e}")
@@ -1257,29 +1401,16 @@ class ArizonaAPI:
 
         url = f"{MAIN_URL}/threads/{thread_id}/page-1"
         try:
-            async with self._session.get(url) as response:
+            async with self._request('GET', url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'lxml')
 
-                html_tag = soup.find('html')
-                if not html_tag or 'data-container-key' not in html_tag.attrs:
-                    print(f"Не удалось найти data-container-key для темы {thread_id}")
-                    return None
-
-                container_key = html_tag['data-container-key']
-                if not container_key.startswith('node-'):
-                     print(f"Некорректный data-container-key '{container_key}' для темы {thread_id}")
-                     return None
-
-                category_id_str = container_key.strip('node-')
-                try:
-                    category_id = int(category_id_str)
-                except ValueError:
-                    print(f"Не удалось преобразовать ID категории '{category_id_str}' в число для темы {thread_id}")
-                    return None
+            category_id = await self._parse('parse_thread_category_id', html_content)
+            if category_id is None:
+                print(f"Не удалось найти ID раздела (data-container-key) для темы {thread_id}")
+                return None
 
-                return await self.get_category(category_id)
+            return await self.get_category(category_id)
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении категории темы {thread_id}: {e}")
@@ -1295,7 +1426,7 @@ class ArizonaAPI:
         url = f"{MAIN_URL}/threads/{thread_id}/page-{page}"
         params = {'_xfResponseType': 'json', '_xfToken': token}
         try:
-            async with self._session.get(url, params=params) as response:
+            async with self._request('GET', url, params=params) as response:
                 if response.status == 404:
                     return []
                 response.raise_for_status()
@@ -1307,9 +1438,7 @@ class ArizonaAPI:
                 if 'html' not in data or 'content' not in data['html']:
                     return []
 
-                soup = BeautifulSoup(unescape(data['html']['content']), "lxml")
-                posts = soup.find_all('article', {'id': compile('js-post-*')})
-                return [i['id'].strip('js-post-') for i in posts if 'id' in i.attrs]
+            return (await self._parse('parse_thread_post_ids', unescape(data['html']['content'])))['post_ids']
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении постов темы {thread_id}, стр {page}: {e}")
@@ -1318,72 +1447,138 @@ class ArizonaAPI:
             print(f"Неожиданная ошибка при получении постов темы {thread_id}, стр {page}: {e}")
             return None
 
-    async def get_all_thread_posts(self, thread_id: int) -> List[str]:
+    async def _thread_page_html(self, thread_id: int, page: int) -> Optional[Dict]:
+        """Блок html JSON-ответа страницы темы. None, если страницы нет или форум вернул ошибку"""
+        token = await self.token
+        url = f"{MAIN_URL}/threads/{thread_id}/page-{page}"
+        params = {'_xfResponseType': 'json', '_xfToken': token}
+        async with self._request('GET', url, params=params) as response:
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            data = await response.json()
+
+        if data.get('status') == 'error':
+            print(f"API вернуло ошибку на странице {page} темы {thread_id}: {data.get('errors')}")
+            return None
+
+        if 'html' not in data or 'content' not in data['html']:
+            print(f"Ответ API для темы {thread_id} стр {page} не содержит HTML.")
+            return None
+
+        return data['html']
+
+    async def _walk_thread_pages(self, thread_id: int, start_page: int, end_page: Optional[int], concurrency: int, load: Callable[[int], Awaitable[Optional[Tuple[List, int]]]]) -> AsyncIterator[Tuple[int, List]]:
+        """Обойти страницы темы: load(page) возвращает (элементы страницы, количество страниц) или None.
+        Первая страница диапазона загружается сразу, остальные - параллельно. Обход заканчивается на первой пустой странице."""
+        first = await load(start_page)
+        if first is None:
+            return
+        items, pages_count = first
+        yield start_page, items
+
+        last_page = pages_count if end_page is None else min(end_page, pages_count)
+        pages = self._iter_ordered(range(start_page + 1, last_page + 1), load, concurrency)
+        try:
+            async for page, result in pages:
+                if result is None or not result[0]:
+                    break
+                yield page, result[0]
+        finally:
+            await pages.aclose()
+
+    async def iter_thread_post_ids(self, thread_id: int, start_page: int = 1, end_page: Optional[int] = None, concurrency: int = 8) -> AsyncIterator[Tuple[int, List[str]]]:
+        """Получить ID постов темы постранично
+
+        Первая страница диапазона загружается сразу, чтобы узнать количество страниц, остальные - параллельно.
+        Страницы отдаются по порядку, как только готовы все предыдущие.
+
+        Attributes:
+            thread_id (int): ID темы
+            start_page (int): Первая страница. По умолчанию 1 (необяз.)
+            end_page (int): Последняя страница включительно. По умолчанию последняя страница темы (необяз.)
+            concurrency (int): Максимум одновременно загружаемых страниц. По умолчанию 8 (необяз.)
+
+        Returns:
+            Асинхронный генератор пар (номер страницы, список ID постов)
+        """
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
-        token = await self.token
 
-        all_posts_ids = []
-        page = 1
-        pages_count = 1
-        processed_first_page = False
+        async def load(page: int):
+            html = await self._thread_page_html(thread_id, page)
+            if html is None:
+                return None
+            result = await self._parse('parse_thread_post_ids', unescape(html['content']))
+            return result['post_ids'], result['pages_count']
 
-        while True:
-            url = f"{MAIN_URL}/threads/{thread_id}/page-{page}"
-            params = {'_xfResponseType': 'json', '_xfToken': token}
-            try:
-                async with self._session.get(url, params=params) as response:
-                    if response.status == 404 and page > 1:
-                         break
-                    response.raise_for_status()
-                    data = await response.json()
+        page = start_page
+        try:
+            async for page, post_ids in self._walk_thread_pages(thread_id, start_page, end_page, concurrency, load):
+                yield page, post_ids
+        except aiohttp.ClientError as e:
+            print(f"Ошибка сети при получении всех постов темы {thread_id}, стр {page}: {e}")
+        except Exception as e:
+            print(f"Неожиданная ошибка при получении всех постов темы {thread_id}, стр {page}: {e}")
 
-                    if data.get('status') == 'error':
-                        if page == 1:
-                            print(f"API вернуло ошибку на первой странице темы {thread_id}: {data.get('errors')}")
-                        break
+    async def iter_thread_posts(self, thread_id: int, start_page: int = 1, end_page: Optional[int] = None, concurrency: int = 8) -> AsyncIterator[Post]:
+        """Получить сообщения темы вместе с содержимым, по одному запросу на страницу
 
-                    if 'html' not in data or 'content' not in data['html']:
-                        print(f"Ответ API для темы {thread_id} стр {page} не содержит HTML.")
-                        if page == 1:
-                            return []
-                        else:
-                            break
+        Сообщения разбираются прямо со страниц темы. Автор - облегченный объект Member (ID, имя, звание, аватар, роли),
+        тема - облегченный объект Thread (ID, заголовок, префикс, статус закрытия). Полные данные можно загрузить через get_member и get_thread.
 
-                    html_content = unescape(data['html']['content'])
-                    soup = BeautifulSoup(html_content, "lxml")
-                    current_page_posts = soup.find_all('article', {'id': compile('js-post-*')})
-                    post_ids = [i['id'].strip('js-post-') for i in current_page_posts if 'id' in i.attrs]
+        Attributes:
+            thread_id (int): ID темы
+            start_page (int): Первая страница. По умолчанию 1 (необяз.)
+            end_page (int): Последняя страница включительно. По умолчанию последняя страница темы (необяз.)
+            concurrency (int): Максимум одновременно загружаемых страниц. По умолчанию 8 (необяз.)
 
-                    if not post_ids and page > 1:
-                         break
+        Returns:
+            Асинхронный генератор объектов Post в порядке их следования в теме
+        """
+        if not self._session or self._session.closed:
+            raise Exception("Сессия не активна. Вызовите connect() сначала.")
 
-                    all_posts_ids.extend(post_ids)
+        thread = None
 
-                    if not processed_first_page:
-                        pages_count = 1
-                        try:
-                            page_nav = soup.find('ul', class_='pageNav-main')
-                            if page_nav:
-                                last_page_li = page_nav.find_all('li', class_='pageNav-page')
-                                if last_page_li:
-                                     pages_count = int(last_page_li[-1].text)
-                        except (IndexError, AttributeError, ValueError, TypeError):
-                             pages_count = 1
-                        processed_first_page = True
-
-                    if page >= pages_count:
-                        break
+        async def load(page: int):
+            nonlocal thread
+            html = await self._thread_page_html(thread_id, page)
+            if html is None:
+                return None
+            result = await self._parse('parse_thread_posts', unescape(html['content']), unescape(html.get('h1', '')))
+            if thread is None:
+                thread = self._thread_reference({'thread_id': thread_id, 'title': result['title'], 'prefix': result['prefix'], 'is_closed': result['is_closed']})
+            return result['posts'], result['pages_count']
 
-                    page += 1
+        page = start_page
+        try:
+            async for page, posts in self._walk_thread_pages(thread_id, start_page, end_page, concurrency, load):
+                for data in posts:
+                    creator = Member(self, data['creator_id'], data['creator_name'], data['creator_title'], data['creator_avatar'], data['creator_roles'], None, None, None, None, data['creator_color'])
+                    post = Post(self, data['id'], creator, thread, data['create_date'], data['create_date_timestamp'], data['html_content'], data['text_content'])
+                    await self._cache_set('post', post.id, post)
+                    yield post
+        except aiohttp.ClientError as e:
+            print(f"Ошибка сети при получении сообщений темы {thread_id}, стр {page}: {e}")
+        except Exception as e:
+            print(f"Неожиданная ошибка при получении сообщений темы {thread_id}, стр {page}: {e}")
 
-            except aiohttp.ClientError as e:
-                print(f"Ошибка сети при получении всех постов темы {thread_id}, стр {page}: {e}")
-                break
-            except Exception as e:
-                print(f"Неожиданная ошибка при получении всех постов темы {thread_id}, стр {page}: {e}")
-                break
+    async def get_all_thread_posts(self, thread_id: int, start_page: int = 1, end_page: Optional[int] = None, concurrency: int = 8) -> List[str]:
+        """Получить ID всех постов темы (или диапазона страниц). Страницы загружаются параллельно, порядок постов сохраняется
 
+        Attributes:
+            thread_id (int): ID темы
+            start_page (int): Первая страница. По умолчанию 1 (необяз.)
+            end_page (int): Последняя страница включительно. По умолчанию последняя страница темы (необяз.)
+            concurrency (int): Максимум одновременно загружаемых страниц. По умолчанию 8 (необяз.)
+
+        Returns:
+            Список (list) ID постов
+        """
+        all_posts_ids = []
+        async for _, post_ids in self.iter_thread_post_ids(thread_id, start_page, end_page, concurrency):
+            all_posts_ids.extend(post_ids)
         return all_posts_ids
 
 
@@ -1395,16 +1590,14 @@ class ArizonaAPI:
         thread_post_id = None
 
         try:
-            async with self._session.get(get_url) as response:
+            async with self._request('GET', get_url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'lxml')
-                post_article = soup.find('article', {'id': compile('js-post-*')})
-                if post_article and 'id' in post_article.attrs:
-                    thread_post_id = post_article['id'].strip('js-post-')
-                else:
-                    print(f"Не удалось найти ID первого поста для реакции в теме {thread_id}")
-                    return None
+
+            thread_post_id = await self._parse('parse_first_post_id', html_content)
+            if thread_post_id is None:
+                print(f"Не удалось найти ID первого поста для реакции в теме {thread_id}")
+                return None
 
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении ID поста для реакции в теме {thread_id}: {e}")
@@ -1421,7 +1614,7 @@ class ArizonaAPI:
         payload = {'_xfToken': token}
 
         try:
-            async with self._session.post(react_url, params=params, data=payload) as response:
+            async with self._request('POST', react_url, params=params, data=payload) as response:
                 return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при установке реакции {reaction_id} на пост {thread_post_id} темы {thread_id}: {e}")
@@ -1443,7 +1636,7 @@ class ArizonaAPI:
         
         data.update({'_xfToken': await self.token})
         try:
-            async with self._session.post(f"{MAIN_URL}/form/{form_id}/submit", data=data) as response:
+            async with self._request('POST', f"{MAIN_URL}/form/{form_id}/submit", data=data) as response:
                 return response
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при отправке формы {form_id}: {e}")
@@ -1453,67 +1646,12 @@ class ArizonaAPI:
         if not self._session or self._session.closed:
             raise Exception("Сессия не активна. Вызовите connect() сначала.")
         url = f"{MAIN_URL}/account/alerts"
-        notifications = []
         try:
-            async with self._session.get(url) as response:
+            async with self._request('GET', url) as response:
                 response.raise_for_status()
                 html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'lxml')
 
-                for alert in soup.find_all('li', {'class': 'js-alert'}):
-                    if not alert.has_attr('data-alert-id'):
-                        continue
-
-                    sender = None
-                    username_link = alert.find('a', {'class': 'username'})
-                    if username_link:
-                        sender_id_str = username_link.get('data-user-id', '0')
-                        sender = {
-                            'id': int(sender_id_str) if sender_id_str.isdigit() else 0,
-                            'name': unescape(username_link.get_text(strip=True)),
-                            'avatar': None,
-                            'avatar_color': None,
-                            'initials': None
-                        }
-
-                        avatar_container = alert.find('div', class_='contentRow-figure')
-                        if avatar_container:
-                             avatar_img = avatar_container.find('img', {'class': 'avatar'})
-                             avatar_span = avatar_container.find('span', {'class': 'avatar'})
-
-                             if avatar_img and avatar_img.has_attr('src'):
-                                 sender['avatar'] = avatar_img['src']
-                             elif avatar_span and 'avatar--default' in avatar_span.get('class', []):
-                                sender['avatar_color'] = avatar_span.get('style')
-                                sender['initials'] = unescape(avatar_span.get_text(strip=True)) if avatar_span else None
-
-
-                    time_tag = alert.find('time', {'class': 'u-dt'})
-                    timestamp = None
-                    if time_tag:
-                        timestamp = {
-                            'iso': time_tag.get('datetime'),
-                            'unix': int(time_tag['data-time']) if time_tag and time_tag.has_attr('data-time') and time_tag['data-time'].isdigit() else None
-                        }
-
-                    alert_text_container = alert.find('div', {'class': 'contentRow-main'})
-                    alert_text = unescape(alert_text_container.get_text(" ", strip=True)) if alert_text_container else None
-
-                    link_tag = alert.find('a', {'class': 'fauxBlockLink-blockLink'})
-                    link = link_tag['href'] if link_tag and link_tag.has_attr('href') else None
-
-                    alert_data = {
-                        'id': alert.get('data-alert-id'),
-                        'is_unread': 'is-unread' in alert.get('class', []),
-                        'text': alert_text,
-                        'link': f"{MAIN_URL}{link}" if link and link.startswith('/') else link,
-                        'sender': sender,
-                        'timestamp': timestamp
-                    }
-
-                    notifications.append(alert_data)
-
-            return notifications
+            return await self._parse('parse_notifications', html_content)
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при получении уведомлений: {e}")
             return []
@@ -1554,38 +1692,12 @@ class ArizonaAPI:
         if include_children:
             params.append(("c[child_nodes]", 1))
 
-        results = []
         try:
-            async with self._session.get(base_url, params=params) as response:
+            async with self._request('GET', base_url, params=params) as response:
                 response.raise_for_status()
                 html_content = await response.text()
-                content = BeautifulSoup(html_content, 'lxml')
-
-                for thread in content.find_all('li', {'class': 'block-row'}):
-                    title_link = thread.select_one('h3.contentRow-title a')
-                    if not title_link:
-                        continue
 
-                    for sp in title_link.select('span.label, span.label-append'):
-                        sp.extract()
-                    title_clean = title_link.get_text(strip=True)
-
-                    date_tag = thread.find('time', {'class': 'u-dt'})
-                    answers_tag = thread.find(string=re.compile('Ответы: '))
-
-                    thread_data = {
-                        'title': title_clean,
-                        'author': thread.get('data-author'),
-                        'thread_id': int(title_link['href'].split('/')[-2]),
-                        'create_date': int(date_tag['data-timestamp']) if date_tag else None,
-                        'answers_count': int(answers_tag.split(': ')[1]) if answers_tag else 0,
-                        'forum': thread.find('a', href=re.compile('/forums/')).text if thread.find('a', href=re.compile('/forums/')) else None,
-                        'snippet': thread.find('div', {'class': 'contentRow-snippet'}).text.strip() if thread.find('div', {'class': 'contentRow-snippet'}) else None,
-                        'url': f"{MAIN_URL}{title_link['href']}",
-                    }
-                    results.append(thread_data)
-
-            return results
+            return await self._parse('parse_search_results', html_content)
         except aiohttp.ClientError as e:
             print(f"Ошибка сети при поиске тем по запросу '{query}': {e}")
             return []
@@ -1609,7 +1721,7 @@ class ArizonaAPI:
             token = await self.token
             url = f"{MAIN_URL}/index.php?members/find&q={nickname}&_xfRequestUri=%2Fsearch%2F&_xfWithData=1&_xfToken={token}&_xfResponseType=json"
             
-            async with self._session.get(url) as response:
+            async with self._request('GET', url) as response:
                 response.raise_for_status()
                 data = await response.json()
                 
@@ -1662,7 +1774,7 @@ class ArizonaAPI:
         }
         
         try:
-            async with self._session.post(
+            async with self._request('POST', 
                 f"{MAIN_URL}/account/alert-toggle",
                 data=data
             ) as response:
@@ -1712,7 +1824,7 @@ class ArizonaAPI:
                 '_xfToken': token,
                 'html': html_content
             }
-            async with self._session.post(convert_url, data=data_post) as response:
+            async with self._request('POST', convert_url, data=data_post) as response:
                 response.raise_for_status()
                 convert_data = await response.json()
                 if convert_data.get("status") == "ok" and "bbCode" in convert_data:
@@ -1729,7 +1841,7 @@ class ArizonaAPI:
             print(f"Неожиданная ошибка при конвертации BBCode для поста {post_id}: {e}")
             return ''
         
-    async def get_category_statistics_threads(self, category_id: int, duration: str = 'week') -> Optional[Dict]:
+    async def get_category_statistics_threads(self, category_id: int, duration: str = 'week', concurrency: int = 8) -> Optional[Dict]:
         """
         Собирает статистику по темам в указанной категории за определенный период.
         Останавливает просмотр страниц, как только на странице не будет найдено тем, созданных после начала периода.
@@ -1737,6 +1849,7 @@ class ArizonaAPI:
         Args:
             category_id (int): ID категории форума.
             duration (str): Период для статистики ('day', 'week', 'month'). По умолчанию 'week'.
+            concurrency (int): Сколько страниц категории загружать одновременно. Страницы все равно обрабатываются по порядку. По умолчанию 8.
 
         Returns:
             Optional[Dict]: Словарь со статистикой или None в случае ошибки.
@@ -1805,61 +1918,69 @@ class ArizonaAPI:
         all_threads_processed = 0
         processed_pages_count = 0
 
-        for page in range(1, total_pages_in_category + 1):
-            processed_pages_count = page
-            page_contains_recent_threads = False
-
+        async def load_page(page: int):
             try:
-                page_threads = await self.get_thread_category_detail(category_id, page)
-
-                if page_threads is None:
-                    print(f"Предупреждение: Не удалось получить или обработать темы со страницы {page} категории {category_id} (возможно, ошибка парсинга). Пропускаем страницу.")
-                    continue
-
+                return await self.get_thread_category_detail(category_id, page)
             except AttributeError as e:
-                 print(f"Ошибка атрибута при обработке страницы {page} категории {category_id}: {e}. Пропускаем страницу.")
-                 continue
+                print(f"Ошибка атрибута при обработке страницы {page} категории {category_id}: {e}. Пропускаем страницу.")
             except Exception as e:
                 print(f"Неожиданная ошибка при получении тем из категории {category_id} (страница {page}): {e}. Пропускаем страницу.")
-                continue
-
-            if not page_threads:
-                print(f"Страница {page} категории {category_id} пуста или не содержит тем.")
-                continue
+            return False
 
-            all_threads_processed += len(page_threads)
+        # Страницы загружаются окном по concurrency штук, но разбираются строго по порядку,
+        # поэтому условие остановки и результат такие же, как при последовательном обходе
+        pages = self._iter_ordered(range(1, total_pages_in_category + 1), load_page, concurrency)
+        try:
+            async for page, page_threads in pages:
+                processed_pages_count = page
+                page_contains_recent_threads = False
 
-            for thread_data in page_threads:
-                if thread_data.get('is_pinned'):
-                    pinned_count += 1
-                else:
-                    unpinned_count += 1
+                if page_threads is False:
+                    continue
 
-                if thread_data.get('is_closed'):
-                    currently_closed_count += 1
-                else:
-                    currently_open_count += 1
-                    if not thread_data.get('is_pinned'):
-                         on_review_count += 1
+                if page_threads is None:
+                    print(f"Предупреждение: Не удалось получить или обработать темы со страницы {page} категории {category_id} (возможно, ошибка парсинга). Пропускаем страницу.")
+                    continue
 
-                last_message_date = thread_data.get('last_message_date_timestamp')
-                closer_username = thread_data.get('username_last_message')
-                created_date = thread_data.get('created_date_timestamp')
+                if not page_threads:
+                    print(f"Страница {page} категории {category_id} пуста или не содержит тем.")
+                    continue
 
-                if thread_data.get('is_closed') and last_message_date and closer_username and created_date:
-                    if last_message_date >= start_timestamp:
-                        closed_in_period_count += 1
-                        closing_time_seconds = last_message_date - created_date
-                        if closing_time_seconds >= 0:
-                            total_closing_duration_seconds += closing_time_seconds
-                            closers_stats[closer_username] += 1
+                all_threads_processed += len(page_threads)
 
-                if created_date and created_date >= start_timestamp:
-                    page_contains_recent_threads = True
+                for thread_data in page_threads:
+                    if thread_data.get('is_pinned'):
+                        pinned_count += 1
+                    else:
+                        unpinned_count += 1
 
-            if not page_contains_recent_threads:
-                print(f"Остановка на странице {page}: не найдено тем, созданных после {datetime.datetime.fromtimestamp(start_timestamp, tz=datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}.")
-                break
+                    if thread_data.get('is_closed'):
+                        currently_closed_count += 1
+                    else:
+                        currently_open_count += 1
+                        if not thread_data.get('is_pinned'):
+                             on_review_count += 1
+
+                    last_message_date = thread_data.get('last_message_date_timestamp')
+                    closer_username = thread_data.get('username_last_message')
+                    created_date = thread_data.get('created_date_timestamp')
+
+                    if thread_data.get('is_closed') and last_message_date and closer_username and created_date:
+                        if last_message_date >= start_timestamp:
+                            closed_in_period_count += 1
+                            closing_time_seconds = last_message_date - created_date
+                            if closing_time_seconds >= 0:
+                                total_closing_duration_seconds += closing_time_seconds
+                                closers_stats[closer_username] += 1
+
+                    if created_date and created_date >= start_timestamp:
+                        page_contains_recent_threads = True
+
+                if not page_contains_recent_threads:
+                    print(f"Остановка на странице {page}: не найдено тем, созданных после {datetime.datetime.fromtimestamp(start_timestamp, tz=datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}.")
+                    break
+        finally:
+            await pages.aclose()
 
         average_closing_time_str = "N/A"
         avg_seconds_float = 0.0
@@ -1908,13 +2029,17 @@ class ArizonaAPI:
 
         return result
     
-    async def get_category_statistics_posts(self, category_id: int, duration: str = 'week') -> Optional[Dict]:
+    async def get_category_statistics_posts(self, category_id: int, duration: str = 'week', concurrency: int = 8) -> Optional[Dict]:
         """
         Собирает статистику по постам в темах указанной категории за определенный период.
+        Темы с последним сообщением до начала периода пропускаются, страницы тем просматриваются с конца
+        до первого сообщения старше начала периода. Страницы категории идут по порядку (по дате последнего сообщения),
+        просмотр останавливается на странице, где нет тем с сообщениями за период.
 
         Args:
             category_id (int): ID категории форума.
             duration (str): Период для статистики ('day', 'week', 'month', 'year'). По умолчанию 'week'.
+            concurrency (int): Сколько тем обрабатывать одновременно. По умолчанию 8.
 
         Returns:
             Optional[Dict]: Словарь со статистикой по постам или None в случае ошибки.
@@ -1969,96 +2094,97 @@ class ArizonaAPI:
         total_posts_in_period = 0
         total_threads_checked = 0
         processed_category_pages = 0
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def thread_pages_count(thread_data: Dict) -> Optional[int]:
+            # В списке тем указано количество ответов, по нему можно посчитать страницы без запроса темы
+            replies = (thread_data.get('post_count') or '').replace(',', '').replace(' ', '').replace('\xa0', '')
+            if replies.isdigit():
+                return int(replies) // MAX_POSTS_PER_PAGE + 1
+            thread_details = await self.get_thread(thread_data['thread_id'], shallow=True)
+            return thread_details.pages_count if thread_details else None
+
+        async def count_thread_posts(thread_data: Dict) -> None:
+            nonlocal total_posts_in_period
+            thread_id = thread_data['thread_id']
+            async with semaphore:
+                try:
+                    thread_pages = await thread_pages_count(thread_data)
+                    if not thread_pages:
+                        print(f"Предупреждение: Не удалось получить детали темы {thread_id}. Пропуск темы.")
+                        return
+                except Exception as e:
+                    print(f"Ошибка при получении деталей темы {thread_id}: {e}. Пропуск темы.")
+                    return
 
-        for cat_page_num in range(1, total_category_pages + 1):
-            processed_category_pages = cat_page_num
+                for thread_page_num in range(thread_pages, 0, -1):
+                    try:
+                        html = await self._thread_page_html(thread_id, thread_page_num)
+                        if html is None:
+                            print(f"Предупреждение: Страница {thread_page_num} темы {thread_id} не найдена.")
+                            continue
+                        posts_on_page = await self._parse('parse_post_activity', unescape(html['content']))
+                    except aiohttp.ClientError as e:
+                        print(f"Ошибка сети при получении страницы {thread_page_num} темы {thread_id}: {e}")
+                        continue
+                    except Exception as e:
+                        print(f"Неожиданная ошибка при обработке страницы {thread_page_num} темы {thread_id}: {e}")
+                        continue
 
-            try:
-                threads_on_page = await self.get_thread_category_detail(category_id, cat_page_num)
+                    reached_period_start = False
+                    for post in posts_on_page:
+                        if post['timestamp'] >= start_timestamp:
+                            total_posts_in_period += 1
+                            posts_by_user[post['author']] += 1
+                        else:
+                            reached_period_start = True
 
-                if threads_on_page is None:
-                    print(f"Предупреждение: Не удалось получить темы со страницы {cat_page_num} категории {category_id}. Пропуск страницы.")
-                    continue
-                if not threads_on_page:
-                    continue
+                    # Более ранние страницы целиком старше периода
+                    if reached_period_start:
+                        break
 
+        async def load_category_page(page: int):
+            try:
+                return await self.get_thread_category_detail(category_id, page)
             except Exception as e:
-                print(f"Неожиданная ошибка при получении тем из категории {category_id} (страница {cat_page_num}): {e}. Пропуск страницы.")
-                continue
+                print(f"Неожиданная ошибка при получении тем из категории {category_id} (страница {page}): {e}. Пропуск страницы.")
+                return None
 
-            for thread_data in threads_on_page:
-                thread_id = thread_data.get('thread_id')
-                last_message_date = thread_data.get('last_message_date')
+        workers = []
+        pages = self._iter_ordered(range(1, total_category_pages + 1), load_category_page, concurrency)
+        try:
+            async for cat_page_num, threads_on_page in pages:
+                processed_category_pages = cat_page_num
 
-                if not thread_id:
-                    print(f"Предупреждение: Пропуск темы без ID на стр. {cat_page_num} категории {category_id}.")
+                if threads_on_page is None:
+                    print(f"Предупреждение: Не удалось получить темы со страницы {cat_page_num} категории {category_id}. Пропуск страницы.")
                     continue
-
-                if last_message_date and last_message_date < start_timestamp:
+                if not threads_on_page:
                     continue
 
-                total_threads_checked += 1
+                page_has_recent_threads = False
+                for thread_data in threads_on_page:
+                    thread_id = thread_data.get('thread_id')
+                    last_message_date = thread_data.get('last_message_date_timestamp')
 
-                try:
-                    thread_details = await self.get_thread(thread_id)
-                    if not thread_details:
-                        print(f"Предупреждение: Не удалось получить детали темы {thread_id}. Пропуск темы.")
+                    if not thread_id:
+                        print(f"Предупреждение: Пропуск темы без ID на стр. {cat_page_num} категории {category_id}.")
                         continue
-                    thread_pages_count = thread_details.pages_count
-                except Exception as e:
-                    print(f"Ошибка при получении деталей темы {thread_id}: {e}. Пропуск темы.")
-                    continue
-
-                stop_processing_this_thread = False
 
-                for thread_page_num in range(thread_pages_count, 0, -1):
-                    if stop_processing_this_thread:
-                        break
-
-                    page_url = f"{MAIN_URL}/threads/{thread_id}/page-{thread_page_num}"
-                    try:
-                        async with self._session.get(page_url) as response:
-                            if response.status == 404:
-                                print(f"Предупреждение: Страница {thread_page_num} темы {thread_id} не найдена (404).")
-                                continue
-                            response.raise_for_status()
-                            page_html = await response.text()
-                            page_soup = BeautifulSoup(page_html, 'lxml')
-
-                            posts_on_page = page_soup.find_all('article', class_=re.compile(r'\bmessage--post\b'))
-                            if not posts_on_page:
-                                continue
-
-                            page_had_relevant_posts = False
-
-                            for post_article in posts_on_page:
-                                post_author_name = "Неизвестный автор"
-                                post_author_tag = post_article.find('a', class_='username', attrs={'data-user-id': True})
-                                if post_author_tag:
-                                    post_author_name = post_author_tag.text.strip()
-
-                                post_timestamp = 0
-                                post_time_tag = post_article.find('time', class_='u-dt', attrs={'data-time': True})
-                                if post_time_tag and post_time_tag.get('data-time','').isdigit():
-                                    post_timestamp = int(post_time_tag['data-time'])
-                                else:
-                                    continue
-
-                                if post_timestamp >= start_timestamp:
-                                    total_posts_in_period += 1
-                                    posts_by_user[post_author_name] += 1
-                                    page_had_relevant_posts = True
-                                else:
-                                    stop_processing_this_thread = True
-                                    break
-
-                    except aiohttp.ClientError as e:
-                        print(f"Ошибка сети при получении страницы {thread_page_num} темы {thread_id}: {e}")
-                        continue
-                    except Exception as e:
-                        print(f"Неожиданная ошибка при обработке страницы {thread_page_num} темы {thread_id}: {e}")
+                    if last_message_date and last_message_date < start_timestamp:
                         continue
 
+                    if not thread_data.get('is_pinned'):
+                        page_has_recent_threads = True
+                    total_threads_checked += 1
+                    workers.append(asyncio.ensure_future(count_thread_posts(thread_data)))
+
+                if not page_has_recent_threads:
+                    break
+        finally:
+            await pages.aclose()
+            await asyncio.gather(*workers, return_exceptions=True)
+
         sorted_users = sorted(posts_by_user.items(), key=lambda item: item[1], reverse=True)
         formatted_users = []
         for username, count in sorted_users:
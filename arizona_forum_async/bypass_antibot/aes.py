@@ -0,0 +1,173 @@
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    Cipher = None
+
+
+# Расшифровка AES-CBC для проверки анти-бота без интерпретатора JavaScript.
+# Результат байт в байт совпадает с slowAES.decrypt(cipher, 2, key, iv) из script.text, включая его снятие
+# выравнивания. Если установлен пакет cryptography, блоки расшифровывает он, иначе - реализация ниже на таблицах.
+# Сверка с slowAES в dukpy - tests/test_antibot.py, замер скорости - benchmarks/antibot_benchmark.py.
+
+
+def _xtime(value: int) -> int:
+    value <<= 1
+    return (value ^ 0x11B) if value & 0x100 else value
+
+
+def _multiply(a: int, b: int) -> int:
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a = _xtime(a)
+        b >>= 1
+    return result
+
+
+def _build_tables() -> Tuple[List[int], List[int], Tuple[List[int], ...]]:
+    exp, log = [0] * 255, [0] * 256
+    value = 1
+    for power in range(255):
+        exp[power] = value
+        log[value] = power
+        value ^= _xtime(value)
+
+    sbox = [0] * 256
+    for byte in range(256):
+        inverse = exp[(255 - log[byte]) % 255] if byte else 0
+        result = rotated = inverse
+        for _ in range(4):
+            rotated = ((rotated << 1) | (rotated >> 7)) & 0xFF
+            result ^= rotated
+        sbox[byte] = result ^ 0x63
+
+    inv_sbox = [0] * 256
+    for byte, substituted in enumerate(sbox):
+        inv_sbox[substituted] = byte
+
+    td0 = [
+        (_multiply(s, 0x0E) << 24) | (_multiply(s, 0x09) << 16) | (_multiply(s, 0x0D) << 8) | _multiply(s, 0x0B)
+        for s in inv_sbox
+    ]
+    td1 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in td0]
+    td2 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in td1]
+    td3 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in td2]
+    return sbox, inv_sbox, (td0, td1, td2, td3)
+
+
+_SBOX, _INV_SBOX, (_TD0, _TD1, _TD2, _TD3) = _build_tables()
+
+
+def _sub_word(word: int) -> int:
+    return (_SBOX[word >> 24] << 24) | (_SBOX[(word >> 16) & 0xFF] << 16) | (_SBOX[(word >> 8) & 0xFF] << 8) | _SBOX[word & 0xFF]
+
+
+def _inv_mix_column(word: int) -> int:
+    return _TD0[_SBOX[word >> 24]] ^ _TD1[_SBOX[(word >> 16) & 0xFF]] ^ _TD2[_SBOX[(word >> 8) & 0xFF]] ^ _TD3[_SBOX[word & 0xFF]]
+
+
+@lru_cache(maxsize=64)
+def _decryption_keys(key: bytes) -> Tuple[int, ...]:
+    """Ключи раундов для обратного шифра в порядке применения (InvMixColumns уже применен к средним раундам)"""
+    if len(key) not in (16, 24, 32):
+        raise ValueError("Длина ключа AES должна быть 16, 24 или 32 байта.")
+
+    key_words = len(key) // 4
+    rounds = key_words + 6
+    words = [int.from_bytes(key[i:i + 4], 'big') for i in range(0, len(key), 4)]
+    rcon = 1
+    for i in range(key_words, 4 * (rounds + 1)):
+        temp = words[i - 1]
+        if i % key_words == 0:
+            temp = _sub_word(((temp << 8) | (temp >> 24)) & 0xFFFFFFFF) ^ (rcon << 24)
+            rcon = _xtime(rcon)
+        elif key_words > 6 and i % key_words == 4:
+            temp = _sub_word(temp)
+        words.append(words[i - key_words] ^ temp)
+
+    result = []
+    for round_number in range(rounds, -1, -1):
+        round_key = words[4 * round_number:4 * round_number + 4]
+        if 0 < round_number < rounds:
+            round_key = [_inv_mix_column(word) for word in round_key]
+        result.extend(round_key)
+    return tuple(result)
+
+
+def _decrypt_block(block: bytes, keys: Tuple[int, ...]) -> bytes:
+    s0 = int.from_bytes(block[0:4], 'big') ^ keys[0]
+    s1 = int.from_bytes(block[4:8], 'big') ^ keys[1]
+    s2 = int.from_bytes(block[8:12], 'big') ^ keys[2]
+    s3 = int.from_bytes(block[12:16], 'big') ^ keys[3]
+
+    for offset in range(4, len(keys) - 4, 4):
+        s0, s1, s2, s3 = (
+            _TD0[s0 >> 24] ^ _TD1[(s3 >> 16) & 0xFF] ^ _TD2[(s2 >> 8) & 0xFF] ^ _TD3[s1 & 0xFF] ^ keys[offset],
+            _TD0[s1 >> 24] ^ _TD1[(s0 >> 16) & 0xFF] ^ _TD2[(s3 >> 8) & 0xFF] ^ _TD3[s2 & 0xFF] ^ keys[offset + 1],
+            _TD0[s2 >> 24] ^ _TD1[(s1 >> 16) & 0xFF] ^ _TD2[(s0 >> 8) & 0xFF] ^ _TD3[s3 & 0xFF] ^ keys[offset + 2],
+            _TD0[s3 >> 24] ^ _TD1[(s2 >> 16) & 0xFF] ^ _TD2[(s1 >> 8) & 0xFF] ^ _TD3[s0 & 0xFF] ^ keys[offset + 3],
+        )
+
+    inv = _INV_SBOX
+    last = keys[-4:]
+    return b''.join(
+        (((inv[a >> 24] << 24) | (inv[(b >> 16) & 0xFF] << 16) | (inv[(c >> 8) & 0xFF] << 8) | inv[d & 0xFF]) ^ k).to_bytes(4, 'big')
+        for a, b, c, d, k in ((s0, s3, s2, s1, last[0]), (s1, s0, s3, s2, last[1]), (s2, s1, s0, s3, last[2]), (s3, s2, s1, s0, last[3]))
+    )
+
+
+def _unpad(data: List[int]) -> List[int]:
+    """Снятие выравнивания как в slowAES.unpadBytesOut: только если данных больше одного блока"""
+    if len(data) <= 16:
+        return data
+
+    pad_count, pad_byte = 0, -1
+    for i in range(len(data) - 1, len(data) - 18, -1):
+        if data[i] > 16:
+            break
+        if pad_byte == -1:
+            pad_byte = data[i]
+        if data[i] != pad_byte:
+            pad_count = 0
+            break
+        pad_count += 1
+        if pad_count == pad_byte:
+            break
+    return data[:len(data) - pad_count] if pad_count else data
+
+
+def decrypt_cbc(cipher: Sequence[int], key: Sequence[int], iv: Sequence[int]) -> List[int]:
+    """Расшифровать AES-CBC так же, как slowAES.decrypt(cipher, 2, key, iv)
+
+    Attributes:
+        cipher (Sequence[int]): Зашифрованные байты, длина кратна 16
+        key (Sequence[int]): Ключ длиной 16, 24 или 32 байта
+        iv (Sequence[int]): Вектор инициализации, 16 байт
+
+    Returns:
+        Список (list) расшифрованных байтов
+    """
+    cipher, key, iv = bytes(cipher), bytes(key), bytes(iv)
+    if len(cipher) % 16:
+        raise ValueError("Длина зашифрованных данных должна быть кратна 16 байтам.")
+    if len(iv) != 16:
+        raise ValueError("Длина вектора инициализации должна быть 16 байт.")
+
+    if Cipher is not None:
+        decryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
+        plain = decryptor.update(cipher) + decryptor.finalize()
+    else:
+        keys = _decryption_keys(key)
+        blocks = []
+        previous = iv
+        for start in range(0, len(cipher), 16):
+            block = cipher[start:start + 16]
+            blocks.append(bytes(x ^ y for x, y in zip(_decrypt_block(block, keys), previous)))
+            previous = block
+        plain = b''.join(blocks)
+
+    return _unpad(list(plain))
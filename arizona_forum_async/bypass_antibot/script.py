@@ -1,9 +1,16 @@
+import asyncio
+import atexit
 import re
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+
 import dukpy
 import requests
 import aiohttp
 from aiohttp_socks import ProxyConnector
 
+from .aes import decrypt_cbc
+
 
 text = """
 /*
@@ -808,48 +815,127 @@ _0xfab6 = [
     "\x3B\x20\x65\x78\x70\x69\x72\x65\x73\x3D\x54\x68\x75\x2C\x20\x33\x31\x2D\x44\x65\x63\x2D\x33\x37\x20\x32\x33\x3A\x35\x35\x3A\x35\x35\x20\x47\x4D\x54\x3B\x20\x70\x61\x74\x68\x3D\x2F"
 ]
 
+ANTIBOT_COOKIE = _0xfab6[11][:-1]
+"""Имя cookie анти-бота"""
+
 user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36 OPR/86.0.4363.64"
 
 def to_numbers(value):
-    return dukpy.evaljs('''
-        var _0x9ee6x3 = []; 
-        var _0x9ee6x2 = dukpy['value'];
-        _0x9ee6x2["replace"](/(..)/g, function (_0x9ee6x2) { 
-            _0x9ee6x3["push"](parseInt(_0x9ee6x2, 16)) }); 
-            _0x9ee6x3 
-    ''', value=value)
+    """Строка из шестнадцатеричных пар в список байтов (toNumbers из страницы проверки)"""
+    return [int(value[i:i + 2], 16) for i in range(0, len(value) - 1, 2)]
 
 
 def to_hex(value):
-    return dukpy.evaljs('''
-        _0xd8aa = dukpy['value'][1];
-        function toHex() { 
-            for (var _0x9ee6x2 = 1 == arguments[_0xd8aa[2]] && arguments[0][_0xd8aa[3]] == Array ? arguments[0] : arguments, _0x9ee6x3 = _0xd8aa[4], _0x9ee6x5 = 0; _0x9ee6x5 < _0x9ee6x2[_0xd8aa[2]]; _0x9ee6x5++) { 
-                _0x9ee6x3 += (16 > _0x9ee6x2[_0x9ee6x5] ? _0xd8aa[5] : _0xd8aa[4]) + _0x9ee6x2[_0x9ee6x5].toString(16) 
-            }; 
-            return _0x9ee6x3["toLowerCase"]() 
-        } 
-        toHex(dukpy['value'][0])
-    ''', value=value)
+    """Список байтов в строку из шестнадцатеричных пар в нижнем регистре (toHex из страницы проверки)"""
+    return ''.join(f'{byte:02x}' for byte in value[0])
 
 
 def slow_aes(value):
-    run = " slowAES['decrypt'](dukpy['value'][0], 2, dukpy['value'][1], dukpy['value'][2])"
-    data = dukpy.evaljs(text + run, value=value)
-    return data
+    """slowAES.decrypt(cipher, CBC, key, iv) для value = [cipher, key, iv] без интерпретатора JavaScript"""
+    return decrypt_cbc(*value)
+
+
+_js = threading.local()
+
+
+def _interpreter() -> dukpy.JSInterpreter:
+    """Интерпретатор с уже загруженным slowAES, свой для каждого потока"""
+    interpreter = getattr(_js, 'interpreter', None)
+    if interpreter is None:
+        interpreter = _js.interpreter = dukpy.JSInterpreter()
+        interpreter.evaljs(text)
+    return interpreter
+
+
+def slow_aes_js(value):
+    """Эталонный slowAES.decrypt в dukpy. Исходник slowAES разбирается один раз на поток"""
+    run = "slowAES['decrypt'](dukpy['value'][0], 2, dukpy['value'][1], dukpy['value'][2])"
+    return _interpreter().evaljs(run, value=value)
+
+
+SOLVER_ENGINES = {'native': slow_aes, 'js': slow_aes_js}
+"""Реализации расшифровки для solve_challenge: встроенный AES и slowAES в dukpy"""
+
+_solver_executor: Executor = None
+
+
+CHALLENGE_START = ",\"\\x30\",\"\\x74\\x6F\\x4C\\x6F\\x77\\x65\\x72\\x43\\x61\\x73\\x65\","
+CHALLENGE_END = ",\"\\x63\\x6F\\x6F\\x6B\\x69\\x65\","
+_challenge_codes = re.compile("\"(.*)\",\"(.*)\",\"(.*)\"")
+
+
+def is_challenge(body) -> bool:
+    """Является ли ответ страницей проверки анти-бота (принимает str или bytes)"""
+    if isinstance(body, bytes):
+        return CHALLENGE_START.encode() in body
+    return CHALLENGE_START in body
+
+
+def solve_challenge(body: str, engine: str = 'native') -> str:
+    """Решить проверку анти-бота по HTML странице с ней. Возвращает строку вида 'имя=значение' для cookie
+
+    Attributes:
+        body (str): HTML страницы проверки
+        engine (str): 'native' - встроенный AES, 'js' - slowAES в dukpy. По умолчанию 'native' (необяз.)
+    """
+    if engine not in SOLVER_ENGINES:
+        raise ValueError(f"Неизвестный способ решения '{engine}'. Доступны: {', '.join(SOLVER_ENGINES)}")
+    codes = body.split(CHALLENGE_START)[1].split(CHALLENGE_END)[0]
+    found = _challenge_codes.findall(codes)[0]
+    a, b, c = to_numbers(found[0]), to_numbers(found[1]), to_numbers(found[2])
+    return _0xfab6[11] + to_hex([SOLVER_ENGINES[engine]([c, a, b]), _0xfab6])
+
+
+def get_solver_executor() -> Executor:
+    """Отдельный процесс для решения через dukpy. dukpy не отпускает GIL, поэтому поток event loop не разгрузил бы.
+    Процесс создается при первом вызове, slowAES в нем загружается сразу. Останавливается shutdown_solver_executor()
+    или при выходе из интерпретатора."""
+    global _solver_executor
+    if _solver_executor is None:
+        _solver_executor = ProcessPoolExecutor(max_workers=1, initializer=_interpreter)
+        atexit.register(shutdown_solver_executor)
+    return _solver_executor
+
+
+def shutdown_solver_executor(wait: bool = True) -> None:
+    """Остановить процесс get_solver_executor(). Следующее решение через dukpy запустит новый
+
+    Attributes:
+        wait (bool): Дождаться завершения процесса. По умолчанию True (необяз.)
+    """
+    global _solver_executor
+    executor, _solver_executor = _solver_executor, None
+    if executor is not None:
+        atexit.unregister(shutdown_solver_executor)
+        executor.shutdown(wait=wait)
+
+
+async def solve_challenge_async(body: str, engine: str = 'native', executor: Executor = None) -> str:
+    """solve_challenge без блокировки event loop
+
+    Встроенный AES занимает десятки микросекунд и выполняется сразу. Решение через dukpy уходит в executor,
+    по умолчанию - в отдельный процесс get_solver_executor() с заранее загруженным slowAES.
+
+    Attributes:
+        body (str): HTML страницы проверки
+        engine (str): 'native' или 'js'. По умолчанию 'native' (необяз.)
+        executor (Executor): Свой пул для решения, в том числе для 'native' (необяз.)
+    """
+    if executor is None:
+        if engine == 'native':
+            return solve_challenge(body, engine)
+        executor = get_solver_executor()
+    return await asyncio.get_running_loop().run_in_executor(executor, solve_challenge, body, engine)
 
 
 def bypass(agent=user_agent):
     session = requests.session()
     session.headers = {"user-agent": agent}
     r = session.get("https://forum.arizona-rp.com/", timeout=3)
-    codes = r.text.split(",\"\\x30\",\"\\x74\\x6F\\x4C\\x6F\\x77\\x65\\x72\\x43\\x61\\x73\\x65\",")[1].split(",\"\\x63\\x6F\\x6F\\x6B\\x69\\x65\",")[0]
-    found = re.compile("\"(.*)\",\"(.*)\",\"(.*)\"").findall(codes)[0]
-    a, b, c = to_numbers(found[0]), to_numbers(found[1]), to_numbers(found[2])
-    return _0xfab6[11] + to_hex([slow_aes([c, a, b]), _0xfab6])
+    return solve_challenge(r.text)
 
 
-async def bypass_async(agent=user_agent, proxy=""):
+async def bypass_async(agent=user_agent, proxy="", connector=None, engine='native'):
     body = ""
     if len(proxy) > 1:
         connector = ProxyConnector.from_url(proxy)
@@ -858,15 +944,13 @@ async def bypass_async(agent=user_agent, proxy=""):
             async with session.get("https://forum.arizona-rp.com/") as resp:
                 body = await resp.text()
     else:
-        async with aiohttp.ClientSession() as session:
+        # Переданный коннектор не закрываем: им пользуются и другие сессии
+        async with aiohttp.ClientSession(connector=connector, connector_owner=connector is None) as session:
             session.headers.update({"user-agent": agent})
             async with session.get("https://forum.arizona-rp.com/") as resp:
                 body = await resp.text()
-    
-    codes = body.split(",\"\\x30\",\"\\x74\\x6F\\x4C\\x6F\\x77\\x65\\x72\\x43\\x61\\x73\\x65\",")[1].split(",\"\\x63\\x6F\\x6F\\x6B\\x69\\x65\",")[0]
-    found = re.compile("\"(.*)\",\"(.*)\",\"(.*)\"").findall(codes)[0]
-    a, b, c = to_numbers(found[0]), to_numbers(found[1]), to_numbers(found[2])
-    return _0xfab6[11] + to_hex([slow_aes([c, a, b]), _0xfab6]), session.headers.get("user-agent")
+
+    return await solve_challenge_async(body, engine), session.headers.get("user-agent")
 
 def main():
     code = bypass()
@@ -0,0 +1,316 @@
+import asyncio
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Tuple, TYPE_CHECKING
+
+from arizona_forum_async.models.category_object import Category
+from arizona_forum_async.models.member_object import Member, CurrentMember
+from arizona_forum_async.models.post_object import Post, ProfilePost
+from arizona_forum_async.models.thread_object import Thread
+
+if TYPE_CHECKING:
+    from arizona_forum_async import ArizonaAPI
+
+
+__all__ = ['DEFAULT_TTL', 'BaseCache', 'MemoryCache', 'SQLiteCache', 'dump_model', 'load_model']
+
+
+DEFAULT_TTL = {
+    'member': 600,
+    'thread': 60,
+    'category': 300,
+    'post': 300
+}
+"""Время жизни записей кэша по типам объектов в секундах"""
+
+_MODELS = {model.__name__: model for model in (Category, Member, CurrentMember, Post, ProfilePost, Thread)}
+
+
+def dump_model(value: Any) -> Any:
+    """Преобразовать объект форума (вместе с вложенными) в данные, пригодные для JSON. Ссылка на API не сохраняется."""
+    if _MODELS.get(type(value).__name__) is type(value):
+        state = {name: dump_model(item) for name, item in vars(value).items() if name != 'API'}
+        return {'__model__': type(value).__name__, 'state': state}
+    if isinstance(value, (list, tuple)):
+        return [dump_model(item) for item in value]
+    return value
+
+
+def load_model(data: Any, api: 'ArizonaAPI') -> Any:
+    """Восстановить объект форума из данных dump_model и привязать его к api"""
+    if isinstance(data, dict) and '__model__' in data:
+        model = _MODELS[data['__model__']]
+        value = model.__new__(model)
+        value.__dict__.update({name: load_model(item, api) for name, item in data['state'].items()})
+        value.API = api
+        return value
+    if isinstance(data, list):
+        return [load_model(item, api) for item in data]
+    return data
+
+
+class BaseCache(ABC):
+    """Интерфейс кэша объектов форума для ArizonaAPI. Все методы - корутины, чтобы хранилище могло работать с диском или сетью, не блокируя event loop"""
+
+    @abstractmethod
+    async def get(self, kind: str, key: Hashable, api: 'ArizonaAPI' = None) -> Any:
+        """Получить объект из кэша или None"""
+
+    @abstractmethod
+    async def set(self, kind: str, key: Hashable, value: Any) -> None:
+        """Положить объект в кэш"""
+
+    @abstractmethod
+    async def invalidate(self, kind: str = None, key: Hashable = None) -> None:
+        """Удалить объекты из кэша"""
+
+    async def flush(self) -> None:
+        """Записать отложенные изменения в хранилище"""
+        pass
+
+    async def close(self) -> None:
+        """Записать отложенные изменения и освободить ресурсы"""
+        await self.flush()
+
+
+class MemoryCache(BaseCache):
+    def __init__(self, ttl: Dict[str, float] = None, maxsize: int = 2048) -> None:
+        """
+        Кэш объектов форума в памяти процесса с ограничением по времени жизни и размеру (LRU).
+
+        Объекты хранятся как есть, вместе с ArizonaAPI, который их загрузил.
+
+        Args:
+            ttl (dict): Время жизни по типам ('member', 'thread', 'category', 'post') в секундах. 0 или None - не кэшировать тип (необяз.)
+            maxsize (int): Максимальное количество объектов в кэше (необяз.)
+        """
+        self.ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self.maxsize = maxsize
+        self.hits = 0
+        """**Количество попаданий в кэш**"""
+        self.misses = 0
+        """**Количество промахов кэша**"""
+        self._data: 'OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]' = OrderedDict()
+
+    async def get(self, kind: str, key: Hashable, api: 'ArizonaAPI' = None) -> Any:
+        """Получить объект из кэша
+
+        Attributes:
+            kind (str): Тип объекта ('member', 'thread', 'category', 'post')
+            key (Hashable): ID объекта
+            api (ArizonaAPI): Объект API, запрашивающий данные (необяз.)
+
+        Returns:
+            Объект или None, если его нет в кэше или он устарел
+        """
+
+        item = self._data.get((kind, key))
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires, value = item
+        if expires < time.monotonic():
+            del self._data[(kind, key)]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end((kind, key))
+        self.hits += 1
+        return value
+
+    async def set(self, kind: str, key: Hashable, value: Any) -> None:
+        """Положить объект в кэш
+
+        Attributes:
+            kind (str): Тип объекта ('member', 'thread', 'category', 'post')
+            key (Hashable): ID объекта
+            value (Any): Объект
+        """
+
+        ttl = self.ttl.get(kind)
+        if not ttl or value is None:
+            return
+
+        self._data[(kind, key)] = (time.monotonic() + ttl, value)
+        self._data.move_to_end((kind, key))
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def invalidate(self, kind: str = None, key: Hashable = None) -> None:
+        """Удалить объекты из кэша
+
+        Attributes:
+            kind (str): Тип объектов. Если не указан, кэш очищается полностью (необяз.)
+            key (Hashable): ID объекта. Если не указан, удаляются все объекты типа (необяз.)
+        """
+
+        if kind is None:
+            self._data.clear()
+        elif key is not None:
+            self._data.pop((kind, key), None)
+        else:
+            for cached in [cached for cached in self._data if cached[0] == kind]:
+                del self._data[cached]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Счетчики кэша: размер, попадания, промахи"""
+
+        return {'size': len(self._data), 'hits': self.hits, 'misses': self.misses}
+
+
+class SQLiteCache(BaseCache):
+    def __init__(self, path: str = 'arizona_cache.sqlite3', ttl: Dict[str, float] = None, batch_size: int = 100, flush_interval: float = 2.0) -> None:
+        """
+        Постоянный кэш объектов форума в файле SQLite. Переживает перезапуск процесса.
+
+        Файл открывается в режиме WAL, записи копятся в памяти и сохраняются пачками: когда их набралось batch_size
+        или через flush_interval секунд после первой несохраненной записи. Вся работа с файлом идет в отдельном потоке,
+        event loop не блокируется. Свежесть проверяется по времени загрузки объекта с форума, отдельно для каждого типа.
+
+        Args:
+            path (str): Путь до файла базы (необяз.)
+            ttl (dict): Время жизни по типам ('member', 'thread', 'category', 'post') в секундах. 0 или None - не кэшировать тип (необяз.)
+            batch_size (int): Сколько записей копить перед сохранением (необяз.)
+            flush_interval (float): Максимальное время в секундах, которое запись ждет сохранения (необяз.)
+        """
+        self.path = path
+        self.ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.hits = 0
+        """**Количество попаданий в кэш**"""
+        self.misses = 0
+        """**Количество промахов кэша**"""
+        self._pending: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._timer: 'asyncio.Task | None' = None
+        # Один поток на файл: запросы к базе выполняются строго по очереди
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arizona-cache')
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS entities (kind TEXT NOT NULL, key TEXT NOT NULL, fetched_at REAL NOT NULL, data TEXT NOT NULL, PRIMARY KEY (kind, key))')
+        self._db.commit()
+        self._stored = self._db.execute('SELECT COUNT(*) FROM entities').fetchone()[0]
+
+    async def _run(self, function: Callable, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _select(self, kind: str, key: str) -> 'Tuple[float, Any] | None':
+        row = self._db.execute('SELECT fetched_at, data FROM entities WHERE kind = ? AND key = ?', (kind, key)).fetchone()
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    def _insert(self, rows: list) -> None:
+        # Размер файла ведется по изменениям, без подсчета всей таблицы: новые ключи ищутся по первичному ключу
+        existing = sum(self._db.execute('SELECT 1 FROM entities WHERE kind = ? AND key = ?', row[:2]).fetchone() is not None for row in rows)
+        self._db.executemany('INSERT OR REPLACE INTO entities (kind, key, fetched_at, data) VALUES (?, ?, ?, ?)', rows)
+        self._db.commit()
+        self._stored += len(rows) - existing
+
+    def _delete(self, query: str, args: tuple) -> None:
+        deleted = self._db.execute(query, args).rowcount
+        self._db.commit()
+        self._stored = max(0, self._stored - deleted)
+
+    async def get(self, kind: str, key: Hashable, api: 'ArizonaAPI' = None) -> Any:
+        """Получить объект из кэша
+
+        Attributes:
+            kind (str): Тип объекта ('member', 'thread', 'category', 'post')
+            key (Hashable): ID объекта
+            api (ArizonaAPI): Объект API, к которому будет привязан восстановленный объект
+
+        Returns:
+            Объект или None, если его нет в кэше или он устарел
+        """
+
+        ttl = self.ttl.get(kind)
+        if not ttl:
+            self.misses += 1
+            return None
+
+        row = self._pending.get((kind, str(key)))
+        if row is not None:
+            row = (row[0], json.loads(row[1]))
+        else:
+            row = await self._run(self._select, kind, str(key))
+        if row is None or row[0] + ttl < time.time():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return load_model(row[1], api)
+
+    async def set(self, kind: str, key: Hashable, value: Any) -> None:
+        """Положить объект в кэш
+
+        Attributes:
+            kind (str): Тип объекта ('member', 'thread', 'category', 'post')
+            key (Hashable): ID объекта
+            value (Any): Объект
+        """
+
+        if not self.ttl.get(kind) or value is None:
+            return
+
+        self._pending[(kind, str(key))] = (time.time(), json.dumps(dump_model(value), ensure_ascii=False))
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._timer = None
+        await self.flush()
+
+    async def invalidate(self, kind: str = None, key: Hashable = None) -> None:
+        """Удалить объекты из кэша
+
+        Attributes:
+            kind (str): Тип объектов. Если не указан, кэш очищается полностью (необяз.)
+            key (Hashable): ID объекта. Если не указан, удаляются все объекты типа (необяз.)
+        """
+
+        if kind is None:
+            self._pending.clear()
+            await self._run(self._delete, 'DELETE FROM entities', ())
+        elif key is not None:
+            self._pending.pop((kind, str(key)), None)
+            await self._run(self._delete, 'DELETE FROM entities WHERE kind = ? AND key = ?', (kind, str(key)))
+        else:
+            for pending in [pending for pending in self._pending if pending[0] == kind]:
+                del self._pending[pending]
+            await self._run(self._delete, 'DELETE FROM entities WHERE kind = ?', (kind,))
+
+    async def flush(self) -> None:
+        """Сохранить накопленные записи в файл"""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        rows = [(kind, key, fetched_at, data) for (kind, key), (fetched_at, data) in self._pending.items()]
+        self._pending.clear()
+        await self._run(self._insert, rows)
+
+    async def close(self) -> None:
+        """Сохранить накопленные записи и закрыть файл"""
+
+        await self.flush()
+        await self._run(self._db.close)
+        self._executor.shutdown(wait=False)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Счетчики кэша: записей в файле, записей в очереди на сохранение, попадания, промахи.
+        Размер считается при открытии и дальше ведется по своим записям и удалениям - записи других процессов в него не попадают"""
+
+        return {'size': self._stored, 'pending': len(self._pending), 'hits': self.hits, 'misses': self.misses}
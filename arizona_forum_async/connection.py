@@ -0,0 +1,60 @@
+import aiohttp
+from aiohttp_socks import ProxyConnector
+
+
+__all__ = ['ConnectionConfig']
+
+
+class ConnectionConfig:
+    def __init__(self, limit: int = 100, limit_per_host: int = 20, keepalive_timeout: float = 30.0, ttl_dns_cache: int = 300, total_timeout: float = 60.0, connect_timeout: float = None, sock_read_timeout: float = None) -> None:
+        self.limit = limit
+        """**Максимальное количество соединений в пуле**"""
+        self.limit_per_host = limit_per_host
+        """**Максимальное количество соединений к одному хосту**"""
+        self.keepalive_timeout = keepalive_timeout
+        """**Время жизни простаивающего keep-alive соединения в секундах**"""
+        self.ttl_dns_cache = ttl_dns_cache
+        """**Время кэширования DNS-ответов в секундах**"""
+        self.total_timeout = total_timeout
+        """**Общий таймаут запроса в секундах**"""
+        self.connect_timeout = connect_timeout
+        """**Таймаут установки соединения в секундах**"""
+        self.sock_read_timeout = sock_read_timeout
+        """**Таймаут чтения из сокета в секундах**"""
+
+    def create_connector(self, proxy: str = None) -> aiohttp.TCPConnector:
+        """Создать пул соединений по настройкам
+
+        Коннектор можно передать в несколько объектов ArizonaAPI, чтобы они использовали общие TLS-соединения.
+        Должен вызываться внутри запущенного event loop.
+
+        Attributes:
+            proxy (str): Адрес SOCKS/HTTP прокси, через который идут все соединения пула (необяз.)
+
+        Returns:
+            Объект TCPConnector модуля aiohttp (ProxyConnector модуля aiohttp_socks, если указан proxy)
+        """
+
+        if proxy:
+            return ProxyConnector.from_url(
+                proxy,
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache
+            )
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache
+        )
+
+    def create_timeout(self) -> aiohttp.ClientTimeout:
+        """Создать объект таймаутов по настройкам
+
+        Returns:
+            Объект ClientTimeout модуля aiohttp
+        """
+
+        return aiohttp.ClientTimeout(total=self.total_timeout, connect=self.connect_timeout, sock_read=self.sock_read_timeout)
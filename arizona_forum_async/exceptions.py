@@ -10,6 +10,11 @@ class IncorrectLoginData(Exception):
         return "Вы ввели неверные cookie!"
 
 
+class ParseError(ArizonaException):
+    """На странице нет элемента, без которого ее нельзя разобрать (форум изменил разметку или вернул не ту страницу)"""
+    pass
+
+
 class ThisIsYouError(ArizonaException):
     def __init__(self, user_id):
         self.user_id = user_id
@@ -0,0 +1,92 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Tuple
+
+
+__all__ = ['RateLimiter', 'TokenBucket']
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = None) -> None:
+        self.rate = rate
+        """**Скорость пополнения токенов (запросов в секунду)**"""
+        self.capacity = capacity or max(rate, 1.0)
+        """**Максимальный запас токенов (размер всплеска)**"""
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Дождаться и забрать один токен"""
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RateLimiter:
+    def __init__(self, read_rate: float = None, write_rate: float = None, max_in_flight: int = None, max_write_in_flight: int = None, burst: float = None) -> None:
+        """
+        Ограничитель частоты и параллельности запросов. Каждое ограничение включается отдельно: по умолчанию все выключены.
+        Например, RateLimiter(read_rate=8, write_rate=1, max_in_flight=8, max_write_in_flight=2) бережет аккаунт от 429 ответов форума.
+
+        Один объект можно передать в несколько ArizonaAPI, чтобы они делили общий бюджет запросов.
+        Скорость считается отдельно для каждого прокси (каждого исходящего IP), ограничения параллельности - общие.
+
+        Args:
+            read_rate (float): Запросов на чтение в секунду к одному хосту через один прокси. None - без ограничения (необяз.)
+            write_rate (float): Запросов на запись в секунду к одному хосту через один прокси. None - без ограничения (необяз.)
+            max_in_flight (int): Максимум одновременных запросов. None - без ограничения (необяз.)
+            max_write_in_flight (int): Максимум одновременных запросов на запись. None - без ограничения (необяз.)
+            burst (float): Размер всплеска для token bucket. По умолчанию равен скорости (необяз.)
+        """
+        self.read_rate = read_rate
+        self.write_rate = write_rate
+        self.max_in_flight = max_in_flight
+        self.max_write_in_flight = max_write_in_flight
+        self.burst = burst
+        self._buckets: Dict[Tuple[str, str, bool], TokenBucket] = {}
+        self._semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._write_semaphore = asyncio.Semaphore(max_write_in_flight) if max_write_in_flight else None
+
+    def _bucket(self, host: str, write: bool, proxy: str = '') -> 'TokenBucket | None':
+        rate = self.write_rate if write else self.read_rate
+        if not rate:
+            return None
+        bucket = self._buckets.get((host, proxy, write))
+        if bucket is None:
+            bucket = self._buckets[(host, proxy, write)] = TokenBucket(rate, self.burst)
+        return bucket
+
+    @asynccontextmanager
+    async def slot(self, host: str, write: bool = False, proxy: str = ''):
+        """Занять место под один запрос к хосту
+
+        Attributes:
+            host (str): Хост, к которому идет запрос
+            write (bool): Запрос изменяет данные на форуме (ответ, реакция и т.п.). По умолчанию False (необяз.)
+            proxy (str): Прокси, через который идет запрос. У каждого прокси свой бюджет скорости. По умолчанию без прокси (необяз.)
+        """
+
+        bucket = self._bucket(host, write, proxy)
+        if bucket is not None:
+            await bucket.acquire()
+
+        # Сначала бюджет записи, чтобы ждущие записи не занимали общие места
+        semaphores = [semaphore for semaphore in (self._write_semaphore if write else None, self._semaphore) if semaphore is not None]
+        acquired = []
+        try:
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+            yield
+        finally:
+            for semaphore in acquired:
+                semaphore.release()
@@ -1,4 +1,3 @@
-from bs4 import BeautifulSoup
 import aiohttp
 from re import compile
 from typing import TYPE_CHECKING
@@ -94,17 +93,7 @@ class CurrentMember(Member):
             Объект Response модуля requests
         """
 
-        with open(upload_photo, 'rb') as image:
-            file_dict = {'upload': (upload_photo, image.read())}
-        
-        token = BeautifulSoup(self.API.session.get(f"{MAIN_URL}/help/terms/").content, 'lxml').find('html')['data-csrf']
-        data = {
-            "avatar_crop_x": 0, 
-            "avatar_crop_y": 0,
-            "_xfToken": token, 
-            "use_custom": 1,
-        }
-        return await self.API.session.post(f"{MAIN_URL}/account/avatar", files=file_dict, data=data)
+        return await self.API.edit_avatar(upload_photo)
     
 
     async def delete_avatar(self) -> aiohttp.ClientResponse:
@@ -113,14 +102,4 @@ class CurrentMember(Member):
         Returns:
             Объект Response модуля requests
         """
-        token = BeautifulSoup(self.API.session.get(f"{MAIN_URL}/help/terms/").content, 'lxml').find('html')['data-csrf']
-        file_dict = {'upload': ("", "")}
-        data = {
-            "avatar_crop_x": 0, 
-            "avatar_crop_y": 0,
-            "_xfToken": token, 
-            "use_custom": 1,
-            "delete_avatar": 1
-        }
-
-        return await self.API.session.post(f"{MAIN_URL}/account/avatar", files=file_dict, data=data)
+        return await self.API.delete_avatar()
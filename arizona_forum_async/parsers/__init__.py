@@ -0,0 +1,41 @@
+from functools import lru_cache
+from importlib import import_module
+from typing import Callable
+
+from .soup_backend import *
+
+
+PARSER_BACKENDS = {
+    'lxml': ('regex_backend', 'lxml_backend', 'soup_backend'),
+    'selectolax': ('regex_backend', 'selectolax_backend', 'lxml_backend', 'soup_backend'),
+    'bs4': ('soup_backend',)
+}
+"""Бэкенды разбора страниц и порядок, в котором ищется функция разбора"""
+
+
+@lru_cache(maxsize=None)
+def get_parser(name: str, backend: str = 'lxml') -> Callable:
+    """Получить функцию разбора страницы
+
+    Функция ищется в выбранном бэкенде, а если он ее не реализует или не установлен - в следующих по цепочке.
+    Последним всегда идет BeautifulSoup, который реализует все функции.
+
+    Attributes:
+        name (str): Имя функции разбора, например 'parse_thread_page'
+        backend (str): Бэкенд: 'lxml', 'selectolax' или 'bs4'. По умолчанию 'lxml' (необяз.)
+
+    Returns:
+        Функция модуля бэкенда. Ее можно передавать в ProcessPoolExecutor
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Неизвестный бэкенд разбора '{backend}'. Доступны: {', '.join(PARSER_BACKENDS)}")
+
+    for module_name in PARSER_BACKENDS[backend]:
+        try:
+            module = import_module(f'{__name__}.{module_name}')
+        except ImportError:
+            continue
+        parser = getattr(module, name, None)
+        if parser is not None:
+            return parser
+    raise AttributeError(f"Функция разбора '{name}' не найдена")
@@ -0,0 +1,353 @@
+import re
+from html import unescape
+from typing import Dict, List
+
+from lxml import etree
+
+from arizona_forum_async.consts import MAIN_URL, ROLE_COLOR
+from arizona_forum_async.exceptions import ParseError
+
+
+# Функции повторяют soup_backend, но ищут элементы заранее скомпилированными XPath-выражениями прямо по дереву lxml.
+# Результат должен совпадать с soup_backend, поэтому правила поиска и извлечения текста подобраны под BeautifulSoup.
+# Страницы с HTML-содержимым сообщений (parse_thread_page, parse_thread_posts, parse_post_page) разбираются через soup_backend:
+# BeautifulSoup сериализует HTML иначе, чем lxml.
+
+_PARSER = etree.HTMLParser()
+
+
+def _cls(name: str) -> str:
+    """Условие XPath: у элемента есть класс name (как class_='name' в BeautifulSoup)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _xpath(expression: str) -> etree.XPath:
+    return etree.XPath(expression, smart_strings=False)
+
+
+# Текст без script/style/template, как get_text() в BeautifulSoup
+_TEXTS = _xpath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+
+
+def _document(content_html: str):
+    root = etree.fromstring(content_html, _PARSER) if content_html and content_html.strip() else None
+    return root if root is not None else etree.Element('html')
+
+
+def _first(xpath: etree.XPath, element):
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _text(element) -> str:
+    return ''.join(_TEXTS(element))
+
+
+def _stripped_text(element, separator: str = '') -> str:
+    return separator.join(text.strip() for text in _TEXTS(element) if text.strip())
+
+
+def _classes(element) -> List[str]:
+    return (element.get('class') or '').split()
+
+
+def _username_color(username_tag) -> str:
+    if username_tag is not None:
+        markup = etree.tostring(username_tag, method='html', encoding='unicode', with_tail=False)
+        for style, color in ROLE_COLOR.items():
+            if style in markup:
+                return color
+    return '#fff'
+
+
+def _pages_count(xpath: etree.XPath, root) -> int:
+    try:
+        return int(_text(xpath(root)[-1]))
+    except (IndexError, ValueError):
+        return 1
+
+
+# Профиль пользователя
+_MEMBER_ACTIVITY = _xpath(".//dd[@dir='auto']")
+_MEMBER_USERNAME = _xpath(f".//span[{_cls('username')}]")
+_MEMBER_BANNERS = _xpath(f".//div[{_cls('memberHeader-banners')}]")
+_MEMBER_BANNER = _xpath(f".//em[{_cls('userBanner')}]")
+_MEMBER_TITLE = _xpath(f".//span[{_cls('userTitle')}]")
+_MEMBER_AVATAR = _xpath(".//a[normalize-space(@class)='avatar avatar--l']")
+_MEMBER_LINK = _xpath(".//a[@href=$href]")
+_MEMBER_REACTIONS = _xpath(".//dl[normalize-space(@class)='pairs pairs--rows pairs--rows--centered']")
+_DD = _xpath('.//dd')
+
+
+def _count(tag) -> int:
+    return int(_text(tag).strip().replace(',', '')) if tag is not None else 0
+
+
+def parse_member(content_html: str, user_id: int) -> Dict:
+    """Разобрать профиль пользователя (html.content в JSON-ответе /members/{id})"""
+    root = _document(content_html)
+
+    activity_tag = _first(_MEMBER_ACTIVITY, root)
+    activity = _text(activity_tag).strip('\n') if activity_tag is not None else None
+
+    roles = []
+    roles_container = _first(_MEMBER_BANNERS, root)
+    if roles_container is not None:
+        roles = [_stripped_text(banner) for banner in _MEMBER_BANNER(roles_container)]
+
+    user_title_tag = _first(_MEMBER_TITLE, root)
+    avatar_tag = _first(_MEMBER_AVATAR, root)
+
+    messages_count = 0
+    reactions_count = 0
+    trophies_count = 0
+
+    try:
+        messages_count = _count(_first_link(root, f'/search/member?user_id={user_id}'))
+    except ValueError: pass
+
+    try:
+        react_tag = _first(_MEMBER_REACTIONS, root)
+        if react_tag is not None:
+            reactions_count = _count(_first(_DD, react_tag))
+    except ValueError: pass
+
+    try:
+        trophies_count = _count(_first_link(root, f'/members/{user_id}/trophies'))
+    except ValueError: pass
+
+    return {
+        'user_title': _text(user_title_tag) if user_title_tag is not None else None,
+        'avatar': MAIN_URL + avatar_tag.get('href') if avatar_tag is not None and avatar_tag.get('href') is not None else None,
+        'roles': roles,
+        'activity': activity,
+        'messages_count': messages_count,
+        'reactions_count': reactions_count,
+        'trophies_count': trophies_count,
+        'username_color': _username_color(_first(_MEMBER_USERNAME, root))
+    }
+
+
+def _first_link(root, href: str):
+    found = _MEMBER_LINK(root, href=href)
+    return found[0] if found else None
+
+
+# Страница темы
+_MESSAGES = _xpath(f".//article[{_cls('message')}]")
+_POST_ARTICLES = _xpath(".//article[contains(@id, 'js-post')]")
+_PAGE_NAV = _xpath(f".//ul[{_cls('pageNav-main')}]")
+_PAGE_NAV_PAGES = _xpath(f".//li[{_cls('pageNav-page')}]")
+_ACTIVITY_ARTICLES = _xpath(".//article[contains(@class, 'message--post')]")
+_ACTIVITY_TIME = _xpath(f".//time[{_cls('u-dt')} and @data-time]")
+_ACTIVITY_AUTHOR = _xpath(f".//a[{_cls('username')} and @data-user-id]")
+_MESSAGE_POST = re.compile(r'\bmessage--post\b')
+
+
+def parse_thread_messages(content_html: str) -> List[Dict]:
+    """Краткая информация о сообщениях на странице темы: ID и автор"""
+    root = _document(content_html)
+    return [
+        {'id': int(post.attrib['data-content'].split('-')[-1]), 'author': post.attrib['data-author']}
+        for post in _MESSAGES(root)
+    ]
+
+
+def parse_thread_post_ids(content_html: str) -> Dict:
+    """ID постов и количество страниц на странице темы (html.content в JSON-ответе)"""
+    root = _document(content_html)
+
+    pages_count = 1
+    page_nav = _first(_PAGE_NAV, root)
+    if page_nav is not None:
+        pages_count = _pages_count(_PAGE_NAV_PAGES, page_nav)
+
+    return {
+        'post_ids': [post.get('id').strip('js-post-') for post in _POST_ARTICLES(root)],
+        'pages_count': pages_count
+    }
+
+
+def parse_post_activity(content_html: str) -> List[Dict]:
+    """Автор и время отправки (UNIX) каждого сообщения на странице темы. Сообщения без времени пропускаются"""
+    root = _document(content_html)
+    result = []
+    for post_article in _ACTIVITY_ARTICLES(root):
+        if not _MESSAGE_POST.search(' '.join(_classes(post_article))):
+            continue
+
+        post_time_tag = _first(_ACTIVITY_TIME, post_article)
+        if post_time_tag is None or not post_time_tag.get('data-time', '').isdigit():
+            continue
+
+        post_author_tag = _first(_ACTIVITY_AUTHOR, post_article)
+        result.append({
+            'author': _text(post_author_tag).strip() if post_author_tag is not None else "Неизвестный автор",
+            'timestamp': int(post_time_tag.get('data-time'))
+        })
+    return result
+
+
+# Список тем раздела
+_THREAD_ITEMS = _xpath(".//div[contains(normalize-space(@class), 'structItem structItem--thread')]")
+_ITEM_TITLE = _xpath(f".//div[{_cls('structItem-title')}]")
+_ITEM_LINKS = _xpath('.//a')
+_ITEM_MAIN = _xpath(f".//div[{_cls('structItem-cell--main')}]")
+_ITEM_MINOR = _xpath(f".//div[{_cls('structItem-minor')}]")
+_ITEM_PARTS = _xpath(f".//ul[{_cls('structItem-parts')}]")
+_ITEM_USERNAME = _xpath(f".//a[{_cls('username')}]")
+_ITEM_META = _xpath(f".//div[{_cls('structItem-cell--meta')}]")
+_ITEM_PAIRS = _xpath(".//dl[normalize-space(@class)='pairs pairs--justified']")
+_ITEM_LABEL = _xpath(f".//span[{_cls('label')}]")
+_ITEM_START_DATE = _xpath(f".//li[{_cls('structItem-startDate')}]")
+_ITEM_TIME = _xpath(f".//time[{_cls('u-dt')}]")
+_ITEM_LATEST = _xpath(f".//div[{_cls('structItem-cell--latest')}]")
+_ITEM_ANY_USERNAME = _xpath(".//*[contains(@class, 'username')]")
+_ITEM_LATEST_DATE = _xpath(f".//time[{_cls('structItem-latestDate')}]")
+_ITEM_PINNED = _xpath(".//i[@title='Закреплено']")
+_ITEM_CLOSED = _xpath(".//i[@title='Закрыта']")
+_ALL_PAGE_NAV_PAGES = _xpath(f".//li[{_cls('pageNav-page')}]")
+_DIGITS = re.compile(r'\d+')
+
+
+def _required(xpath: etree.XPath, element):
+    """Поиск внутри элемента, без которого страницу разобрать нельзя"""
+    if element is None:
+        raise ParseError(f"На странице нет элемента, внутри которого ищется {xpath.path}")
+    return _first(xpath, element)
+
+
+def parse_category_threads(content_html: str) -> Dict:
+    """Разобрать страницу раздела (html.content в JSON-ответе /forums/{id}/page-N)
+
+    Returns:
+        Словарь (dict) со списком тем 'threads' и количеством страниц раздела 'pages_count'
+    """
+    root = _document(content_html)
+    result = []
+    seen_thread_ids = set()
+
+    for thread in _THREAD_ITEMS(root):
+        title_div = _first(_ITEM_TITLE, thread)
+        if title_div is None: continue
+        link_tags = _ITEM_LINKS(title_div)
+        if not link_tags: continue
+        link = link_tags[-1]
+
+        thread_ids = _DIGITS.findall(link.get('href', ''))
+        if not thread_ids: continue
+        thread_id = int(thread_ids[0])
+
+        if thread_id in seen_thread_ids:
+            continue
+        seen_thread_ids.add(thread_id)
+
+        minor_div = _required(_ITEM_MINOR, _first(_ITEM_MAIN, thread))
+        username_author_tag = _required(_ITEM_USERNAME, _first(_ITEM_PARTS, minor_div)) if minor_div is not None else None
+
+        meta_div = _first(_ITEM_META, thread)
+        post_count = _required(_DD, _first(_ITEM_PAIRS, meta_div)) if meta_div is not None else None
+
+        prefix_label = _first(_ITEM_LABEL, title_div)
+
+        start_date_li = _first(_ITEM_START_DATE, minor_div) if minor_div is not None else None
+        time_tag = _first(_ITEM_TIME, start_date_li) if start_date_li is not None else None
+        created_date = time_tag.get('title') if time_tag is not None else None
+        created_date_timestamp = time_tag.get('data-timestamp') if time_tag is not None else None
+
+        latest_cell = _first(_ITEM_LATEST, thread)
+        try:
+            last_message_username_tag = _required(_ITEM_ANY_USERNAME, _required(_ITEM_MINOR, latest_cell))
+        except ParseError:
+            last_message_username_tag = None
+
+        latest_date_tag = _first(_ITEM_LATEST_DATE, latest_cell) if latest_cell is not None else None
+        last_message_date = latest_date_tag.get('title') if latest_date_tag is not None else None
+        last_message_date_timestamp = latest_date_tag.get('data-timestamp') if latest_date_tag is not None else None
+
+        result.append({
+            'username_author': _text(username_author_tag).strip() if username_author_tag is not None else None,
+            'thread_title': _text(link).strip(),
+            'post_count': _text(post_count).strip() if post_count is not None else None,
+            'prefix': _text(prefix_label).strip() if prefix_label is not None else None,
+            'username_author_color': _username_color(username_author_tag),
+            'created_date': created_date if created_date else None,
+            'created_date_timestamp': int(created_date_timestamp) if created_date_timestamp and created_date_timestamp.isdigit() else None,
+            'username_last_message': _text(last_message_username_tag).strip() if last_message_username_tag is not None else None,
+            'username_last_message_color': _username_color(last_message_username_tag),
+            'last_message_date': last_message_date if last_message_date else None,
+            'last_message_date_timestamp': int(last_message_date_timestamp) if last_message_date_timestamp and last_message_date_timestamp.isdigit() else None,
+            'thread_id': thread_id,
+            'is_pinned': len(_ITEM_PINNED(thread)) > 0,
+            'is_closed': len(_ITEM_CLOSED(thread)) > 0
+        })
+
+    return {'threads': result, 'pages_count': _pages_count(_ALL_PAGE_NAV_PAGES, root)}
+
+
+# Уведомления
+_ALERTS = _xpath(f".//li[{_cls('js-alert')}]")
+_ALERT_USERNAME = _xpath(f".//a[{_cls('username')}]")
+_ALERT_FIGURE = _xpath(f".//div[{_cls('contentRow-figure')}]")
+_ALERT_AVATAR_IMG = _xpath(f".//img[{_cls('avatar')}]")
+_ALERT_AVATAR_SPAN = _xpath(f".//span[{_cls('avatar')}]")
+_ALERT_TIME = _xpath(f".//time[{_cls('u-dt')}]")
+_ALERT_TEXT = _xpath(f".//div[{_cls('contentRow-main')}]")
+_ALERT_LINK = _xpath(f".//a[{_cls('fauxBlockLink-blockLink')}]")
+
+
+def parse_notifications(html: str) -> List[Dict]:
+    """Разобрать страницу уведомлений /account/alerts"""
+    root = _document(html)
+    notifications = []
+
+    for alert in _ALERTS(root):
+        if alert.get('data-alert-id') is None:
+            continue
+
+        sender = None
+        username_link = _first(_ALERT_USERNAME, alert)
+        if username_link is not None:
+            sender_id_str = username_link.get('data-user-id', '0')
+            sender = {
+                'id': int(sender_id_str) if sender_id_str.isdigit() else 0,
+                'name': unescape(_stripped_text(username_link)),
+                'avatar': None,
+                'avatar_color': None,
+                'initials': None
+            }
+
+            avatar_container = _first(_ALERT_FIGURE, alert)
+            if avatar_container is not None:
+                avatar_img = _first(_ALERT_AVATAR_IMG, avatar_container)
+                avatar_span = _first(_ALERT_AVATAR_SPAN, avatar_container)
+
+                if avatar_img is not None and avatar_img.get('src') is not None:
+                    sender['avatar'] = avatar_img.get('src')
+                elif avatar_span is not None and 'avatar--default' in _classes(avatar_span):
+                    sender['avatar_color'] = avatar_span.get('style')
+                    sender['initials'] = unescape(_stripped_text(avatar_span))
+
+        time_tag = _first(_ALERT_TIME, alert)
+        timestamp = None
+        if time_tag is not None:
+            data_time = time_tag.get('data-time')
+            timestamp = {
+                'iso': time_tag.get('datetime'),
+                'unix': int(data_time) if data_time is not None and data_time.isdigit() else None
+            }
+
+        alert_text_container = _first(_ALERT_TEXT, alert)
+        link_tag = _first(_ALERT_LINK, alert)
+        link = link_tag.get('href') if link_tag is not None else None
+
+        notifications.append({
+            'id': alert.get('data-alert-id'),
+            'is_unread': 'is-unread' in _classes(alert),
+            'text': unescape(_stripped_text(alert_text_container, ' ')) if alert_text_container is not None else None,
+            'link': f"{MAIN_URL}{link}" if link and link.startswith('/') else link,
+            'sender': sender,
+            'timestamp': timestamp
+        })
+
+    return notifications
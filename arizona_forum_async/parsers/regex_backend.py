@@ -0,0 +1,143 @@
+import re
+from typing import Dict, List, Optional
+
+from arizona_forum_async.exceptions import ParseError
+
+
+# Быстрый путь для страниц, с которых нужны только ID: регулярные выражения по исходному HTML, без построения дерева.
+# Результат совпадает с soup_backend на разметке форума (XenForo всегда пишет атрибуты в двойных кавычках),
+# сверка - tests/test_parsers.py, замер скорости - benchmarks/parsers_benchmark.py. Для произвольного HTML используйте parser='bs4'.
+
+
+def _class_token(name: str) -> str:
+    return rf'(?<![\w-]){re.escape(name)}(?![\w-])'
+
+
+_POST_ID = re.compile(r'<article\b[^>]*?(?<![\w-])id="js-post-(\d+)"')
+_PROFILE_POST_ID = re.compile(r'<article\b[^>]*?(?<![\w-])id="js-profilePost-(\d+)"')
+_PAGE_NAV = re.compile(rf'<ul\b[^>]*?(?<![\w-])class="[^"]*{_class_token("pageNav-main")}[^"]*"[^>]*>(.*?)</ul>', re.S)
+_PAGE_NAV_PAGE = re.compile(rf'<li\b[^>]*?(?<![\w-])class="[^"]*{_class_token("pageNav-page")}[^"]*"[^>]*>(.*?)</li>', re.S)
+_TAG = re.compile(r'<[^>]*>')
+_DIGITS = re.compile(r'\d+')
+_HREF = re.compile(r'(?<![\w-])href="([^"]*)"')
+_LINK = re.compile(r'<a\b([^>]*)>')
+
+_HTML_TAG = re.compile(r'<html\b([^>]*)>')
+_LOGGED_IN = re.compile(r'(?<![\w-])data-logged-in="([^"]*)"')
+_SPAN = re.compile(r'<span\b([^>]*)>')
+_CLASS = re.compile(r'(?<![\w-])class="([^"]*)"')
+_USER_ID = re.compile(r'(?<![\w-])data-user-id="([^"]*)"')
+_CONTAINER_KEY = re.compile(r'(?<![\w-])data-container-key="node-(\d+)"')
+
+_THREAD_ITEM = re.compile(r'<div\b[^>]*?(?<![\w-])class="[^"]*structItem structItem--thread[^"]*"')
+_THREAD_TITLE = re.compile(rf'<div\b[^>]*?(?<![\w-])class="[^"]*{_class_token("structItem-title")}[^"]*"[^>]*>(.*?)</div>', re.S)
+_PINNED = re.compile(r'<i\b[^>]*?(?<![\w-])title="Закреплено"')
+
+_FORUM_NODE = re.compile(r'<div\b[^>]*?(?<![\w-])class="[^"]*node node--id[^"]*"')
+_NODE_TITLE = re.compile(rf'<h3\b[^>]*?(?<![\w-])class="[^"]*{_class_token("node-title")}[^"]*"[^>]*>(.*?)</h3>', re.S)
+_SUBFORUM_NODE = re.compile(r'<div\b[^>]*?(?<![\w-])class="[^"]*node--depth2 node--forum[^"]*"')
+
+
+def _chunks(pattern: re.Pattern, content_html: str) -> List[str]:
+    """Разрезать страницу на блоки, каждый начинается с совпадения pattern и идет до следующего"""
+    starts = [match.start() for match in pattern.finditer(content_html)]
+    return [content_html[start:end] for start, end in zip(starts, starts[1:] + [len(content_html)])]
+
+
+def _last_link_id(block: str) -> 'int | None':
+    links = _LINK.findall(block)
+    if not links:
+        return None
+    href = _HREF.search(links[-1])
+    ids = _DIGITS.findall(href.group(1)) if href else []
+    return int(ids[0]) if ids else None
+
+
+def parse_account_page(html: str) -> Dict:
+    """Статус авторизации и ID текущего пользователя с полной страницы форума (например /account/).
+    Страница без data-logged-in="true" в теге html считается страницей без авторизации"""
+    html_tag = _HTML_TAG.search(html)
+    logged_in = _LOGGED_IN.search(html_tag.group(1)) if html_tag else None
+
+    user_id = ''
+    for attributes in _SPAN.findall(html):
+        classes = _CLASS.search(attributes)
+        if classes and 'avatar--xxs' in classes.group(1).split():
+            found = _USER_ID.search(attributes)
+            user_id = found.group(1) if found else ''
+            break
+
+    return {
+        'logged_in': bool(logged_in) and logged_in.group(1) == "true",
+        'user_id': int(user_id) if user_id.isdigit() else None
+    }
+
+
+def parse_thread_post_ids(content_html: str) -> Dict:
+    """ID постов и количество страниц на странице темы (html.content в JSON-ответе)"""
+    pages_count = 1
+    page_nav = _PAGE_NAV.search(content_html)
+    if page_nav:
+        pages = _PAGE_NAV_PAGE.findall(page_nav.group(1))
+        try:
+            pages_count = int(_TAG.sub('', pages[-1]))
+        except (IndexError, ValueError):
+            pages_count = 1
+
+    return {'post_ids': _POST_ID.findall(content_html), 'pages_count': pages_count}
+
+
+def parse_first_post_id(html: str) -> Optional[int]:
+    """ID первого поста на странице темы. None - постов на странице нет"""
+    post_id = _POST_ID.search(html)
+    return int(post_id.group(1)) if post_id else None
+
+
+def parse_thread_category_id(html: str) -> Optional[int]:
+    """ID раздела темы из data-container-key полной страницы темы. None - ключа нет или он не указывает на раздел"""
+    html_tag = _HTML_TAG.search(html)
+    container_key = _CONTAINER_KEY.search(html_tag.group(1)) if html_tag else None
+    return int(container_key.group(1)) if container_key else None
+
+
+def parse_profile_post_ids(content_html: str) -> List[int]:
+    """ID сообщений на странице профиля (html.content в JSON-ответе /members/{id}/page-N)"""
+    return [int(post_id) for post_id in _PROFILE_POST_ID.findall(content_html)]
+
+
+def parse_category_thread_ids(content_html: str) -> Dict[str, List[int]]:
+    """ID закрепленных и обычных тем на странице раздела"""
+    result = {'pins': [], 'unpins': []}
+    for block in _chunks(_THREAD_ITEM, content_html):
+        title = _THREAD_TITLE.search(block)
+        if title is None:
+            raise ParseError("У темы на странице раздела нет заголовка (structItem-title)")
+        thread_id = _last_link_id(title.group(1))
+        if thread_id is None: continue
+        result['pins' if _PINNED.search(block) else 'unpins'].append(thread_id)
+    return result
+
+
+def parse_forum_ids(content_html: str) -> List[int]:
+    """ID разделов на странице категории (/categories/{id})"""
+    result = []
+    for block in _chunks(_FORUM_NODE, content_html):
+        title = _NODE_TITLE.search(block)
+        if title is None:
+            raise ParseError("У раздела на странице категории нет заголовка (node-title)")
+        forum_id = _last_link_id(title.group(1))
+        if forum_id is not None:
+            result.append(forum_id)
+    return result
+
+
+def parse_subforum_ids(content_html: str) -> List[int]:
+    """ID подразделов на странице раздела"""
+    categories = []
+    for block in _chunks(_SUBFORUM_NODE, content_html):
+        link = _LINK.search(block)
+        href = _HREF.search(link.group(1)) if link else None
+        ids = _DIGITS.findall(href.group(1)) if href else []
+        if ids:
+            categories.append(int(ids[0]))
+    return categories
@@ -0,0 +1,159 @@
+import re
+from typing import Dict, List
+
+from selectolax.lexbor import LexborHTMLParser
+
+from arizona_forum_async.consts import ROLE_COLOR
+from arizona_forum_async.exceptions import ParseError
+
+
+# Самые частые страницы (сообщения темы и список тем раздела) через selectolax (lexbor) и CSS-селекторы.
+# Остальные функции берутся из lxml_backend и soup_backend.
+
+
+def _username_color(username_tag) -> str:
+    if username_tag is not None:
+        markup = username_tag.html
+        for style, color in ROLE_COLOR.items():
+            if style in markup:
+                return color
+    return '#fff'
+
+
+def _text(node) -> str:
+    return node.text(deep=True)
+
+
+def _pages_count(nodes) -> int:
+    try:
+        return int(_text(nodes[-1]))
+    except (IndexError, ValueError):
+        return 1
+
+
+def parse_thread_messages(content_html: str) -> List[Dict]:
+    """Краткая информация о сообщениях на странице темы: ID и автор"""
+    tree = LexborHTMLParser(content_html)
+    return [
+        {'id': int(post.attributes['data-content'].split('-')[-1]), 'author': post.attributes['data-author']}
+        for post in tree.css('article.message')
+    ]
+
+
+def parse_thread_post_ids(content_html: str) -> Dict:
+    """ID постов и количество страниц на странице темы (html.content в JSON-ответе)"""
+    tree = LexborHTMLParser(content_html)
+
+    pages_count = 1
+    page_nav = tree.css_first('ul.pageNav-main')
+    if page_nav is not None:
+        pages_count = _pages_count(page_nav.css('li.pageNav-page'))
+
+    return {
+        'post_ids': [post.attributes['id'].strip('js-post-') for post in tree.css('article[id*="js-post"]')],
+        'pages_count': pages_count
+    }
+
+
+_MESSAGE_POST = re.compile(r'\bmessage--post\b')
+
+
+def parse_post_activity(content_html: str) -> List[Dict]:
+    """Автор и время отправки (UNIX) каждого сообщения на странице темы. Сообщения без времени пропускаются"""
+    tree = LexborHTMLParser(content_html)
+    result = []
+    for post_article in tree.css('article[class*="message--post"]'):
+        if not _MESSAGE_POST.search(' '.join((post_article.attributes.get('class') or '').split())):
+            continue
+
+        post_time_tag = post_article.css_first('time.u-dt[data-time]')
+        if post_time_tag is None or not (post_time_tag.attributes.get('data-time') or '').isdigit():
+            continue
+
+        post_author_tag = post_article.css_first('a.username[data-user-id]')
+        result.append({
+            'author': _text(post_author_tag).strip() if post_author_tag is not None else "Неизвестный автор",
+            'timestamp': int(post_time_tag.attributes['data-time'])
+        })
+    return result
+
+
+_DIGITS = re.compile(r'\d+')
+
+
+def _required(node, selector: str):
+    """Поиск внутри элемента, без которого страницу разобрать нельзя"""
+    if node is None:
+        raise ParseError(f"На странице нет элемента, внутри которого ищется {selector}")
+    return node.css_first(selector)
+
+
+def _timestamp(value) -> 'int | None':
+    return int(value) if value and value.isdigit() else None
+
+
+def parse_category_threads(content_html: str) -> Dict:
+    """Разобрать страницу раздела (html.content в JSON-ответе /forums/{id}/page-N)
+
+    Returns:
+        Словарь (dict) со списком тем 'threads' и количеством страниц раздела 'pages_count'
+    """
+    tree = LexborHTMLParser(content_html)
+    result = []
+    seen_thread_ids = set()
+
+    for thread in tree.css('div[class*="structItem structItem--thread"]'):
+        title_div = thread.css_first('div.structItem-title')
+        if title_div is None: continue
+        link_tags = title_div.css('a')
+        if not link_tags: continue
+        link = link_tags[-1]
+
+        thread_ids = _DIGITS.findall(link.attributes.get('href') or '')
+        if not thread_ids: continue
+        thread_id = int(thread_ids[0])
+
+        if thread_id in seen_thread_ids:
+            continue
+        seen_thread_ids.add(thread_id)
+
+        minor_div = _required(thread.css_first('div.structItem-cell--main'), 'div.structItem-minor')
+        username_author_tag = _required(minor_div.css_first('ul.structItem-parts'), 'a.username') if minor_div is not None else None
+
+        meta_div = thread.css_first('div.structItem-cell--meta')
+        post_count = _required(meta_div.css_first('dl[class="pairs pairs--justified"]'), 'dd') if meta_div is not None else None
+
+        prefix_label = title_div.css_first('span.label')
+
+        time_tag = minor_div.css_first('li.structItem-startDate time.u-dt') if minor_div is not None else None
+        created_date = time_tag.attributes.get('title') if time_tag is not None else None
+        created_date_timestamp = time_tag.attributes.get('data-timestamp') if time_tag is not None else None
+
+        latest_cell = thread.css_first('div.structItem-cell--latest')
+        try:
+            last_message_username_tag = _required(_required(latest_cell, 'div.structItem-minor'), '[class*="username"]')
+        except ParseError:
+            last_message_username_tag = None
+
+        latest_date_tag = latest_cell.css_first('time.structItem-latestDate') if latest_cell is not None else None
+        last_message_date = latest_date_tag.attributes.get('title') if latest_date_tag is not None else None
+        last_message_date_timestamp = latest_date_tag.attributes.get('data-timestamp') if latest_date_tag is not None else None
+
+        result.append({
+            'username_author': _text(username_author_tag).strip() if username_author_tag is not None else None,
+            'thread_title': _text(link).strip(),
+            'post_count': _text(post_count).strip() if post_count is not None else None,
+            'prefix': _text(prefix_label).strip() if prefix_label is not None else None,
+            'username_author_color': _username_color(username_author_tag),
+            'created_date': created_date if created_date else None,
+            'created_date_timestamp': _timestamp(created_date_timestamp),
+            'username_last_message': _text(last_message_username_tag).strip() if last_message_username_tag is not None else None,
+            'username_last_message_color': _username_color(last_message_username_tag),
+            'last_message_date': last_message_date if last_message_date else None,
+            'last_message_date_timestamp': _timestamp(last_message_date_timestamp),
+            'thread_id': thread_id,
+            'is_pinned': thread.css_first('i[title="Закреплено"]') is not None,
+            'is_closed': thread.css_first('i[title="Закрыта"]') is not None
+        })
+
+    return {'threads': result, 'pages_count': _pages_count(tree.css('li.pageNav-page'))}
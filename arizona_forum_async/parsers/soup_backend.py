@@ -0,0 +1,719 @@
+import re
+from bs4 import BeautifulSoup
+from html import unescape
+from re import compile
+from typing import Dict, List, Optional
+
+from arizona_forum_async.consts import MAIN_URL, ROLE_COLOR
+from arizona_forum_async.exceptions import ParseError
+
+
+def parse_account_page(html: str) -> Dict:
+    """Статус авторизации и ID текущего пользователя с полной страницы форума (например /account/).
+    Страница без data-logged-in="true" в теге html считается страницей без авторизации"""
+    soup = BeautifulSoup(html, 'lxml')
+    html_tag = soup.find('html')
+    avatar_span = soup.find('span', {'class': 'avatar--xxs'})
+    user_id = avatar_span.get('data-user-id', '') if avatar_span else ''
+    return {
+        'logged_in': bool(html_tag) and html_tag.get('data-logged-in') == "true",
+        'user_id': int(user_id) if user_id.isdigit() else None
+    }
+
+
+def parse_member(content_html: str, user_id: int) -> Dict:
+    """Разобрать профиль пользователя (html.content в JSON-ответе /members/{id})"""
+    soup = BeautifulSoup(content_html, 'lxml')
+
+    activity_tag = soup.find('dd', {'dir': 'auto'})
+    activity = activity_tag.get_text(strip=False).strip('\n') if activity_tag else None
+
+    username_color = _username_color(soup.find('span', class_='username'))
+
+    roles = []
+    roles_container = soup.find('div', {'class': 'memberHeader-banners'})
+    if roles_container:
+        banners = roles_container.find_all('em', class_='userBanner')
+        for banner in banners:
+            roles.append(banner.get_text(strip=True))
+
+    user_title_tag = soup.find('span', {'class': 'userTitle'})
+    user_title = user_title_tag.text if user_title_tag else None
+
+    avatar_tag = soup.find('a', {'class': 'avatar avatar--l'})
+    avatar = MAIN_URL + avatar_tag['href'] if avatar_tag and avatar_tag.has_attr('href') else None
+
+    messages_count = 0
+    reactions_count = 0
+    trophies_count = 0
+
+    try:
+        msg_tag = soup.find('a', {'href': f'/search/member?user_id={user_id}'})
+        if msg_tag: messages_count = int(msg_tag.text.strip().replace(',', ''))
+    except (AttributeError, ValueError): pass
+
+    try:
+        react_tag = soup.find('dl', {'class': 'pairs pairs--rows pairs--rows--centered'})
+        if react_tag:
+            dd_tag = react_tag.find('dd')
+            if dd_tag: reactions_count = int(dd_tag.text.strip().replace(',', ''))
+    except (AttributeError, ValueError): pass
+
+    try:
+        trophy_tag = soup.find('a', {'href': f'/members/{user_id}/trophies'})
+        if trophy_tag: trophies_count = int(trophy_tag.text.strip().replace(',', ''))
+    except (AttributeError, ValueError): pass
+
+    return {
+        'user_title': user_title,
+        'avatar': avatar,
+        'roles': roles,
+        'activity': activity,
+        'messages_count': messages_count,
+        'reactions_count': reactions_count,
+        'trophies_count': trophies_count,
+        'username_color': username_color
+    }
+
+
+def _message_roles(post) -> List[str]:
+    roles = []
+    roles_container = post.find('div', {'class': 'message-userDetails'})
+    if roles_container:
+        banners = roles_container.find_all('div', class_='userBanner')
+        for banner in banners:
+            roles.append(banner.get_text(strip=True))
+    return roles
+
+
+def parse_thread_messages(content_html: str) -> List[Dict]:
+    """Краткая информация о сообщениях на странице темы: ID и автор"""
+    soup = BeautifulSoup(content_html, 'lxml')
+    return [
+        {'id': int(post['data-content'].split('-')[-1]), 'author': post['data-author']}
+        for post in soup.find_all('article', {'class': 'message'})
+    ]
+
+
+def parse_thread_post_ids(content_html: str) -> Dict:
+    """ID постов и количество страниц на странице темы (html.content в JSON-ответе)"""
+    soup = BeautifulSoup(content_html, 'lxml')
+    posts = soup.find_all('article', {'id': compile('js-post-*')})
+
+    pages_count = 1
+    try:
+        page_nav = soup.find('ul', class_='pageNav-main')
+        if page_nav:
+            last_page_li = page_nav.find_all('li', class_='pageNav-page')
+            if last_page_li:
+                pages_count = int(last_page_li[-1].text)
+    except (IndexError, AttributeError, ValueError, TypeError):
+        pages_count = 1
+
+    return {
+        'post_ids': [i['id'].strip('js-post-') for i in posts if 'id' in i.attrs],
+        'pages_count': pages_count
+    }
+
+
+def parse_profile_post_ids(content_html: str) -> List[int]:
+    """ID сообщений на странице профиля (html.content в JSON-ответе /members/{id}/page-N)"""
+    soup = BeautifulSoup(content_html, "lxml")
+    messages = []
+    for post in soup.find_all('article', {'id': compile('js-profilePost-*')}):
+        post_id_str = post.get('id', '').strip('js-profilePost-')
+        if post_id_str.isdigit():
+            messages.append(int(post_id_str))
+    return messages
+
+
+def parse_first_post_id(html: str) -> Optional[int]:
+    """ID первого поста на странице темы. None - постов на странице нет"""
+    soup = BeautifulSoup(html, 'lxml')
+    post_article = soup.find('article', {'id': compile('js-post-*')})
+    post_id = post_article['id'].strip('js-post-') if post_article and 'id' in post_article.attrs else ''
+    return int(post_id) if post_id.isdigit() else None
+
+
+def parse_profile_post(html: str, post_id: int) -> Optional[Dict]:
+    """Разобрать страницу /profile-posts/{id}: автора, владельца профиля, дату и текст сообщения
+
+    Returns:
+        Словарь (dict) с данными сообщения или None, если сообщение не найдено.
+        creator_id и profile_id равны None, если на странице нет ссылки на пользователя
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    post_article = soup.find('article', {'id': f'js-profilePost-{post_id}'})
+    if post_article is None:
+        return None
+
+    creator_tag = post_article.find('a', {'class': 'username'})
+    creator_id = int(creator_tag['data-user-id']) if creator_tag and creator_tag.get('data-user-id', '').isdigit() else None
+
+    profile_id = None
+    profile_owner_tag = post_article.find('h4', {'class': 'attribution'})
+    if profile_owner_tag:
+        profile_link = profile_owner_tag.find('a', {'class': 'username'})
+        if profile_link and profile_link.get('data-user-id', '').isdigit():
+            profile_id = int(profile_link['data-user-id'])
+
+    create_date_tag = post_article.find('time')
+    data_time_value = create_date_tag.get('data-time', '') if create_date_tag else ''
+
+    html_content_tag = post_article.find('div', {'class': 'bbWrapper'})
+    return {
+        'creator_id': creator_id,
+        'profile_id': profile_id,
+        'create_date': int(data_time_value) if data_time_value.isdigit() else 0,
+        'html_content': str(html_content_tag) if html_content_tag else "",
+        'text_content': html_content_tag.text if html_content_tag else ""
+    }
+
+
+def parse_thread_page(content_html: str, h1_html: str) -> Dict:
+    """Разобрать первую страницу темы
+
+    Attributes:
+        content_html (str): HTML содержимого страницы (html.content в JSON-ответе)
+        h1_html (str): HTML заголовка темы (html.h1 в JSON-ответе)
+
+    Returns:
+        Словарь (dict) с данными темы. creator_id равен None, если создатель не найден
+    """
+    content_soup = BeautifulSoup(content_html, 'lxml')
+    content_h1_soup = BeautifulSoup(h1_html, 'lxml')
+
+    creator_id = None
+    creator_name = None
+    creator_tag = content_soup.find('a', {'class': 'username'})
+    if creator_tag and creator_tag.has_attr('data-user-id'):
+        creator_id = int(creator_tag['data-user-id'])
+        creator_name = creator_tag.text
+
+    create_date_tag = content_soup.find('time')
+    create_date = 0
+    if create_date_tag and create_date_tag.has_attr('title'):
+        title_value = create_date_tag['title']
+        if title_value:
+            create_date = str(title_value)
+
+    create_date_timestamp = 0
+    if create_date_tag and create_date_tag.has_attr('data-timestamp'):
+        data_timestamp_value = create_date_tag['data-timestamp']
+        if data_timestamp_value:
+            create_date_timestamp = float(data_timestamp_value)
+
+    prefix_tag = content_h1_soup.find('span', {'class': 'label'})
+    if prefix_tag:
+        prefix = prefix_tag.text
+        title = content_h1_soup.text.strip().replace(prefix, "").strip()
+    else:
+        prefix = ""
+        title = content_h1_soup.text.strip()
+
+    thread_html_content_tag = content_soup.find('div', {'class': 'bbWrapper'})
+    thread_html_content = str(thread_html_content_tag) if thread_html_content_tag else ""
+    thread_content = thread_html_content_tag.text if thread_html_content_tag else ""
+
+    try:
+        pages_count = int(content_soup.find_all('li', {'class': 'pageNav-page'})[-1].text)
+    except (IndexError, AttributeError, ValueError):
+        pages_count = 1
+
+    messages = []
+    first_admpost_id = 0
+    first_admpost_author = None
+    for post in content_soup.find_all('article', {'class': 'message'}):
+        post_id = int(post['data-content'].split('-')[-1])
+        messages.append({'id': post_id, 'author': post['data-author']})
+        if not first_admpost_author and 'Тех. Администратор' in _message_roles(post):
+            first_admpost_id = post_id
+            first_admpost_author = post['data-author']
+
+    is_closed = bool(content_soup.find('dl', {'class': 'blockStatus'}))
+
+    post_article_tag = content_soup.find('article', {'id': compile(r'js-post-\d+')})
+    thread_post_id = int(post_article_tag['id'].strip('js-post-')) if post_article_tag and post_article_tag.has_attr('id') else 0
+
+    return {
+        'creator_id': creator_id,
+        'creator_name': creator_name,
+        'create_date': create_date,
+        'create_date_timestamp': create_date_timestamp,
+        'title': title,
+        'prefix': prefix,
+        'html_content': thread_html_content,
+        'text_content': thread_content,
+        'pages_count': pages_count,
+        'messages': messages,
+        'first_admpost_id': first_admpost_id,
+        'first_admpost_author': first_admpost_author,
+        'thread_post_id': thread_post_id,
+        'is_closed': is_closed
+    }
+
+
+def _username_color(username_tag) -> str:
+    if username_tag:
+        for style, color in ROLE_COLOR.items():
+            if style in str(username_tag):
+                return color
+    return '#fff'
+
+
+def _post_article_data(post_article, creator_id: int = None) -> Optional[Dict]:
+    creator_info_tag = post_article.find('a', {'data-xf-init': 'member-tooltip'})
+    if not creator_info_tag or not creator_info_tag.has_attr('data-user-id'):
+        if creator_id is None:
+            return None
+        creator_info_tag = None
+
+    user_details = post_article.find('div', {'class': 'message-userDetails'})
+    user_title_tag = user_details.find(class_='userTitle') if user_details else None
+    avatar_img = post_article.find('img', {'class': compile('avatar')})
+    avatar = avatar_img.get('src') if avatar_img else None
+    if avatar and avatar.startswith('/'):
+        avatar = MAIN_URL + avatar
+
+    create_date_tag = post_article.find('time', {'class': 'u-dt'})
+    create_date = 0
+    if create_date_tag and create_date_tag.has_attr('title'):
+        title_value = create_date_tag['title']
+        if title_value:
+            create_date = str(title_value)
+
+    create_date_timestamp = 0
+    if create_date_tag and create_date_tag.has_attr('data-timestamp'):
+        data_timestamp_value = create_date_tag['data-timestamp']
+        if data_timestamp_value:
+            create_date_timestamp = float(data_timestamp_value)
+
+    html_content_tag = post_article.find('div', {'class': 'bbWrapper'})
+    html_content = str(html_content_tag) if html_content_tag else ""
+    if html_content_tag:
+        for iframe in html_content_tag.find_all("iframe"):
+            src = iframe.get("src")
+            if src:
+                iframe.replace_with(f"\n{src}\n")
+
+        for img in html_content_tag.find_all("img"):
+            img_url = img.get("data-url") or img.get("src")
+            if img_url:
+                img.replace_with(img_url)
+
+        for a in html_content_tag.find_all("a", href=True):
+            url = a["href"]
+            text = a.get_text(strip=True)
+
+            if text and text != url:
+                a.replace_with(f"{text} ({url})")
+            else:
+                a.replace_with(url)
+
+        text_content = html_content_tag.get_text(separator=" ", strip=True)
+        text_content = re.sub(r'\s+', ' ', text_content)
+    else:
+        text_content = ""
+
+    return {
+        'creator_id': int(creator_info_tag['data-user-id']) if creator_info_tag else creator_id,
+        'creator_name': creator_info_tag.get_text(strip=True) if creator_info_tag else post_article.get('data-author'),
+        'creator_title': user_title_tag.get_text(strip=True) if user_title_tag else None,
+        'creator_avatar': avatar,
+        'creator_roles': _message_roles(post_article),
+        'creator_color': _username_color(creator_info_tag),
+        'create_date': create_date,
+        'create_date_timestamp': create_date_timestamp,
+        'html_content': html_content,
+        'text_content': text_content
+    }
+
+
+def _thread_header(soup) -> Dict:
+    """Данные темы из шапки полной HTML-страницы форума (тема или пост в ней)"""
+    html_tag = soup.find('html')
+    thread_id = None
+    category_id = None
+    if html_tag:
+        content_key = html_tag.get('data-content-key', '')
+        if content_key.startswith('thread-') and content_key[len('thread-'):].isdigit():
+            thread_id = int(content_key[len('thread-'):])
+        container_key = html_tag.get('data-container-key', '')
+        if container_key.startswith('node-') and container_key[len('node-'):].isdigit():
+            category_id = int(container_key[len('node-'):])
+
+    prefix = ""
+    title = ""
+    title_tag = soup.find(class_='p-title-value')
+    if title_tag:
+        prefix_tag = title_tag.find('span', {'class': 'label'})
+        prefix = prefix_tag.text if prefix_tag else ""
+        title = title_tag.text.strip().replace(prefix, "").strip() if prefix else title_tag.text.strip()
+
+    return {
+        'thread_id': thread_id,
+        'category_id': category_id,
+        'title': title,
+        'prefix': prefix,
+        'is_closed': bool(soup.find('dl', {'class': 'blockStatus'}))
+    }
+
+
+def parse_post_page(html: str, post_id: int) -> Optional[Dict]:
+    """Разобрать страницу /posts/{id}: сообщение, его автора и тему, в которой оно оставлено
+
+    Returns:
+        Словарь (dict) с данными поста и ключом 'thread' с данными темы или None, если пост не найден
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    post_article = soup.find('article', {'id': f'js-post-{post_id}'})
+    if post_article is None:
+        return None
+
+    data = _post_article_data(post_article)
+    if data is None:
+        return None
+    data['thread'] = _thread_header(soup)
+    return data
+
+
+def parse_thread_posts(content_html: str, h1_html: str = '') -> Dict:
+    """Разобрать все сообщения на странице темы (html.content и html.h1 в JSON-ответе)
+
+    Returns:
+        Словарь (dict) со списком сообщений 'posts', количеством страниц, заголовком, префиксом и статусом закрытия темы
+    """
+    soup = BeautifulSoup(content_html, 'lxml')
+
+    posts = []
+    for article in soup.find_all('article', {'class': 'message'}):
+        if not article.has_attr('data-content'):
+            continue
+        data = _post_article_data(article)
+        if data is None:
+            user_tag = article.find(attrs={'data-user-id': True})
+            if user_tag is None:
+                continue
+            data = _post_article_data(article, int(user_tag['data-user-id']))
+        data['id'] = int(article['data-content'].split('-')[-1])
+        if article.has_attr('data-author'):
+            data['creator_name'] = article['data-author']
+        posts.append(data)
+
+    try:
+        pages_count = int(soup.find_all('li', {'class': 'pageNav-page'})[-1].text)
+    except (IndexError, AttributeError, ValueError):
+        pages_count = 1
+
+    h1_soup = BeautifulSoup(h1_html, 'lxml')
+    prefix_tag = h1_soup.find('span', {'class': 'label'})
+    prefix = prefix_tag.text if prefix_tag else ""
+    title = h1_soup.text.strip().replace(prefix, "").strip() if prefix else h1_soup.text.strip()
+
+    return {
+        'posts': posts,
+        'pages_count': pages_count,
+        'title': title,
+        'prefix': prefix,
+        'is_closed': bool(soup.find('dl', {'class': 'blockStatus'}))
+    }
+
+
+def parse_thread_category_id(html: str) -> Optional[int]:
+    """ID раздела темы из data-container-key полной страницы темы. None - ключа нет или он не указывает на раздел"""
+    return _thread_header(BeautifulSoup(html, 'lxml'))['category_id']
+
+
+def _required(tag, name: str, *args, **kwargs):
+    """Поиск внутри элемента, без которого страницу разобрать нельзя"""
+    if tag is None:
+        raise ParseError(f"На странице нет элемента, внутри которого ищется {' '.join([name, *map(str, args)])}")
+    return tag.find(name, *args, **kwargs)
+
+
+def parse_category_thread_ids(content_html: str) -> Dict[str, List[int]]:
+    """ID закрепленных и обычных тем на странице раздела"""
+    soup = BeautifulSoup(content_html, "lxml")
+    result = {'pins': [], 'unpins': []}
+    for thread in soup.find_all('div', class_=re.compile('structItem structItem--thread.*')):
+        title_div = thread.find('div', {"class": "structItem-title"})
+        if title_div is None:
+            raise ParseError("У темы на странице раздела нет заголовка (structItem-title)")
+        link_tags = title_div.find_all("a")
+        if not link_tags: continue
+        link = link_tags[-1]
+        thread_ids = re.findall(r'\d+', link.get('href', ''))
+        if not thread_ids: continue
+
+        thread_id = int(thread_ids[0])
+        if thread.find_all('i', {'title': 'Закреплено'}):
+            result['pins'].append(thread_id)
+        else:
+            result['unpins'].append(thread_id)
+    return result
+
+
+def parse_forum_ids(content_html: str) -> List[int]:
+    """ID разделов на странице категории (/categories/{id})"""
+    soup = BeautifulSoup(content_html, "lxml")
+    result = []
+    for forum in soup.find_all('div', class_=re.compile('node node--id.*')):
+        title_tag = forum.find('h3', {"class": "node-title"})
+        if title_tag is None:
+            raise ParseError("У раздела на странице категории нет заголовка (node-title)")
+        link_tags = title_tag.find_all("a")
+        if not link_tags: continue
+        link = link_tags[-1]
+        forum_ids = re.findall(r'\d+', link.get('href', ''))
+        if not forum_ids: continue
+        result.append(int(forum_ids[0]))
+    return result
+
+
+def parse_subforum_ids(content_html: str) -> List[int]:
+    """ID подразделов на странице раздела"""
+    soup = BeautifulSoup(content_html, "lxml")
+    categories = []
+    for category_div in soup.find_all('div', compile('.*node--depth2 node--forum.*')):
+        link = category_div.find("a")
+        if link and link.get('href'):
+            ids = re.findall(r'\d+', link['href'])
+            if ids:
+                categories.append(int(ids[0]))
+    return categories
+
+
+def parse_category_pages_count(content_html: str) -> int:
+    """Количество страниц раздела (html.content в JSON-ответе /forums/{id})"""
+    soup = BeautifulSoup(content_html, 'lxml')
+    try:
+        return int(soup.find_all('li', {'class': 'pageNav-page'})[-1].text)
+    except (IndexError, ValueError):
+        return 1
+
+
+def parse_parent_category_id(html: str) -> Optional[int]:
+    """ID родительского раздела по последней ссылке в навигационной цепочке (p-breadcrumbs) полной страницы раздела"""
+    soup = BeautifulSoup(html, 'lxml')
+    breadcrumbs = soup.find('ul', {'class': 'p-breadcrumbs'})
+    if not breadcrumbs: return None
+    parent_li = breadcrumbs.find_all('li')
+    if len(parent_li) < 2: return None
+    parent_link = parent_li[-1].find('a')
+    if not parent_link or not parent_link.get('href'): return None
+
+    href_parts = parent_link['href'].split('/')
+    if len(href_parts) < 3 or not href_parts[2].isdigit():
+        return None
+    return int(href_parts[2])
+
+
+def parse_category_threads(content_html: str) -> Dict:
+    """Разобрать страницу раздела (html.content в JSON-ответе /forums/{id}/page-N)
+
+    Returns:
+        Словарь (dict) со списком тем 'threads' и количеством страниц раздела 'pages_count'
+    """
+    soup = BeautifulSoup(content_html, "lxml")
+    result = []
+    seen_thread_ids = set()
+
+    for thread in soup.find_all('div', class_=compile('structItem structItem--thread.*')):
+        title_div = thread.find('div', "structItem-title")
+        if not title_div: continue
+        link_tags = title_div.find_all("a")
+        if not link_tags: continue
+        link = link_tags[-1]
+
+        thread_ids = re.findall(r'\d+', link.get('href', ''))
+        if not thread_ids: continue
+        thread_id = int(thread_ids[0])
+
+        if thread_id in seen_thread_ids:
+            continue
+        seen_thread_ids.add(thread_id)
+
+        thread_data = {}
+
+        minor_div = _required(thread.find('div', 'structItem-cell--main'), 'div', 'structItem-minor')
+        username_author_tag = _required(minor_div.find('ul', 'structItem-parts'), 'a', class_='username') if minor_div else None
+        thread_data['username_author'] = username_author_tag.text.strip() if username_author_tag else None
+        thread_data['thread_title'] = link.text.strip()
+
+        meta_div = thread.find('div', 'structItem-cell--meta')
+        post_count = _required(meta_div.find('dl', 'pairs pairs--justified'), 'dd') if meta_div else None
+        thread_data["post_count"] = post_count.text.strip() if post_count else None
+
+        prefix_label = title_div.find('span', class_='label')
+        thread_data['prefix'] = prefix_label.text.strip() if prefix_label else None
+
+        thread_data['username_author_color'] = _username_color(username_author_tag)
+
+        start_date_li = minor_div.find('li', 'structItem-startDate') if minor_div else None
+        time_tag = start_date_li.find('time', class_='u-dt') if start_date_li else None
+        created_date = time_tag.get('title') if time_tag else None
+        created_date_timestamp = time_tag.get('data-timestamp') if time_tag else None
+        thread_data['created_date'] = created_date if created_date else None
+        thread_data['created_date_timestamp'] = int(created_date_timestamp) if created_date_timestamp and created_date_timestamp.isdigit() else None
+
+        latest_cell = thread.find('div', 'structItem-cell--latest')
+        try:
+            last_message_minor = _required(latest_cell, 'div', 'structItem-minor')
+            last_message_username_tag = last_message_minor.find(class_=compile('username')) if last_message_minor else None
+        except ParseError:
+            last_message_username_tag = None
+        thread_data['username_last_message'] = last_message_username_tag.text.strip() if last_message_username_tag else None
+
+        thread_data['username_last_message_color'] = _username_color(last_message_username_tag)
+
+        latest_date_tag = latest_cell.find('time', class_='structItem-latestDate') if latest_cell else None
+        last_message_date = latest_date_tag.get('title') if latest_date_tag else None
+        last_message_date_timestamp = latest_date_tag.get('data-timestamp') if latest_date_tag else None
+        thread_data['last_message_date'] = last_message_date if last_message_date else None
+        thread_data['last_message_date_timestamp'] = int(last_message_date_timestamp) if last_message_date_timestamp and last_message_date_timestamp.isdigit() else None
+
+        thread_data['thread_id'] = thread_id
+        thread_data['is_pinned'] = len(thread.find_all('i', {'title': 'Закреплено'})) > 0
+        thread_data['is_closed'] = len(thread.find_all('i', {'title': 'Закрыта'})) > 0
+
+        result.append(thread_data)
+
+    try:
+        pages_count = int(soup.find_all('li', {'class': 'pageNav-page'})[-1].text)
+    except (IndexError, AttributeError, ValueError):
+        pages_count = 1
+
+    return {'threads': result, 'pages_count': pages_count}
+
+
+def parse_post_activity(content_html: str) -> List[Dict]:
+    """Автор и время отправки (UNIX) каждого сообщения на странице темы. Сообщения без времени пропускаются"""
+    soup = BeautifulSoup(content_html, 'lxml')
+    result = []
+    for post_article in soup.find_all('article', class_=re.compile(r'\bmessage--post\b')):
+        post_time_tag = post_article.find('time', class_='u-dt', attrs={'data-time': True})
+        if not post_time_tag or not post_time_tag.get('data-time', '').isdigit():
+            continue
+
+        post_author_tag = post_article.find('a', class_='username', attrs={'data-user-id': True})
+        result.append({
+            'author': post_author_tag.text.strip() if post_author_tag else "Неизвестный автор",
+            'timestamp': int(post_time_tag['data-time'])
+        })
+    return result
+
+
+def parse_notifications(html: str) -> List[Dict]:
+    """Разобрать страницу уведомлений /account/alerts"""
+    soup = BeautifulSoup(html, 'lxml')
+    notifications = []
+
+    for alert in soup.find_all('li', {'class': 'js-alert'}):
+        if not alert.has_attr('data-alert-id'):
+            continue
+
+        sender = None
+        username_link = alert.find('a', {'class': 'username'})
+        if username_link:
+            sender_id_str = username_link.get('data-user-id', '0')
+            sender = {
+                'id': int(sender_id_str) if sender_id_str.isdigit() else 0,
+                'name': unescape(username_link.get_text(strip=True)),
+                'avatar': None,
+                'avatar_color': None,
+                'initials': None
+            }
+
+            avatar_container = alert.find('div', class_='contentRow-figure')
+            if avatar_container:
+                avatar_img = avatar_container.find('img', {'class': 'avatar'})
+                avatar_span = avatar_container.find('span', {'class': 'avatar'})
+
+                if avatar_img and avatar_img.has_attr('src'):
+                    sender['avatar'] = avatar_img['src']
+                elif avatar_span and 'avatar--default' in avatar_span.get('class', []):
+                    sender['avatar_color'] = avatar_span.get('style')
+                    sender['initials'] = unescape(avatar_span.get_text(strip=True)) if avatar_span else None
+
+        time_tag = alert.find('time', {'class': 'u-dt'})
+        timestamp = None
+        if time_tag:
+            timestamp = {
+                'iso': time_tag.get('datetime'),
+                'unix': int(time_tag['data-time']) if time_tag and time_tag.has_attr('data-time') and time_tag['data-time'].isdigit() else None
+            }
+
+        alert_text_container = alert.find('div', {'class': 'contentRow-main'})
+        alert_text = unescape(alert_text_container.get_text(" ", strip=True)) if alert_text_container else None
+
+        link_tag = alert.find('a', {'class': 'fauxBlockLink-blockLink'})
+        link = link_tag['href'] if link_tag and link_tag.has_attr('href') else None
+
+        notifications.append({
+            'id': alert.get('data-alert-id'),
+            'is_unread': 'is-unread' in alert.get('class', []),
+            'text': alert_text,
+            'link': f"{MAIN_URL}{link}" if link and link.startswith('/') else link,
+            'sender': sender,
+            'timestamp': timestamp
+        })
+
+    return notifications
+
+
+def _statistic_count(soup, class_name: str) -> int:
+    try:
+        return int(soup.find('dl', {'class': f'pairs pairs--justified {class_name}'}).find('dd').text.replace(',', ''))
+    except (AttributeError, ValueError):
+        return 0
+
+
+def parse_forum_statistic(html: str) -> Dict:
+    """Разобрать статистику форума с главной страницы: количество тем, сообщений, пользователей и ID последнего зарегистрированного"""
+    soup = BeautifulSoup(html, 'lxml')
+
+    last_member_id = None
+    latest_member_dl = soup.find('dl', {'class': 'pairs pairs--justified'})
+    if latest_member_dl:
+        latest_member_link = latest_member_dl.find('a', {'data-user-id': True})
+        if latest_member_link and latest_member_link['data-user-id'].isdigit():
+            last_member_id = int(latest_member_link['data-user-id'])
+
+    return {
+        'threads_count': _statistic_count(soup, 'count--threads'),
+        'posts_count': _statistic_count(soup, 'count--messages'),
+        'users_count': _statistic_count(soup, 'count--users'),
+        'last_member_id': last_member_id
+    }
+
+
+def parse_search_results(html: str) -> List[Dict]:
+    """Разобрать страницу результатов поиска /search/"""
+    soup = BeautifulSoup(html, 'lxml')
+    results = []
+
+    for thread in soup.find_all('li', {'class': 'block-row'}):
+        title_link = thread.select_one('h3.contentRow-title a')
+        if not title_link:
+            continue
+
+        for sp in title_link.select('span.label, span.label-append'):
+            sp.extract()
+
+        date_tag = thread.find('time', {'class': 'u-dt'})
+        answers_tag = thread.find(string=re.compile('Ответы: '))
+        forum_tag = thread.find('a', href=re.compile('/forums/'))
+        snippet_tag = thread.find('div', {'class': 'contentRow-snippet'})
+
+        results.append({
+            'title': title_link.get_text(strip=True),
+            'author': thread.get('data-author'),
+            'thread_id': int(title_link['href'].split('/')[-2]),
+            'create_date': int(date_tag['data-timestamp']) if date_tag else None,
+            'answers_count': int(answers_tag.split(': ')[1]) if answers_tag else 0,
+            'forum': forum_tag.text if forum_tag else None,
+            'snippet': snippet_tag.text.strip() if snippet_tag else None,
+            'url': f"{MAIN_URL}{title_link['href']}",
+        })
+
+    return results
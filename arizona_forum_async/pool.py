@@ -0,0 +1,163 @@
+import asyncio
+from functools import wraps
+from typing import Any, AsyncIterator, Dict, List
+
+from arizona_forum_async.api import ArizonaAPI
+from arizona_forum_async.exceptions import IncorrectLoginData
+
+
+__all__ = ['ArizonaAPIPool', 'ITER_METHODS', 'READ_METHODS']
+
+
+READ_METHODS = (
+    'get_category', 'get_member', 'get_members', 'get_thread', 'get_post', 'get_profile_post', 'get_forum_statistic',
+    'get_category_forums', 'get_threads', 'get_thread_category_detail', 'get_parent_category_of_category',
+    'get_categories', 'get_profile_messages', 'get_thread_category', 'get_thread_posts', 'get_all_thread_posts',
+    'search_threads', 'search_members', 'get_category_statistics_threads', 'get_category_statistics_posts'
+)
+"""Методы ArizonaAPI только для чтения, которые ArizonaAPIPool распределяет между аккаунтами"""
+
+ITER_METHODS = ('iter_category_threads', 'iter_thread_post_ids', 'iter_thread_posts')
+"""Асинхронные генераторы ArizonaAPI для чтения. Весь обход идет через один аккаунт"""
+
+
+class ArizonaAPIPool:
+    def __init__(self, apis: List[ArizonaAPI]) -> None:
+        """
+        Несколько аккаунтов форума за одним интерфейсом чтения.
+
+        Каждый вызов get_thread, get_member, get_thread_category_detail и других методов из READ_METHODS уходит
+        в наименее загруженный исправный аккаунт. У каждого ArizonaAPI свой RateLimiter (если не передан общий),
+        поэтому пропускная способность растет вместе с количеством аккаунтов. Аккаунт выводится из ротации,
+        если при входе или во время вызова выясняется, что его cookie больше не действуют (IncorrectLoginData);
+        вызов тогда повторяется через другой аккаунт.
+
+        Объекты (Member, Thread и т.д.) привязаны к аккаунту, который их загрузил.
+
+        Args:
+            apis (list): Объекты ArizonaAPI, по одному на аккаунт
+        """
+        if not apis:
+            raise ValueError("Список аккаунтов пуст.")
+        self.apis = list(apis)
+        """**Все аккаунты пула**"""
+        self.disabled: List[ArizonaAPI] = []
+        """**Аккаунты, выведенные из ротации из-за недействительных cookie**"""
+        self._in_flight: Dict[ArizonaAPI, int] = {api: 0 for api in self.apis}
+        self._next = 0
+
+    @property
+    def active(self) -> List[ArizonaAPI]:
+        """Аккаунты в ротации"""
+        return [api for api in self.apis if api not in self.disabled]
+
+    async def connect(self) -> None:
+        """Подключить все аккаунты параллельно. Аккаунты с неверными cookie выводятся из ротации
+
+        Raises:
+            IncorrectLoginData: Не подключился ни один аккаунт
+        """
+        apis = self.active
+        results = await asyncio.gather(*(api.connect() for api in apis), return_exceptions=True)
+        for api, result in zip(apis, results):
+            if isinstance(result, IncorrectLoginData):
+                self._disable(api)
+            elif isinstance(result, BaseException):
+                raise result
+        if not self.active:
+            raise IncorrectLoginData("Ни один аккаунт пула не подключился.")
+
+    async def close(self) -> None:
+        """Закрыть сессии всех аккаунтов"""
+        await asyncio.gather(*(api.close() for api in self.apis))
+
+    def _disable(self, api: ArizonaAPI) -> None:
+        if api not in self.disabled:
+            self.disabled.append(api)
+            print(f"Аккаунт {api.current_member_id or '?'} выведен из ротации: cookie больше не действуют.")
+
+    def _acquire(self) -> ArizonaAPI:
+        """Наименее загруженный аккаунт. При равной загрузке аккаунты чередуются"""
+        active = self.active
+        if not active:
+            raise IncorrectLoginData("В пуле не осталось аккаунтов с действующими cookie.")
+        self._next = (self._next + 1) % len(active)
+        ordered = active[self._next:] + active[:self._next]
+        return min(ordered, key=lambda api: self._in_flight[api])
+
+    async def call(self, name: str, *args, **kwargs) -> Any:
+        """Вызвать метод ArizonaAPI на наименее загруженном аккаунте
+
+        Attributes:
+            name (str): Имя метода, например 'get_thread'
+            *args, **kwargs: Аргументы метода
+
+        Returns:
+            Результат метода
+        """
+        while True:
+            api = self._acquire()
+            self._in_flight[api] += 1
+            try:
+                result = await getattr(api, name)(*args, **kwargs)
+            except IncorrectLoginData:
+                self._disable(api)
+                continue
+            finally:
+                self._in_flight[api] -= 1
+            if not api.logged_in:
+                self._disable(api)
+                continue
+            return result
+
+    async def iterate(self, name: str, *args, **kwargs) -> AsyncIterator[Any]:
+        """Обойти асинхронный генератор ArizonaAPI на наименее загруженном аккаунте
+
+        Attributes:
+            name (str): Имя метода, например 'iter_thread_posts'
+            *args, **kwargs: Аргументы метода
+
+        Returns:
+            Асинхронный генератор с элементами метода
+        """
+        api = self._acquire()
+        self._in_flight[api] += 1
+        items = getattr(api, name)(*args, **kwargs)
+        try:
+            async for item in items:
+                yield item
+        finally:
+            self._in_flight[api] -= 1
+            await items.aclose()
+            if not api.logged_in:
+                self._disable(api)
+
+    @property
+    def stats(self) -> List[Dict]:
+        """Загрузка аккаунтов: ID пользователя, запросы в работе и в ротации ли аккаунт"""
+        return [
+            {'user_id': api.current_member_id, 'in_flight': self._in_flight[api], 'active': api not in self.disabled}
+            for api in self.apis
+        ]
+
+
+def _read_method(name: str):
+    @wraps(getattr(ArizonaAPI, name))
+    async def method(self: ArizonaAPIPool, *args, **kwargs):
+        return await self.call(name, *args, **kwargs)
+    method.__qualname__ = f'ArizonaAPIPool.{name}'
+    return method
+
+
+def _iter_method(name: str):
+    @wraps(getattr(ArizonaAPI, name))
+    def method(self: ArizonaAPIPool, *args, **kwargs):
+        return self.iterate(name, *args, **kwargs)
+    method.__qualname__ = f'ArizonaAPIPool.{name}'
+    return method
+
+
+for _name in READ_METHODS:
+    setattr(ArizonaAPIPool, _name, _read_method(_name))
+for _name in ITER_METHODS:
+    setattr(ArizonaAPIPool, _name, _iter_method(_name))
@@ -0,0 +1,78 @@
+import random
+import datetime
+from email.utils import parsedate_to_datetime
+from typing import Iterable
+
+import aiohttp
+
+
+__all__ = ['RetryPolicy']
+
+
+class RetryPolicy:
+    def __init__(self, attempts: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0, jitter: bool = True, retry_statuses: Iterable[int] = (429, 500, 502, 503, 504), retry_methods: Iterable[str] = ('GET', 'HEAD'), respect_retry_after: bool = True, max_retry_after: float = 60.0) -> None:
+        """
+        Args:
+            attempts (int): Общее количество попыток, включая первую. 1 - без повторов (необяз.)
+            backoff_base (float): Базовая задержка перед повтором в секундах, удваивается с каждой попыткой (необяз.)
+            backoff_max (float): Максимальная задержка перед повтором в секундах (необяз.)
+            jitter (bool): Случайно распределять задержку от 0 до расчетной, чтобы повторы не шли волной (необяз.)
+            retry_statuses (Iterable[int]): HTTP статусы, при которых запрос повторяется (необяз.)
+            retry_methods (Iterable[str]): HTTP методы, которые можно повторять. По умолчанию только идемпотентные (необяз.)
+            respect_retry_after (bool): Учитывать заголовок Retry-After от сервера (необяз.)
+            max_retry_after (float): Максимальное ожидание по Retry-After в секундах. Если сервер просит ждать дольше, запрос не повторяется
+                и вызывающий код получает ответ как есть (необяз.)
+        """
+        self.attempts = max(1, attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """Можно ли повторить запрос после попытки с номером attempt (с нуля)"""
+
+        return method.upper() in self.retry_methods and attempt + 1 < self.attempts
+
+    def should_retry_response(self, method: str, attempt: int, response: aiohttp.ClientResponse) -> bool:
+        """Повторять ли запрос после ответа. Не повторяется, если Retry-After больше max_retry_after"""
+
+        if response.status not in self.retry_statuses or not self.can_retry(method, attempt):
+            return False
+        retry_after = self._retry_after(response)
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def _retry_after(self, response: aiohttp.ClientResponse) -> 'float | None':
+        if not self.respect_retry_after:
+            return None
+        return _parse_retry_after(response.headers.get('Retry-After'))
+
+    def delay(self, attempt: int, response: aiohttp.ClientResponse = None) -> float:
+        """Задержка в секундах перед следующей попыткой"""
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        retry_after = self._retry_after(response) if response is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+
+def _parse_retry_after(value: str) -> 'float | None':
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
@@ -0,0 +1,102 @@
+"""Сравнение расшифровки проверки анти-бота: slowAES в dukpy (с разбором исходника и в готовом JSInterpreter) и встроенный AES-CBC
+
+Запускается из корня репозитория при установленном пакете (pip install -e .).
+
+    python benchmarks/antibot_benchmark.py --vectors 500 --repeat 50
+
+Перед замером результаты встроенной реализации сверяются с slowAES в dukpy: на случайных ключах 128/192/256 бит,
+на данных в один и несколько блоков (включая выравнивание и нулевые байты в конце) и на кодах из реальной проверки.
+"""
+
+import argparse
+import json
+import random
+import time
+
+import dukpy
+
+from arizona_forum_async.bypass_antibot import aes, script
+
+
+def random_vectors(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    plains = []
+    for _ in range(count):
+        plain = [rng.randrange(256) for _ in range(rng.randrange(0, 48))]
+        tail = rng.choice(['', 'zeros', 'small'])
+        if tail == 'zeros':
+            plain += [0] * rng.randrange(1, 20)
+        elif tail == 'small':
+            plain += [rng.randrange(17)] * rng.randrange(1, 20)
+        plains.append({
+            'plain': plain,
+            'key': [rng.randrange(256) for _ in range(rng.choice((16, 24, 32)))],
+            'iv': [rng.randrange(256) for _ in range(16)],
+            'raw': rng.random() < 0.5,
+        })
+
+    # Шифрует сам slowAES (режим CBC с выравниванием); часть векторов - сырые блоки без выравнивания.
+    # Счетчик цикла не i: slowAES пишет в глобальную i
+    return dukpy.evaljs(script.text + '''
+        var vectors = dukpy['vectors'];
+        for (var n = 0; n < vectors.length; n++) {
+            var v = vectors[n];
+            if (v.raw) {
+                var plain = v.plain.slice(0, Math.max(16, v.plain.length - v.plain.length % 16));
+                while (plain.length % 16) plain.push(0);
+                v.cipher = plain;
+            } else {
+                v.cipher = slowAES.encrypt(v.plain, 2, v.key, v.iv);
+            }
+        }
+        vectors
+    ''', vectors=plains)
+
+
+def check(vectors: list) -> None:
+    reference = dukpy.evaljs(script.text + '''
+        var vectors = dukpy['vectors'], result = [];
+        for (var n = 0; n < vectors.length; n++)
+            result.push(slowAES.decrypt(vectors[n].cipher, 2, vectors[n].key, vectors[n].iv));
+        result
+    ''', vectors=vectors)
+    for vector, expected in zip(vectors, reference):
+        if aes.decrypt_cbc(vector['cipher'], vector['key'], vector['iv']) != expected:
+            raise SystemExit(f"Результат отличается от slowAES: {json.dumps(vector)}")
+
+    a, b, c = (script.to_numbers(value) for value in script._0xfab6[7:10])
+    if script.to_hex([script.slow_aes([c, a, b]), script._0xfab6]) != script.to_hex([script.slow_aes_js([c, a, b]), script._0xfab6]):
+        raise SystemExit("Cookie анти-бота отличается от slowAES")
+
+
+def measure(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vectors', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    check(random_vectors(args.vectors, args.seed))
+    print(f"Сверка со slowAES: {args.vectors} векторов совпали, AES: {'cryptography' if aes.Cipher is not None else 'Python'}")
+
+    a, b, c = (script.to_numbers(value) for value in script._0xfab6[7:10])
+    run = " slowAES['decrypt'](dukpy['value'][0], 2, dukpy['value'][1], dukpy['value'][2])"
+    timings = {
+        'dukpy, разбор slowAES каждый раз': measure(lambda: dukpy.evaljs(script.text + run, value=[c, a, b]), args.repeat),
+        'dukpy, JSInterpreter': measure(lambda: script.slow_aes_js([c, a, b]), args.repeat),
+        'встроенный AES': measure(lambda: script.slow_aes([c, a, b]), args.repeat * 100),
+    }
+    slowest = max(timings.values())
+    for name, timing in timings.items():
+        print(f"{name:<34} {timing:9.3f} ms {slowest / timing:8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
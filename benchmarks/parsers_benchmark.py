@@ -0,0 +1,147 @@
+"""Сравнение бэкендов разбора страниц на сохраненных страницах форума
+
+Запускается из корня репозитория при установленном пакете (pip install -e .[selectolax]).
+
+Запись страниц (нужна авторизованная сессия):
+    python benchmarks/parsers_benchmark.py record pages/ --user-agent "..." --cookie '{"xf_user": "..."}' --thread 123 --category 1865 --forums 1 --member 583439
+
+Замер:
+    python benchmarks/parsers_benchmark.py run pages/ --repeat 20
+
+Перед замером результаты всех бэкендов (включая быстрый путь на регулярных выражениях) сверяются с BeautifulSoup.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from html import unescape
+from pathlib import Path
+
+import arizona_forum_async as arz
+from arizona_forum_async.consts import MAIN_URL
+from arizona_forum_async.parsers import PARSER_BACKENDS, get_parser
+
+
+# Тип страницы (префикс имени файла) -> функции разбора и их аргументы из сохраненной страницы
+PAGE_PARSERS = {
+    'thread': [
+        ('parse_thread_messages', lambda page: (page['content'],)),
+        ('parse_thread_post_ids', lambda page: (page['content'],)),
+        ('parse_post_activity', lambda page: (page['content'],)),
+        ('parse_thread_page', lambda page: (page['content'], page['h1'])),
+    ],
+    'category': [
+        ('parse_category_threads', lambda page: (page['content'],)),
+        ('parse_category_thread_ids', lambda page: (page['content'],)),
+        ('parse_subforum_ids', lambda page: (page['content'],)),
+    ],
+    'forums': [
+        ('parse_forum_ids', lambda page: (page['content'],)),
+    ],
+    'member': [
+        ('parse_member', lambda page: (page['content'], page['user_id'])),
+        ('parse_profile_post_ids', lambda page: (page['content'],)),
+    ],
+    'alerts': [
+        ('parse_notifications', lambda page: (page['content'],)),
+    ],
+    'account': [
+        ('parse_account_page', lambda page: (page['content'],)),
+    ],
+}
+
+
+def load_pages(directory: Path) -> dict:
+    pages = {kind: [] for kind in PAGE_PARSERS}
+    for path in sorted(directory.glob('*.json')):
+        kind = path.name.split('_', 1)[0]
+        if kind in pages:
+            pages[kind].append(json.loads(path.read_text(encoding='utf-8')))
+    return pages
+
+
+async def record(args) -> None:
+    directory = Path(args.directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    api = arz.ArizonaAPI(args.user_agent, json.loads(args.cookie))
+    await api.connect()
+    token = await api.token
+    params = {'_xfResponseType': 'json', '_xfToken': token}
+
+    async def save_json(name: str, url: str, **extra) -> None:
+        data = await (await api._request('GET', url, params=params)).json()
+        page = {'content': unescape(data['html']['content']), 'h1': unescape(data['html'].get('h1', '')), **extra}
+        (directory / f'{name}.json').write_text(json.dumps(page, ensure_ascii=False), encoding='utf-8')
+
+    try:
+        for thread_id in args.thread:
+            await save_json(f'thread_{thread_id}', f"{MAIN_URL}/threads/{thread_id}/page-1")
+        for category_id in args.category:
+            await save_json(f'category_{category_id}', f"{MAIN_URL}/forums/{category_id}/page-1")
+        for forums_id in args.forums:
+            await save_json(f'forums_{forums_id}', f"{MAIN_URL}/categories/{forums_id}")
+        for member_id in args.member:
+            await save_json(f'member_{member_id}', f"{MAIN_URL}/members/{member_id}", user_id=member_id)
+        alerts = await (await api._request('GET', f"{MAIN_URL}/account/alerts")).text()
+        (directory / 'alerts_1.json').write_text(json.dumps({'content': alerts}, ensure_ascii=False), encoding='utf-8')
+        account = await (await api._request('GET', f"{MAIN_URL}/account/")).text()
+        (directory / 'account_1.json').write_text(json.dumps({'content': account}, ensure_ascii=False), encoding='utf-8')
+    finally:
+        await api.close()
+
+
+def run(args) -> None:
+    pages = load_pages(Path(args.directory))
+    print(f"{'функция':<26} {'страниц':>7} " + ' '.join(f'{backend:>16}' for backend in PARSER_BACKENDS))
+
+    for kind, parsers in PAGE_PARSERS.items():
+        if not pages[kind]:
+            continue
+        for name, arguments in parsers:
+            calls = [arguments(page) for page in pages[kind]]
+            reference = [get_parser(name, 'bs4')(*call) for call in calls]
+
+            timings = {}
+            for backend in PARSER_BACKENDS:
+                parser = get_parser(name, backend)
+                if [parser(*call) for call in calls] != reference:
+                    raise SystemExit(f"{name}: результат бэкенда {backend} отличается от BeautifulSoup")
+
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    for call in calls:
+                        parser(*call)
+                timings[backend] = (time.perf_counter() - started) / (args.repeat * len(calls)) * 1000
+
+            cells = ' '.join(f"{timings[backend]:7.2f} ms {timings['bs4'] / timings[backend]:4.1f}x" for backend in PARSER_BACKENDS)
+            print(f'{name:<26} {len(calls):>7} {cells}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='Сохранить страницы форума')
+    record_parser.add_argument('directory')
+    record_parser.add_argument('--user-agent', required=True)
+    record_parser.add_argument('--cookie', required=True, help='Cookie в виде JSON')
+    record_parser.add_argument('--thread', type=int, nargs='*', default=[])
+    record_parser.add_argument('--category', type=int, nargs='*', default=[])
+    record_parser.add_argument('--forums', type=int, nargs='*', default=[], help='ID категорий (/categories/{id})')
+    record_parser.add_argument('--member', type=int, nargs='*', default=[])
+
+    run_parser = commands.add_parser('run', help='Замерить скорость разбора')
+    run_parser.add_argument('directory')
+    run_parser.add_argument('--repeat', type=int, default=20)
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        asyncio.run(record(args))
+    else:
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -26,4 +26,8 @@ setup(
         "dukpy",
         "lxml",
     ],
+    extras_require={
+        "selectolax": ["selectolax"],
+        "cryptography": ["cryptography"],
+    },
 )
\ No newline at end of file
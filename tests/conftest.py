@@ -0,0 +1,84 @@
+"""Локальный сервер, отвечающий как форум, для проверки ArizonaAPI без сети"""
+
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import arizona_forum_async.api as api_module
+from arizona_forum_async import ArizonaAPI
+from arizona_forum_async.bypass_antibot import script
+
+
+PAGE = '<html data-logged-in="true" data-csrf="{token}"><body><span class="avatar--xxs" data-user-id="1"></span></body></html>'
+MEMBER = '<span class="username">U{user_id}</span><span class="userTitle">Игрок</span>'
+SECURITY_ERROR = {'status': 'error', 'errors': ['Security error occurred. Please press back, refresh the page, and try again.']}
+
+
+class FakeForum:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.monkeypatch = monkeypatch
+        self.token = 'token-1'
+        """**Действующий CSRF токен. Форум отдает его на полных страницах и принимает в POST**"""
+        self.delay = 0.01
+        """**Задержка ответа в секундах**"""
+        self.challenge: Optional[tuple] = None
+        """**Коды проверки анти-бота (a, b, c). Пока заданы, запросы без решенного cookie получают проверку**"""
+        self.challenges = 0
+        """**Сколько раз отдана проверка**"""
+        self.requests: List[Dict] = []
+        """**Дошедшие до форума запросы: метод, путь, query, форма**"""
+        self.routes: Dict[str, Callable] = {}
+        """**Свои обработчики по началу пути**"""
+        self.server: TestServer = None
+
+    async def __aenter__(self) -> 'FakeForum':
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', self._handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.monkeypatch.setattr(api_module, 'MAIN_URL', str(self.server.make_url('')).rstrip('/'))
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.server.close()
+
+    def api(self, **kwargs) -> ArizonaAPI:
+        return ArizonaAPI('ua', {'xf_user': '1'}, **kwargs)
+
+    def challenge_body(self) -> str:
+        return '<html><script>var _0x=["\\x70",' + script.CHALLENGE_START[1:] + '"{}","{}","{}"'.format(*self.challenge) + script.CHALLENGE_END + '"\\x52"];</script></html>'
+
+    def solved_cookie(self) -> str:
+        return script.solve_challenge(self.challenge_body()).split('=', 1)[1]
+
+    def hits(self, path: str, method: str = None) -> List[Dict]:
+        return [request for request in self.requests if request['path'].startswith(path) and method in (None, request['method'])]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.delay)
+        if self.challenge is not None and request.cookies.get(script.ANTIBOT_COOKIE) != self.solved_cookie():
+            self.challenges += 1
+            return web.Response(text=self.challenge_body(), content_type='text/html')
+
+        form = dict(await request.post()) if request.method == 'POST' else {}
+        self.requests.append({'method': request.method, 'path': request.path, 'query': dict(request.query), 'form': form})
+        for prefix, handler in self.routes.items():
+            if request.path.startswith(prefix):
+                return await handler(request)
+
+        if request.method == 'POST':
+            if form.get('_xfToken') != self.token:
+                return web.json_response(SECURITY_ERROR, status=400)
+            return web.json_response({'status': 'ok'})
+        if request.path.startswith('/members/'):
+            user_id = int(request.path.split('/')[2])
+            return web.json_response({'status': 'ok', 'html': {'content': MEMBER.format(user_id=user_id), 'title': f'U{user_id}'}})
+        return web.Response(text=PAGE.format(token=self.token), content_type='text/html')
+
+
+@pytest.fixture
+def forum(monkeypatch) -> FakeForum:
+    return FakeForum(monkeypatch)
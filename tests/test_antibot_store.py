@@ -0,0 +1,117 @@
+"""AntibotStore: один решатель на пару (User Agent, прокси) в процессе и между процессами, общими через файл SQLite"""
+
+import asyncio
+import time
+
+from arizona_forum_async.antibot import AntibotStore
+
+
+def _solver(cookie: str, delay: float = 0.0):
+    calls = []
+
+    async def solve() -> str:
+        calls.append(cookie)
+        await asyncio.sleep(delay)
+        return cookie
+
+    return solve, calls
+
+
+def test_memory_store_solves_once():
+    async def main():
+        store = AntibotStore()
+        solve, calls = _solver('R=1', 0.05)
+        results = await asyncio.gather(*(store.refresh('ua', '', None, solve) for _ in range(10)))
+        assert results == ['R=1'] * 10
+        assert calls == ['R=1']
+        assert await store.get('ua') == 'R=1'
+        assert await store.get('ua', 'socks5://proxy:1') is None
+
+        # Отклоненный cookie решается заново
+        solve, calls = _solver('R=2')
+        assert await store.refresh('ua', '', 'R=1', solve) == 'R=2'
+        assert calls == ['R=2']
+        await store.invalidate('ua')
+        assert await store.get('ua') is None
+
+    asyncio.run(main())
+
+
+def test_file_store_survives_reopen(tmp_path):
+    async def main():
+        path = str(tmp_path / 'antibot.sqlite3')
+        store = AntibotStore(path)
+        await store.set('ua', '', 'R=1')
+        await store.close()
+
+        store = AntibotStore(path)
+        assert await store.get('ua') == 'R=1'
+        await store.invalidate()
+        assert await store.get('ua') is None
+        await store.close()
+
+        store = AntibotStore(path, ttl=0)
+        await store.set('ua', '', 'R=1')
+        await asyncio.sleep(0.01)
+        assert await store.get('ua') is None
+        await store.close()
+
+    asyncio.run(main())
+
+
+def test_stores_sharing_file_solve_once(tmp_path):
+    # Два хранилища на одном файле - то же, что два процесса: у каждого свое соединение и свой поток
+    async def main():
+        path = str(tmp_path / 'antibot.sqlite3')
+        first, second = AntibotStore(path), AntibotStore(path)
+        await first.set('ua', '', 'R=old')
+
+        ticks = 0
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        ticking = asyncio.ensure_future(ticker())
+
+        solve_first, calls_first = _solver('R=new', 0.3)
+        solve_second, calls_second = _solver('R=other')
+        started = time.monotonic()
+        first_task = asyncio.ensure_future(first.refresh('ua', '', 'R=old', solve_first))
+        await asyncio.sleep(0.05)
+        results = await asyncio.gather(first_task, second.refresh('ua', '', 'R=old', solve_second))
+        elapsed = time.monotonic() - started
+        ticking.cancel()
+
+        assert results == ['R=new', 'R=new']
+        assert calls_first == ['R=new'] and calls_second == []
+        assert first.stats['solves'] + second.stats['solves'] == 1
+        # Пока второе хранилище ждало блокировку файла, event loop работал
+        assert ticks >= elapsed / 0.01 * 0.5
+
+        await first.close()
+        await second.close()
+
+    asyncio.run(main())
+
+
+def test_failed_solve_releases_file(tmp_path):
+    async def main():
+        store = AntibotStore(str(tmp_path / 'antibot.sqlite3'))
+
+        async def fail() -> str:
+            raise RuntimeError("не решилось")
+
+        try:
+            await store.refresh('ua', '', None, fail)
+        except RuntimeError:
+            pass
+        solve, calls = _solver('R=1')
+        assert await store.refresh('ua', '', None, solve) == 'R=1'
+        await store.set('ua', 'proxy', 'R=2')
+        other = AntibotStore(store.path)
+        assert await other.get('ua', 'proxy') == 'R=2'
+        await other.close()
+        await store.close()
+
+    asyncio.run(main())
@@ -0,0 +1,200 @@
+"""ArizonaAPI против локального сервера из conftest.py: планировщик запросов, повторы, анти-бот и CSRF токен"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+import arizona_forum_async.api as api_module
+from arizona_forum_async import RetryPolicy
+from arizona_forum_async.bypass_antibot import script
+from arizona_forum_async.models.member_object import Member
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.parametrize('concurrency', [0, -1, 1, 3])
+def test_get_members_with_any_concurrency(forum, concurrency):
+    async def main():
+        async with forum:
+            api = forum.api()
+            await api.connect()
+            members = await api.get_members([7, 8, 7, 9], concurrency=concurrency)
+            await api.close()
+        assert list(members) == [7, 8, 9]
+        assert all(isinstance(member, Member) and member.username == f'U{user_id}' for user_id, member in members.items())
+        assert len(forum.hits('/members/')) == 3
+
+    run(main())
+
+
+def test_category_statistics_cancels_prefetch_on_error(forum, monkeypatch):
+    async def main():
+        async with forum:
+            api = forum.api()
+            await api.connect()
+            loads = {}
+
+            async def get_category(category_id):
+                return type('Category', (), {'pages_count': 20, 'title': 'Раздел'})()
+
+            async def get_thread_category_detail(category_id, page):
+                loads[page] = asyncio.current_task()
+                if page == 1:
+                    return ['не словарь']
+                await asyncio.sleep(10)
+                return []
+
+            monkeypatch.setattr(api, 'get_category', get_category)
+            monkeypatch.setattr(api, 'get_thread_category_detail', get_thread_category_detail)
+            with pytest.raises(AttributeError):
+                await api.get_category_statistics_threads(5, concurrency=4)
+            await asyncio.sleep(0)
+            await api.close()
+        assert len(loads) == 4
+        assert all(task.done() for task in loads.values())
+
+    run(main())
+
+
+def test_antibot_challenge_mid_session_solved_once(forum, monkeypatch):
+    solves = []
+
+    async def solve_challenge_async(body, engine='native', executor=None):
+        solves.append(body)
+        await asyncio.sleep(0.05)
+        return script.solve_challenge(body, engine)
+
+    monkeypatch.setattr(api_module, 'solve_challenge_async', solve_challenge_async)
+
+    async def main():
+        async with forum:
+            api = forum.api()
+            await api.connect()
+            forum.challenge = tuple(script._0xfab6[7:10])
+            members = await asyncio.gather(*(api.get_member(user_id) for user_id in range(1, 21)))
+            assert len(solves) == 1
+            assert [member.username for member in members] == [f'U{user_id}' for user_id in range(1, 21)]
+            assert forum.challenges == 20
+            assert len(forum.hits('/members/')) == 20
+
+            # Проверка с другими кодами: старый cookie отклонен, решается заново
+            forum.challenge = ('000102030405060708090a0b0c0d0e0f', '0f0e0d0c0b0a09080706050403020100', '69c4e0d86a7b0430d8cdb78070b4c55a')
+            members = await asyncio.gather(*(api.get_member(user_id) for user_id in range(21, 31)))
+            assert len(solves) == 2
+            assert all(member.username for member in members)
+            await api.close()
+
+    run(main())
+
+
+def test_stale_token_refreshed_once_and_replayed(forum):
+    async def main():
+        async with forum:
+            api = forum.api()
+            await api.connect()
+            assert await api.token == 'token-1'
+
+            forum.token = 'token-2'
+            responses = await asyncio.gather(*(api.react_post(post_id) for post_id in range(1, 11)))
+            assert [response.status for response in responses] == [200] * 10
+            assert len(forum.hits('/help/terms/')) == 1
+            posts = forum.hits('/posts/', 'POST')
+            assert len(posts) == 20
+            assert sorted(request['form']['_xfToken'] for request in posts) == ['token-1'] * 10 + ['token-2'] * 10
+            assert await api.token == 'token-2'
+            await api.close()
+
+    run(main())
+
+
+def test_token_harvested_from_responses(forum):
+    async def main():
+        async with forum:
+            api = forum.api()
+            await api.connect()
+            forum.token = 'token-2'
+            # Полная страница форума несет новый токен, следующий POST уходит уже с ним
+            await api.get_forum_statistic()
+            response = await api.react_post(1)
+            assert response.status == 200
+            assert [request['form']['_xfToken'] for request in forum.hits('/posts/', 'POST')] == ['token-2']
+            assert forum.hits('/help/terms/') == []
+            await api.close()
+
+    run(main())
+
+
+def test_avatar_upload_replayed_with_new_token(forum, tmp_path):
+    async def main():
+        image = tmp_path / 'avatar.png'
+        image.write_bytes(b'\x89PNG')
+        async with forum:
+            api = forum.api()
+            await api.connect()
+            forum.token = 'token-2'
+            assert (await api.edit_avatar(str(image))).status == 200
+            assert (await api.delete_avatar()).status == 200
+            uploads = forum.hits('/account/avatar', 'POST')
+            assert [request['form']['_xfToken'] for request in uploads] == ['token-1', 'token-2', 'token-2']
+            assert uploads[1]['form']['upload'].filename == 'avatar.png'
+            assert uploads[2]['form']['delete_avatar'] == '1'
+            await api.close()
+
+    run(main())
+
+
+def test_get_retried_post_not(forum):
+    async def main():
+        failures = {'left': 2}
+
+        async def unavailable(request):
+            if failures['left']:
+                failures['left'] -= 1
+                return web.Response(status=503, headers={'Retry-After': '0'})
+            return web.json_response({'status': 'ok', 'html': {'content': '', 'title': 'U5'}})
+
+        async with forum:
+            api = forum.api(retry=RetryPolicy(attempts=3, backoff_base=0.01))
+            await api.connect()
+            forum.routes['/members/'] = unavailable
+            assert (await api.get_member(5)).username == 'U5'
+            assert len(forum.hits('/members/')) == 3
+
+            forum.routes['/posts/'] = unavailable
+            failures['left'] = 1
+            assert (await api.react_post(1)).status == 503
+            assert len(forum.hits('/posts/', 'POST')) == 1
+            await api.close()
+
+    run(main())
+
+
+def test_identical_gets_share_request_and_survive_cancel(forum):
+    async def main():
+        async with forum:
+            api = forum.api()
+            await api.connect()
+            forum.delay = 0.1
+            members = await asyncio.gather(*(api.get_member(7) for _ in range(10)))
+            assert len(forum.hits('/members/')) == 1
+            assert {member.username for member in members} == {'U7'}
+            assert api._inflight == {}
+
+            # Отмена одного из ждущих не отменяет общий запрос для остальных
+            waiting = [asyncio.ensure_future(api.get_member(8)) for _ in range(3)]
+            await asyncio.sleep(0.03)
+            waiting[0].cancel()
+            results = await asyncio.gather(*waiting, return_exceptions=True)
+            assert isinstance(results[0], asyncio.CancelledError)
+            assert [member.username for member in results[1:]] == ['U8', 'U8']
+            assert len(forum.hits('/members/8')) == 1
+
+            # После ответа запрос снова уходит на форум
+            await api.get_member(7)
+            assert len(forum.hits('/members/7')) == 2
+            await api.close()
+
+    run(main())
@@ -0,0 +1,174 @@
+"""MemoryCache и SQLiteCache: время жизни, сохранение пачками и по таймеру, порядок записи и удаления, размер"""
+
+import asyncio
+import time
+
+import pytest
+
+import arizona_forum_async.cache as cache_module
+from arizona_forum_async.cache import MemoryCache, SQLiteCache
+from arizona_forum_async.models.member_object import Member
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def member(user_id: int, username: str = None) -> Member:
+    return Member(None, user_id, username or f'U{user_id}', 'Игрок', None, ['Mod'], None, 1, 2, 3, '#fff')
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module, 'time', clock)
+    return clock
+
+
+def test_memory_cache_ttl_and_lru(clock):
+    async def main():
+        cache = MemoryCache(ttl={'member': 10, 'thread': 0}, maxsize=2)
+        await cache.set('member', 1, member(1))
+        await cache.set('member', 2, member(2))
+        assert (await cache.get('member', 1)).username == 'U1'
+        await cache.set('member', 3, member(3))
+        # Вытеснен давно не использованный 2
+        assert await cache.get('member', 2) is None
+        clock.now += 11
+        assert await cache.get('member', 1) is None
+        await cache.set('thread', 1, member(1))
+        assert cache.stats == {'size': 1, 'hits': 1, 'misses': 2}
+
+    run(main())
+
+
+def test_sqlite_ttl_across_reopen(tmp_path, clock):
+    async def main():
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = SQLiteCache(path, ttl={'member': 60})
+        await cache.set('member', 1, member(1, 'Ник'))
+        await cache.close()
+
+        cache = SQLiteCache(path, ttl={'member': 60})
+        restored = await cache.get('member', 1, api='api')
+        assert isinstance(restored, Member) and restored.username == 'Ник' and restored.roles == ['Mod'] and restored.API == 'api'
+        assert cache.stats['size'] == 1
+        clock.now += 61
+        assert await cache.get('member', 1) is None
+        await cache.close()
+
+        # Свежесть считается от времени загрузки с форума, а не от открытия файла
+        cache = SQLiteCache(path, ttl={'member': 120})
+        assert (await cache.get('member', 1)).username == 'Ник'
+        await cache.close()
+
+    run(main())
+
+
+def test_sqlite_flushes_by_batch_size(tmp_path):
+    async def main():
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = SQLiteCache(path, batch_size=3, flush_interval=100)
+        reader = SQLiteCache(path)
+        for user_id in (1, 2):
+            await cache.set('member', user_id, member(user_id))
+        assert cache.stats['pending'] == 2 and cache.stats['size'] == 0
+        assert await reader.get('member', 1) is None
+
+        await cache.set('member', 3, member(3))
+        assert cache.stats['pending'] == 0 and cache.stats['size'] == 3
+        assert (await reader.get('member', 3)).username == 'U3'
+        await cache.close()
+        await reader.close()
+
+    run(main())
+
+
+def test_sqlite_flushes_by_interval(tmp_path):
+    async def main():
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = SQLiteCache(path, batch_size=100, flush_interval=0.05)
+        reader = SQLiteCache(path)
+        await cache.set('member', 1, member(1))
+        assert (await cache.get('member', 1)).username == 'U1'
+        assert await reader.get('member', 1) is None
+        await asyncio.sleep(0.15)
+        assert cache.stats['pending'] == 0 and cache._timer is None
+        assert (await reader.get('member', 1)).username == 'U1'
+        await cache.close()
+        await reader.close()
+
+    run(main())
+
+
+def test_sqlite_invalidate_after_write(tmp_path):
+    async def main():
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = SQLiteCache(path, batch_size=100)
+
+        # Запись еще в очереди
+        await cache.set('member', 1, member(1))
+        await cache.invalidate('member', 1)
+        assert await cache.get('member', 1) is None
+
+        # Сохранение идет, а удаление поставлено сразу за ним: файл обрабатывает их по порядку
+        await cache.set('member', 2, member(2))
+        flushing = asyncio.ensure_future(cache.flush())
+        await asyncio.sleep(0)
+        await cache.invalidate('member', 2)
+        await flushing
+        assert await cache.get('member', 2) is None
+
+        # Новое значение после удаления не теряется
+        await cache.set('member', 2, member(2, 'Новый'))
+        await cache.flush()
+        await cache.set('thread', 5, member(5))
+        await cache.invalidate('thread')
+        await cache.close()
+
+        cache = SQLiteCache(path)
+        assert (await cache.get('member', 2)).username == 'Новый'
+        assert await cache.get('thread', 5) is None
+        assert cache.stats['size'] == 1
+        await cache.close()
+
+    run(main())
+
+
+def test_sqlite_size_tracks_changes(tmp_path):
+    async def main():
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = SQLiteCache(path, batch_size=100)
+        for user_id in range(5):
+            await cache.set('member', user_id, member(user_id))
+        await cache.set('category', 1, member(1))
+        await cache.flush()
+        assert cache.stats['size'] == 6
+
+        # Перезапись не меняет размер
+        for user_id in range(3):
+            await cache.set('member', user_id, member(user_id, 'Другой'))
+        await cache.flush()
+        assert cache.stats['size'] == 6
+
+        await cache.invalidate('member', 0)
+        await cache.invalidate('member', 100)
+        assert cache.stats['size'] == 5
+        await cache.invalidate('member')
+        assert cache.stats['size'] == 1
+        await cache.invalidate()
+        assert cache.stats['size'] == 0
+        await cache.close()
+
+    run(main())
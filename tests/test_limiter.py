@@ -0,0 +1,143 @@
+"""RateLimiter на поддельных часах: ограничения выключены по умолчанию, бюджеты по (хост, прокси, запись), места в полете"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import arizona_forum_async.limiter as limiter_module
+from arizona_forum_async.limiter import RateLimiter
+
+
+class FakeClock:
+    """time.monotonic и asyncio.sleep для limiter: сон сдвигает часы вместо ожидания"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(limiter_module, 'time', SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(limiter_module, 'asyncio', SimpleNamespace(Lock=asyncio.Lock, Semaphore=asyncio.Semaphore, sleep=clock.sleep))
+    return clock
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def take(limiter: RateLimiter, clock: FakeClock, count: int, host: str = 'forum', write: bool = False, proxy: str = '') -> list:
+    """Время (от начала), когда каждый из count запросов получил место"""
+    started = clock.now
+    times = []
+    for _ in range(count):
+        async with limiter.slot(host, write, proxy):
+            times.append(round(clock.now - started, 6))
+    return times
+
+
+def test_defaults_do_not_limit(clock):
+    async def main():
+        limiter = RateLimiter()
+        active, peak = 0, 0
+
+        async def request():
+            nonlocal active, peak
+            async with limiter.slot('forum', write=bool(active % 2)):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.001)
+                active -= 1
+
+        await asyncio.gather(*(request() for _ in range(100)))
+        assert peak == 100
+        assert clock.now == 1000.0
+        assert limiter._buckets == {} and limiter._semaphore is None and limiter._write_semaphore is None
+
+    run(main())
+
+
+def test_read_rate_with_burst(clock):
+    async def main():
+        assert await take(RateLimiter(read_rate=2), clock, 6) == [0, 0, 0.5, 1.0, 1.5, 2.0]
+        assert await take(RateLimiter(read_rate=2, burst=4), clock, 6) == [0, 0, 0, 0, 0.5, 1.0]
+
+    run(main())
+
+
+def test_buckets_per_host_proxy_and_write(clock):
+    async def main():
+        limiter = RateLimiter(read_rate=1, write_rate=0.5)
+        assert await take(limiter, clock, 2) == [0, 1.0]
+        # Свой бюджет у другого хоста, другого прокси и у записи: ждать не нужно
+        assert await take(limiter, clock, 1, host='other') == [0]
+        assert await take(limiter, clock, 1, proxy='socks5://127.0.0.1:1080') == [0]
+        assert await take(limiter, clock, 2, write=True) == [0, 2.0]
+        assert await take(limiter, clock, 2, write=True, proxy='socks5://127.0.0.1:1080') == [0, 2.0]
+        assert set(limiter._buckets) == {
+            ('forum', '', False), ('other', '', False), ('forum', 'socks5://127.0.0.1:1080', False),
+            ('forum', '', True), ('forum', 'socks5://127.0.0.1:1080', True)
+        }
+
+        # Ограничена только скорость чтения - запись не ждет
+        limiter = RateLimiter(read_rate=1)
+        assert await take(limiter, clock, 3, write=True) == [0, 0, 0]
+
+    run(main())
+
+
+def test_in_flight_limits(clock):
+    async def main():
+        limiter = RateLimiter(max_in_flight=3, max_write_in_flight=1)
+        active = {'all': 0, 'write': 0}
+        peak = {'all': 0, 'write': 0}
+
+        async def request(write: bool):
+            async with limiter.slot('forum', write):
+                active['all'] += 1
+                active['write'] += write
+                peak['all'] = max(peak['all'], active['all'])
+                peak['write'] = max(peak['write'], active['write'])
+                await asyncio.sleep(0.002)
+                active['all'] -= 1
+                active['write'] -= write
+
+        await asyncio.gather(*(request(index % 2 == 0) for index in range(20)))
+        assert peak == {'all': 3, 'write': 1}
+        assert clock.now == 1000.0
+
+    run(main())
+
+
+def test_cancelled_request_releases_slot(clock):
+    async def main():
+        limiter = RateLimiter(max_in_flight=1, max_write_in_flight=1)
+        entered = asyncio.Event()
+
+        async def hold():
+            async with limiter.slot('forum', True):
+                entered.set()
+                await asyncio.sleep(10)
+
+        holder = asyncio.ensure_future(hold())
+        await entered.wait()
+        # Ждет места и будет отменен, не получив его
+        waiter = asyncio.ensure_future(take(limiter, clock, 1, write=True))
+        await asyncio.sleep(0)
+        holder.cancel()
+        waiter.cancel()
+        await asyncio.gather(holder, waiter, return_exceptions=True)
+
+        assert await asyncio.wait_for(take(limiter, clock, 2, write=True), 1) == [0, 0]
+        assert not limiter._semaphore.locked() and not limiter._write_semaphore.locked()
+
+    run(main())
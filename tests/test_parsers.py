@@ -0,0 +1,129 @@
+"""Сверка бэкендов разбора страниц с BeautifulSoup на сохраненных страницах из tests/fixtures
+
+Страницы в том же формате, что пишет benchmarks/parsers_benchmark.py record: <тип>_<ID>.json.
+Ники, ID и ссылки в них заменены на вымышленные.
+"""
+
+import json
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from arizona_forum_async.exceptions import ParseError
+from arizona_forum_async.parsers import PARSER_BACKENDS, get_parser, soup_backend
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+BACKENDS = ('regex_backend', 'lxml_backend', 'selectolax_backend')
+
+# Тип страницы (префикс имени файла) -> функции разбора и их аргументы из сохраненной страницы
+PAGE_PARSERS = {
+    'thread': [
+        ('parse_thread_messages', lambda page: (page['content'],)),
+        ('parse_thread_post_ids', lambda page: (page['content'],)),
+        ('parse_post_activity', lambda page: (page['content'],)),
+        ('parse_thread_page', lambda page: (page['content'], page['h1'])),
+        ('parse_thread_posts', lambda page: (page['content'], page['h1'])),
+        ('parse_first_post_id', lambda page: (page['content'],)),
+    ],
+    'category': [
+        ('parse_category_threads', lambda page: (page['content'],)),
+        ('parse_category_thread_ids', lambda page: (page['content'],)),
+        ('parse_subforum_ids', lambda page: (page['content'],)),
+        ('parse_category_pages_count', lambda page: (page['content'],)),
+    ],
+    'forums': [
+        ('parse_forum_ids', lambda page: (page['content'],)),
+    ],
+    'member': [
+        ('parse_member', lambda page: (page['content'], page['user_id'])),
+        ('parse_profile_post_ids', lambda page: (page['content'],)),
+    ],
+    'alerts': [
+        ('parse_notifications', lambda page: (page['content'],)),
+    ],
+    'account': [
+        ('parse_account_page', lambda page: (page['content'],)),
+    ],
+}
+
+# Разметка, в которой нет обязательного элемента: у темы нет ячейки с автором, у темы и раздела нет заголовка
+BROKEN_PAGES = [
+    ('parse_category_threads', '<div class="structItem structItem--thread"><div class="structItem-title"><a href="/threads/1/">Тема</a></div></div>'),
+    ('parse_category_thread_ids', '<div class="structItem structItem--thread"><a href="/threads/1/">Тема</a></div>'),
+    ('parse_forum_ids', '<div class="node node--id1 node--depth2 node--forum"><a href="/forums/1/">Раздел</a></div>'),
+]
+
+# Страницы без отметки авторизации в теге html: ошибка, заглушка, JSON вместо HTML
+# Тег html полной страницы темы: data-container-key указывает на раздел или нет
+THREAD_PAGES = [
+    '<html data-container-key="node-12" data-content-key="thread-5"><body></body></html>',
+    '<html data-content-key="thread-5" data-container-key="node-7"><body><article id="js-post-1"></article></body></html>',
+    '<html data-container-key="node-" data-content-key="thread-5"><body></body></html>',
+    '<html data-container-key="search" data-content-key="thread-5"><body></body></html>',
+    '<html><body><div data-container-key="node-3"></div></body></html>',
+    '',
+]
+
+UNMARKED_PAGES = ['', '<div>Ошибка</div>', '<html><body></body></html>', '{"status": "error", "errors": ["Вы должны авторизоваться."]}']
+
+
+def _backend(name: str):
+    try:
+        return import_module(f'arizona_forum_async.parsers.{name}')
+    except ImportError as e:
+        pytest.skip(f"Бэкенд {name} не установлен: {e}")
+
+
+def _pages():
+    for path in sorted(FIXTURES.glob('*.json')):
+        kind = path.name.split('_', 1)[0]
+        page = json.loads(path.read_text(encoding='utf-8'))
+        for name, arguments in PAGE_PARSERS[kind]:
+            yield pytest.param(name, arguments(page), id=f'{path.stem}-{name}')
+
+
+PAGES = list(_pages())
+
+
+def test_fixtures_cover_every_page_type():
+    kinds = {path.name.split('_', 1)[0] for path in FIXTURES.glob('*.json')}
+    assert kinds == set(PAGE_PARSERS)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('name, arguments', PAGES)
+def test_backend_matches_bs4(backend, name, arguments):
+    parser = getattr(_backend(backend), name, None)
+    if parser is None:
+        pytest.skip(f"{backend} не реализует {name}")
+    assert parser(*arguments) == getattr(soup_backend, name)(*arguments)
+
+
+@pytest.mark.parametrize('backend', PARSER_BACKENDS)
+@pytest.mark.parametrize('name, arguments', PAGES)
+def test_get_parser_matches_bs4(backend, name, arguments):
+    assert get_parser(name, backend)(*arguments) == getattr(soup_backend, name)(*arguments)
+
+
+@pytest.mark.parametrize('html', THREAD_PAGES)
+def test_thread_category_id_matches_bs4(html):
+    assert _backend('regex_backend').parse_thread_category_id(html) == soup_backend.parse_thread_category_id(html)
+
+
+@pytest.mark.parametrize('backend', ('regex_backend', 'soup_backend'))
+@pytest.mark.parametrize('html', UNMARKED_PAGES)
+def test_account_page_without_marker_is_logged_out(backend, html):
+    assert _backend(backend).parse_account_page(html) == {'logged_in': False, 'user_id': None}
+
+
+@pytest.mark.parametrize('backend', BACKENDS + ('soup_backend',))
+@pytest.mark.parametrize('name, content_html', BROKEN_PAGES)
+def test_missing_element_raises_parse_error(backend, name, content_html):
+    parser = getattr(_backend(backend), name, None)
+    if parser is None:
+        pytest.skip(f"{backend} не реализует {name}")
+    with pytest.raises(ParseError):
+        parser(content_html)
@@ -0,0 +1,80 @@
+"""RetryPolicy: задержки, Retry-After и какие запросы повторяются"""
+
+import datetime
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from arizona_forum_async.retry import RetryPolicy, _parse_retry_after
+
+
+def response(status: int, retry_after: str = None):
+    return SimpleNamespace(status=status, headers={'Retry-After': retry_after} if retry_after is not None else {})
+
+
+def http_date(seconds: float) -> str:
+    return format_datetime(datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=seconds), usegmt=True)
+
+
+def test_backoff_doubles_up_to_max():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+@pytest.mark.parametrize('attempt', range(6))
+def test_jitter_stays_within_backoff(attempt):
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+    limit = min(3.0, 0.5 * 2 ** attempt)
+    delays = [policy.delay(attempt) for _ in range(200)]
+    assert all(0 <= delay <= limit for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_parse_retry_after_seconds_and_date():
+    assert _parse_retry_after('7') == 7.0
+    assert _parse_retry_after(' 12 ') == 12.0
+    assert 28 <= _parse_retry_after(http_date(30)) <= 30
+    assert _parse_retry_after(http_date(-30)) == 0.0
+    assert _parse_retry_after('') is None
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after('скоро') is None
+
+
+def test_delay_waits_for_retry_after():
+    policy = RetryPolicy(backoff_base=0.5, jitter=False)
+    assert policy.delay(0, response(429, '10')) == 10.0
+    assert 18 <= policy.delay(0, response(503, http_date(20))) <= 20
+    # Retry-After короче расчетной задержки ее не уменьшает
+    assert policy.delay(3, response(429, '1')) == 4.0
+    assert RetryPolicy(backoff_base=0.5, jitter=False, respect_retry_after=False).delay(0, response(429, '10')) == 0.5
+
+
+def test_retry_after_capped_by_max_retry_after():
+    policy = RetryPolicy(max_retry_after=60.0, jitter=False)
+    assert policy.should_retry_response('GET', 0, response(429, '60'))
+    assert not policy.should_retry_response('GET', 0, response(429, '61'))
+    assert not policy.should_retry_response('GET', 0, response(503, http_date(3600)))
+    assert policy.delay(0, response(429, '3600')) == 60.0
+    # Без учета Retry-After ответ повторяется по обычной задержке
+    assert RetryPolicy(respect_retry_after=False).should_retry_response('GET', 0, response(429, '3600'))
+
+
+@pytest.mark.parametrize('method, retried', [('GET', True), ('get', True), ('HEAD', True), ('POST', False), ('PUT', False), ('DELETE', False)])
+def test_only_idempotent_methods_retried(method, retried):
+    policy = RetryPolicy()
+    assert policy.can_retry(method, 0) is retried
+    assert policy.should_retry_response(method, 0, response(503)) is retried
+
+
+@pytest.mark.parametrize('status, retried', [(429, True), (500, True), (502, True), (503, True), (504, True), (200, False), (403, False), (404, False)])
+def test_retry_statuses(status, retried):
+    assert RetryPolicy().should_retry_response('GET', 0, response(status)) is retried
+
+
+def test_attempts_limit():
+    policy = RetryPolicy(attempts=3)
+    assert [policy.can_retry('GET', attempt) for attempt in range(4)] == [True, True, False, False]
+    assert not RetryPolicy(attempts=1).can_retry('GET', 0)
+    assert not RetryPolicy(attempts=0).can_retry('GET', 0)
+    assert RetryPolicy(retry_methods=('POST',)).can_retry('post', 0)